@@ -5,7 +5,6 @@ Registers the custom User model and related models with Django Admin.
 """
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
-from django.utils.translation import gettext_lazy as _
 from .models import (
     User, Role, UserRole,
     BusinessGroup, Company, Department, Team
@@ -29,11 +28,11 @@ class UserAdmin(BaseUserAdmin):
     # Fieldsets for editing existing users
     fieldsets = (
         (None, {'fields': ('email', 'password')}),
-        (_('Personal info'), {'fields': ('name', 'alias', 'phone')}),
-        (_('Permissions'), {
+        ('Personal info', {'fields': ('name', 'alias', 'phone')}),
+        ('Permissions', {
             'fields': ('is_active', 'is_staff', 'is_superuser', 'groups', 'user_permissions'),
         }),
-        (_('Important dates'), {'fields': ('last_login', 'created_at', 'updated_at')}),
+        ('Important dates', {'fields': ('last_login', 'created_at', 'updated_at')}),
     )
     
     # Fieldsets for creating new users
@@ -66,6 +65,8 @@ class UserRoleAdmin(admin.ModelAdmin):
     list_filter = ('role', 'department', 'team')
     search_fields = ('user__name', 'user__email', 'role__name')
     raw_id_fields = ('user', 'department', 'team')
+    # Join FK columns (and the relations their __str__ reads) for the changelist
+    list_select_related = ('user', 'role', 'department__company', 'team__department')
 
 
 # =============================================================================
@@ -85,6 +86,7 @@ class CompanyAdmin(admin.ModelAdmin):
     list_display = ('name', 'business_group', 'created_at')
     list_filter = ('business_group',)
     search_fields = ('name',)
+    list_select_related = ('business_group',)
 
 
 @admin.register(Department)
@@ -93,6 +95,7 @@ class DepartmentAdmin(admin.ModelAdmin):
     list_display = ('name', 'company', 'created_at')
     list_filter = ('company',)
     search_fields = ('name',)
+    list_select_related = ('company',)
 
 
 @admin.register(Team)
@@ -102,3 +105,10 @@ class TeamAdmin(admin.ModelAdmin):
     list_filter = ('department',)
     search_fields = ('name',)
     raw_id_fields = ('manager',)
+    list_select_related = ('department__company', 'manager')
+
+    def formfield_for_foreignkey(self, db_field, request, **kwargs):
+        # Department choices render "<company> - <name>"; join company up front
+        if db_field.name == 'department':
+            kwargs['queryset'] = Department.objects.select_related('company')
+        return super().formfield_for_foreignkey(db_field, request, **kwargs)
@@ -6,13 +6,36 @@ Overrides SimpleJWT with:
 - Token type validation
 - Inactive user rejection
 - Audit logging integration
+- Cached user resolution (60s TTL, invalidated on User save; only the
+  USER_CACHE_FIELDS columns are cached, never the password hash)
 """
 from rest_framework_simplejwt.authentication import JWTAuthentication
 from rest_framework_simplejwt.exceptions import InvalidToken, AuthenticationFailed
+from django.core.cache import cache
 from django.utils.translation import gettext_lazy as _
 from .models import User
 
 
+USER_CACHE_TTL_SECONDS = 60
+
+# Columns loaded (and cached) for request.user: everything the /me
+# profile (UserProfileSerializer) and permission checks read, so a cache
+# miss stays a single query. The cache may be shared Redis, so credentials
+# (password hash) and privilege flags are never stored; any other field
+# is loaded lazily from the DB on first access.
+USER_CACHE_FIELDS = ('id', 'is_active', 'email', 'name', 'alias', 'phone', 'last_login')
+
+
+def _get_user_cache_key(user_id) -> str:
+    """Generate cache key for JWT user resolution."""
+    return f"auth:user:{user_id}"
+
+
+def invalidate_cached_user(user_id):
+    """Remove a cached user (called from User post_save/post_delete)."""
+    cache.delete(_get_user_cache_key(user_id))
+
+
 class CustomJWTAuthentication(JWTAuthentication):
     """
     Custom JWT authentication with Phase 5B security enhancements.
@@ -50,11 +73,15 @@ class CustomJWTAuthentication(JWTAuthentication):
         except KeyError:
             raise InvalidToken(_('Token contained no recognizable user identification'))
         
-        # Fetch user
-        try:
-            user = User.objects.get(id=user_id)
-        except User.DoesNotExist:
-            raise AuthenticationFailed(_('User not found'))
+        # Fetch user (cache-aside; active status rarely changes)
+        cache_key = _get_user_cache_key(user_id)
+        user = cache.get(cache_key)
+        if user is None:
+            try:
+                user = User.objects.only(*USER_CACHE_FIELDS).get(id=user_id)
+            except User.DoesNotExist:
+                raise AuthenticationFailed(_('User not found'))
+            cache.set(cache_key, user, USER_CACHE_TTL_SECONDS)
         
         # Check active status
         if not user.is_active:
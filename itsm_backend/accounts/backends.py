@@ -8,7 +8,7 @@ Provides multiple authentication backends:
 The order in settings.AUTHENTICATION_BACKENDS determines priority.
 """
 from django.contrib.auth.backends import ModelBackend
-from .models import User
+from .models import User, verify_dummy_password
 
 
 class DatabaseBackend(ModelBackend):
@@ -38,15 +38,20 @@ class DatabaseBackend(ModelBackend):
         if not email or not password:
             return None
         
-        try:
-            user = User.objects.get(email__iexact=email)
-        except User.DoesNotExist:
-            # Run the password hasher once to prevent timing attacks
-            User().set_password(password)
+        # Only the columns needed to verify credentials
+        user = (
+            User.objects
+            .filter(email__iexact=email)
+            .only('id', 'password', 'is_active')
+            .first()
+        )
+        if user is None:
+            # Verify against a fixed hash once to prevent timing attacks
+            verify_dummy_password(password)
             return None
         
-        # Check password using bcrypt
-        if user.check_password(password) and self.user_can_authenticate(user):
+        # Reject inactive users before paying for the bcrypt verification
+        if user.is_active and user.check_password(password):
             return user
         
         return None
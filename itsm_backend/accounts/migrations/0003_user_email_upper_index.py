@@ -0,0 +1,33 @@
+# Case-insensitive email lookup index
+# Makes User.objects.get(email__iexact=...) an index seek instead of a scan
+
+from django.db import migrations, models
+import django.db.models.functions.text
+
+
+class Migration(migrations.Migration):
+    """
+    Index UPPER(email) for case-insensitive login lookups.
+
+    email__iexact compiles to UPPER(email) = UPPER(%s) (or LIKE/ILIKE),
+    which cannot use IX_User_Email. A functional index on UPPER(email)
+    matches that predicate on backends with expression indexes; backends
+    without them (SQL Server) skip it and keep the existing behavior.
+
+    Before: Full scan on User for every login / backend authenticate
+    After: Index seek on IX_User_EmailUpper
+    """
+
+    dependencies = [
+        ('accounts', '0002_user_abstractbaseuser'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(
+                django.db.models.functions.text.Upper('email'),
+                name='IX_User_EmailUpper',
+            ),
+        ),
+    ]
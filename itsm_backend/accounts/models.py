@@ -8,8 +8,11 @@ These models represent:
 - UserRole: User role assignments with optional department/team scope
 """
 import uuid
+import functools
 import bcrypt
+from django.conf import settings
 from django.db import models
+from django.db.models.functions import Upper
 from django.contrib.auth.models import AbstractBaseUser, BaseUserManager, PermissionsMixin
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
@@ -248,7 +251,7 @@ class User(AbstractBaseUser, PermissionsMixin, TimestampedModel):
         """
         if raw_password:
             password_bytes = raw_password.encode('utf-8')
-            salt = bcrypt.gensalt(rounds=12)
+            salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
             self.password = bcrypt.hashpw(password_bytes, salt).decode('utf-8')
         else:
             self.set_unusable_password()
@@ -271,12 +274,27 @@ class User(AbstractBaseUser, PermissionsMixin, TimestampedModel):
             return bcrypt.checkpw(password_bytes, hash_bytes)
         except Exception:
             return False
+    
+    def password_needs_rehash(self):
+        """
+        Check whether the stored hash uses a different bcrypt cost.
+        
+        Returns:
+            True if the hash cost differs from settings.BCRYPT_ROUNDS
+        """
+        try:
+            # Format: $2b$<rounds>$<salt+hash>
+            return int(self.password.split('$')[2]) != settings.BCRYPT_ROUNDS
+        except (AttributeError, IndexError, ValueError):
+            return False
 
     class Meta:
         db_table = 'User'
         ordering = ['name']
         indexes = [
             models.Index(fields=['email'], name='IX_User_Email'),
+            # Case-insensitive login lookups (email__iexact)
+            models.Index(Upper('email'), name='IX_User_EmailUpper'),
             models.Index(fields=['alias'], name='IX_User_Alias'),
             models.Index(fields=['is_active'], name='IX_User_Active'),
         ]
@@ -285,6 +303,29 @@ class User(AbstractBaseUser, PermissionsMixin, TimestampedModel):
         return f"{self.name} ({self.alias})"
 
 
+@functools.lru_cache(maxsize=1)
+def _get_dummy_password_hash() -> bytes:
+    """BCrypt hash of a throwaway password, generated once per process."""
+    return bcrypt.hashpw(b'itsm-timing-equalizer', bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS))
+
+
+def verify_dummy_password(raw_password):
+    """
+    Run a bcrypt verification for a non-existent user.
+    
+    Equalizes response time between unknown-email and wrong-password
+    logins (prevents user enumeration) without generating a fresh salt
+    and hash on every failed lookup.
+    
+    Args:
+        raw_password: Plain text password from the login attempt
+    """
+    try:
+        bcrypt.checkpw((raw_password or '').encode('utf-8'), _get_dummy_password_hash())
+    except Exception:
+        pass
+
+
 class Role(models.Model):
     """
     Predefined system roles.
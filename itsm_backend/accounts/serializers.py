@@ -8,7 +8,7 @@ Serializers for authentication endpoints:
 """
 from rest_framework import serializers
 from drf_spectacular.utils import extend_schema_field
-from .models import User, Role, UserRole
+from .models import User, UserRole
 
 
 class LoginSerializer(serializers.Serializer):
@@ -127,60 +127,101 @@ class UserProfileSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = fields
     
+    # Role and org hierarchy columns read from each UserRole row.
+    # Department may be set directly or inherited through the team.
+    USER_ROLE_VALUES = (
+        'role__id', 'role__name',
+        'team__id', 'team__name',
+        'department__id', 'department__name',
+        'department__company__id', 'department__company__name',
+        'department__company__business_group__id',
+        'department__company__business_group__name',
+        'team__department__id', 'team__department__name',
+        'team__department__company__id', 'team__department__company__name',
+        'team__department__company__business_group__id',
+        'team__department__company__business_group__name',
+    )
+    
+    # Max users per batched UserRole query (SQL Server caps parameters at 2100)
+    USER_ROLE_BATCH_SIZE = 500
+    
+    def _load_user_roles(self, obj):
+        """
+        Load the user's role assignments once per serializer context.
+
+        All five method fields derive from the same UserRole rows, so the
+        org hierarchy is fetched as plain dicts and memoized on self.context
+        keyed by user id. When serializing a list (many=True), the rows for
+        every user in the list are primed on the first miss, in batches.
+        """
+        cache = self.context.setdefault('_user_roles_cache', {})
+        if obj.id not in cache:
+            users = [obj]
+            if isinstance(self.parent, serializers.ListSerializer) and self.parent.instance is not None:
+                users = self.parent.instance
+            user_ids = list(dict.fromkeys(
+                [obj.id] + [user.id for user in users if user.id not in cache]
+            ))
+            for user_id in user_ids:
+                cache[user_id] = []
+            for i in range(0, len(user_ids), self.USER_ROLE_BATCH_SIZE):
+                rows = (
+                    UserRole.objects
+                    .filter(user_id__in=user_ids[i:i + self.USER_ROLE_BATCH_SIZE])
+                    .order_by('pk')
+                    .values('user_id', *self.USER_ROLE_VALUES)
+                )
+                for row in rows:
+                    cache[row['user_id']].append(row)
+        return cache[obj.id]
+    
+    # values() prefixes of the first UserRole's department, in lookup order:
+    # direct assignment first, then inherited through the team
+    DEPARTMENT_PREFIXES = ('department__', 'team__department__')
+    
+    def _get_org_ref(self, obj, suffix):
+        """
+        Build an {id, name} ref for the primary department or its ancestors.
+
+        Each level falls back to the team path independently, so an org
+        level missing on the direct department is still taken from the
+        team's department.
+        """
+        user_roles = self._load_user_roles(obj)
+        if not user_roles:
+            return None
+        row = user_roles[0]
+        for prefix in self.DEPARTMENT_PREFIXES:
+            ref_id = row[f'{prefix}{suffix}id']
+            if ref_id is not None:
+                return {'id': str(ref_id), 'name': row[f'{prefix}{suffix}name']}
+        return None
+    
     @extend_schema_field({'type': 'array', 'items': {'type': 'string'}})
     def get_roles(self, obj):
         """Get list of role names for the user"""
-        role_ids = UserRole.objects.filter(user=obj).values_list('role_id', flat=True).distinct()
-        roles = Role.objects.filter(id__in=role_ids).values_list('name', flat=True)
-        return list(roles)
+        roles = {row['role__id']: row['role__name'] for row in self._load_user_roles(obj)}
+        return [roles[role_id] for role_id in sorted(roles)]
     
     @extend_schema_field({'type': 'object', 'properties': {'id': {'type': 'string'}, 'name': {'type': 'string'}}, 'nullable': True})
     def get_team(self, obj):
         """Get user's primary team from UserRole"""
-        user_role = UserRole.objects.filter(user=obj, team__isnull=False).select_related('team').first()
-        if user_role and user_role.team:
-            return {'id': str(user_role.team.id), 'name': user_role.team.name}
+        for row in self._load_user_roles(obj):
+            if row['team__id']:
+                return {'id': str(row['team__id']), 'name': row['team__name']}
         return None
     
     @extend_schema_field({'type': 'object', 'properties': {'id': {'type': 'string'}, 'name': {'type': 'string'}}, 'nullable': True})
     def get_department(self, obj):
         """Get user's department from UserRole or Team"""
-        user_role = UserRole.objects.filter(user=obj).select_related('department', 'team__department').first()
-        if user_role:
-            if user_role.department:
-                return {'id': str(user_role.department.id), 'name': user_role.department.name}
-            elif user_role.team and user_role.team.department:
-                return {'id': str(user_role.team.department.id), 'name': user_role.team.department.name}
-        return None
+        return self._get_org_ref(obj, '')
     
     @extend_schema_field({'type': 'object', 'properties': {'id': {'type': 'string'}, 'name': {'type': 'string'}}, 'nullable': True})
     def get_company(self, obj):
         """Get user's company from Department"""
-        user_role = UserRole.objects.filter(user=obj).select_related(
-            'department__company', 
-            'team__department__company'
-        ).first()
-        if user_role:
-            if user_role.department and user_role.department.company:
-                return {'id': str(user_role.department.company.id), 'name': user_role.department.company.name}
-            elif user_role.team and user_role.team.department and user_role.team.department.company:
-                return {'id': str(user_role.team.department.company.id), 'name': user_role.team.department.company.name}
-        return None
+        return self._get_org_ref(obj, 'company__')
     
     @extend_schema_field({'type': 'object', 'properties': {'id': {'type': 'string'}, 'name': {'type': 'string'}}, 'nullable': True})
     def get_business_group(self, obj):
         """Get user's business group from Company"""
-        user_role = UserRole.objects.filter(user=obj).select_related(
-            'department__company__business_group',
-            'team__department__company__business_group'
-        ).first()
-        if user_role:
-            if user_role.department and user_role.department.company and user_role.department.company.business_group:
-                bg = user_role.department.company.business_group
-                return {'id': str(bg.id), 'name': bg.name}
-            elif user_role.team and user_role.team.department and user_role.team.department.company:
-                bg = user_role.team.department.company.business_group
-                if bg:
-                    return {'id': str(bg.id), 'name': bg.name}
-        return None
-
+        return self._get_org_ref(obj, 'company__business_group__')
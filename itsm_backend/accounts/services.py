@@ -10,9 +10,11 @@ Business logic for authentication:
 No business logic in views or serializers.
 """
 import bcrypt
+import functools
 import logging
 from datetime import datetime
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.token_blacklist.models import (
@@ -20,10 +22,41 @@ from rest_framework_simplejwt.token_blacklist.models import (
     OutstandingToken,
 )
 from core.exceptions import APIException, ErrorCode
-from .models import User, Role, UserRole
+from .authentication import invalidate_cached_user
+from .models import User, Role, UserRole, verify_dummy_password
+from .serializers import UserProfileSerializer
 
 logger = logging.getLogger(__name__)
 
+ROLES_CACHE_TTL_SECONDS = 30
+PROFILE_CACHE_TTL_SECONDS = 300  # Invalidated on User/UserRole change and login
+
+
+def _get_roles_cache_key(user_id) -> str:
+    """Generate cache key for a user's role names."""
+    return f"auth:roles:{user_id}"
+
+
+def invalidate_cached_roles(user_id):
+    """Remove cached role names (called from UserRole post_save/post_delete)."""
+    cache.delete(_get_roles_cache_key(user_id))
+
+
+def _get_profile_cache_key(user_id) -> str:
+    """Generate cache key for a user's serialized /me profile."""
+    return f"auth:profile:{user_id}"
+
+
+def invalidate_cached_profile(user_id):
+    """Remove the cached profile (called from User/UserRole signals and login)."""
+    cache.delete(_get_profile_cache_key(user_id))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_access_expires_in() -> int:
+    """Access token lifetime in seconds (settings are fixed per process)."""
+    return int(settings.SIMPLE_JWT['ACCESS_TOKEN_LIFETIME'].total_seconds())
+
 
 class AuthenticationError(APIException):
     """Invalid credentials error"""
@@ -84,7 +117,7 @@ class AuthService:
             BCrypt hash string
         """
         password_bytes = plain_password.encode('utf-8')
-        salt = bcrypt.gensalt(rounds=12)
+        salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(password_bytes, salt)
         return hashed.decode('utf-8')
     
@@ -93,20 +126,50 @@ class AuthService:
         """
         Get list of role names for a user.
         
+        Cached for ROLES_CACHE_TTL_SECONDS so repeated logins and token
+        issuance by the same user skip the Role JOIN.
+        
         Args:
             user: User instance
             
         Returns:
             List of role name strings
         """
-        role_ids = (
-            UserRole.objects
-            .filter(user=user)
-            .values_list('role_id', flat=True)
-            .distinct()
-        )
-        roles = Role.objects.filter(id__in=role_ids).values_list('name', flat=True)
-        return list(roles)
+        cache_key = _get_roles_cache_key(user.id)
+        roles = cache.get(cache_key)
+        if roles is None:
+            # Single JOIN through UserRole instead of two round trips
+            roles = list(
+                Role.objects
+                .filter(user_roles__user=user)
+                .values_list('name', flat=True)
+                .distinct()
+            )
+            cache.set(cache_key, roles, ROLES_CACHE_TTL_SECONDS)
+        return roles
+    
+    @staticmethod
+    def get_user_profile(user: User) -> dict:
+        """
+        Get the serialized profile returned by /api/auth/me/.
+        
+        Cached for PROFILE_CACHE_TTL_SECONDS so SPA polling of /me skips
+        the UserRole query and serializer walk. User and UserRole signals
+        and login (last_login) invalidate it; org renames show up once
+        the TTL expires.
+        
+        Args:
+            user: User instance
+            
+        Returns:
+            UserProfileSerializer data as a plain dict
+        """
+        cache_key = _get_profile_cache_key(user.id)
+        profile = cache.get(cache_key)
+        if profile is None:
+            profile = dict(UserProfileSerializer(user).data)
+            cache.set(cache_key, profile, PROFILE_CACHE_TTL_SECONDS)
+        return profile
     
     @staticmethod
     def generate_tokens(user: User) -> dict:
@@ -119,6 +182,8 @@ class AuthService:
         Returns:
             Dict with access_token, refresh_token, expires_in, and user info
         """
+        roles = AuthService.get_user_roles(user)
+        
         # Create refresh token
         refresh = RefreshToken()
         
@@ -126,24 +191,20 @@ class AuthService:
         refresh['user_id'] = str(user.id)
         refresh['email'] = user.email
         refresh['name'] = user.name
-        refresh['roles'] = AuthService.get_user_roles(user)
+        refresh['roles'] = roles
         
         # Get access token
         access = refresh.access_token
         
-        # Get expires_in from settings
-        access_lifetime = settings.SIMPLE_JWT.get('ACCESS_TOKEN_LIFETIME')
-        expires_in = int(access_lifetime.total_seconds())
-        
         return {
             'access_token': str(access),
             'refresh_token': str(refresh),
-            'expires_in': expires_in,
+            'expires_in': _get_access_expires_in(),
             'user': {
                 'id': str(user.id),
                 'name': user.name,
                 'email': user.email,
-                'roles': AuthService.get_user_roles(user)
+                'roles': roles
             }
         }
     
@@ -163,10 +224,16 @@ class AuthService:
             AuthenticationError: If credentials are invalid
             InactiveUserError: If user account is disabled
         """
-        # Find user by email
-        try:
-            user = User.objects.get(email__iexact=email)
-        except User.DoesNotExist:
+        # Find user by email (only the columns login and token generation read)
+        user = (
+            User.objects
+            .filter(email__iexact=email)
+            .only('id', 'email', 'name', 'password', 'is_active')
+            .first()
+        )
+        if user is None:
+            # Verify against a fixed hash so timing does not reveal the email exists
+            verify_dummy_password(password)
             logger.warning(f'Login attempt for non-existent email: {email}')
             raise AuthenticationError()
         
@@ -180,9 +247,18 @@ class AuthService:
             logger.warning(f'Invalid password for user: {email}')
             raise AuthenticationError()
         
-        # Update last login timestamp
+        # Update last login timestamp (single UPDATE, no model save/signals)
         user.last_login = timezone.now()
-        user.save(update_fields=['last_login'])
+        update_values = {'last_login': user.last_login}
+        
+        # Re-hash with the configured cost while the plain password is known
+        if user.password_needs_rehash():
+            user.set_password(password)
+            update_values['password'] = user.password
+        
+        User.objects.filter(pk=user.pk).update(**update_values)
+        invalidate_cached_user(user.pk)
+        invalidate_cached_profile(user.pk)
         
         # Generate and return tokens
         logger.info(f'Successful login for user: {email}')
@@ -203,19 +279,14 @@ class AuthService:
             TokenError: If refresh token is invalid or expired
         """
         try:
-            from rest_framework_simplejwt.tokens import RefreshToken
             refresh = RefreshToken(refresh_token_str)
             
             # Get new access token
             access = refresh.access_token
             
-            # Get expires_in from settings
-            access_lifetime = settings.SIMPLE_JWT.get('ACCESS_TOKEN_LIFETIME')
-            expires_in = int(access_lifetime.total_seconds())
-            
             return {
                 'access_token': str(access),
-                'expires_in': expires_in
+                'expires_in': _get_access_expires_in()
             }
         except Exception as e:
             logger.warning(f'Token refresh failed: {e}')
@@ -236,7 +307,6 @@ class AuthService:
             TokenError: If token is invalid
         """
         try:
-            from rest_framework_simplejwt.tokens import RefreshToken
             refresh = RefreshToken(refresh_token_str)
             refresh.blacklist()
             logger.info('Token successfully blacklisted')
@@ -264,7 +334,7 @@ class AuthService:
             raise AuthenticationError('Invalid token payload')
         
         try:
-            user = User.objects.get(id=user_id)
+            user = User.objects.only('id', 'is_active').get(id=user_id)
         except User.DoesNotExist:
             raise AuthenticationError('User not found')
         
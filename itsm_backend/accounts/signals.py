@@ -0,0 +1,88 @@
+"""
+Accounts Signal Handlers
+
+Keeps cached authentication data consistent with the User table:
+- User save/delete invalidates the cached JWT -> User resolution
+- UserRole save/delete invalidates the user's cached role names
+- User / UserRole save/delete invalidates the cached /me profile
+- Team / UserRole changes invalidate the affected managers' cached
+  team member IDs (old and new manager/team on reassignment)
+"""
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from analytics.services import invalidate_cached_team_members
+from .authentication import invalidate_cached_user
+from .models import User, Team, UserRole
+from .services import invalidate_cached_profile, invalidate_cached_roles
+
+
+def _invalidate_team_managers(team_id) -> None:
+    """Drop cached team member IDs for the manager of the given team"""
+    if team_id is None:
+        return
+    manager_id = (
+        Team.objects.filter(pk=team_id)
+        .values_list('manager_id', flat=True)
+        .first()
+    )
+    if manager_id is not None:
+        invalidate_cached_team_members(manager_id)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_cache(sender, instance, **kwargs):
+    """Drop the cached user so the next request re-reads it from the DB"""
+    invalidate_cached_user(instance.id)
+    invalidate_cached_profile(instance.id)
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def invalidate_roles_cache(sender, instance, **kwargs):
+    """Drop the user's cached role names and profile after an assignment change"""
+    invalidate_cached_roles(instance.user_id)
+    invalidate_cached_profile(instance.user_id)
+
+
+@receiver(pre_save, sender=UserRole)
+def invalidate_previous_team_members_cache(sender, instance, **kwargs):
+    """Drop the old team's cached members when a UserRole moves team"""
+    if instance._state.adding:
+        return
+    previous_team_id = (
+        UserRole.objects.filter(pk=instance.pk)
+        .values_list('team_id', flat=True)
+        .first()
+    )
+    if previous_team_id != instance.team_id:
+        _invalidate_team_managers(previous_team_id)
+
+
+@receiver(post_save, sender=UserRole)
+@receiver(post_delete, sender=UserRole)
+def invalidate_team_members_cache(sender, instance, **kwargs):
+    """Drop the team manager's cached member IDs after a membership change"""
+    _invalidate_team_managers(instance.team_id)
+
+
+@receiver(pre_save, sender=Team)
+def invalidate_previous_manager_cache(sender, instance, **kwargs):
+    """Drop the old manager's cached members when a team changes manager"""
+    if instance._state.adding:
+        return
+    previous_manager_id = (
+        Team.objects.filter(pk=instance.pk)
+        .values_list('manager_id', flat=True)
+        .first()
+    )
+    if previous_manager_id is not None and previous_manager_id != instance.manager_id:
+        invalidate_cached_team_members(previous_manager_id)
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_manager_cache(sender, instance, **kwargs):
+    """Drop the manager's cached member IDs after a team change"""
+    if instance.manager_id is not None:
+        invalidate_cached_team_members(instance.manager_id)
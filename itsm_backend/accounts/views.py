@@ -132,5 +132,5 @@ class MeView(APIView):
         }
     )
     def get(self, request):
-        serializer = UserProfileSerializer(request.user)
-        return Response(serializer.data, status=status.HTTP_200_OK)
+        profile = AuthService.get_user_profile(request.user)
+        return Response(profile, status=status.HTTP_200_OK)
@@ -0,0 +1,43 @@
+"""
+Analytics Serializers
+
+Input serializers for analytics query parameters:
+- AnalyticsDateRangeSerializer: start_date / end_date range
+"""
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+
+class AnalyticsDateRangeSerializer(serializers.Serializer):
+    """
+    Date range query parameters.
+    
+    Query:
+    ?start_date=YYYY-MM-DD&end_date=YYYY-MM-DD (both required)
+    
+    Parsed by DateField's ISO 8601 path (django.utils.dateparse.parse_date)
+    rather than datetime.strptime.
+    
+    Each failure carries one of the messages below - the single-message
+    400 bodies the analytics endpoints have always returned. Pass
+    context={'check_order': False} to accept start_date > end_date (the
+    employee endpoints never rejected it).
+    """
+    REQUIRED_MESSAGE = 'start_date and end_date are required'
+    INVALID_MESSAGE = 'Invalid date format. Use YYYY-MM-DD'
+    ORDER_MESSAGE = 'start_date must be before end_date'
+    
+    start_date = serializers.DateField(error_messages={'invalid': INVALID_MESSAGE})
+    end_date = serializers.DateField(error_messages={'invalid': INVALID_MESSAGE})
+    
+    def to_internal_value(self, data):
+        """Reject missing or blank dates before parsing either one"""
+        if not data.get('start_date') or not data.get('end_date'):
+            raise serializers.ValidationError({api_settings.NON_FIELD_ERRORS_KEY: [self.REQUIRED_MESSAGE]})
+        return super().to_internal_value(data)
+    
+    def validate(self, data):
+        """Validate start_date is not after end_date"""
+        if self.context.get('check_order', True) and data['start_date'] > data['end_date']:
+            raise serializers.ValidationError({'start_date': self.ORDER_MESSAGE})
+        return data
@@ -6,27 +6,36 @@ READ-ONLY analytics for Employee and Manager dashboards.
 INVARIANTS:
 - NO writes of any kind
 - All queries must be index-driven (max 2s response)
-- Cache responses with 30s TTL
+- Cache responses with 30s TTL (manager analytics: keyed by team ticket
+  version, so it is reused until a team ticket changes)
 - Respect Phase 3 RBAC strictly
 - Unauthorized access returns 404 (SEC-06)
 
 QUERY INDEX REFERENCES:
 - IX_Ticket_AssignedTo: (assigned_to, is_closed, status)
-- IX_Ticket_Analytics: (assigned_to, is_closed, closed_at)
+- IX_Ticket_Analytics: (assigned_to, is_closed, closed_at) INCLUDE (created_at)
 - IX_Ticket_Status: (status, created_at)
+- IX_Ticket_AssigneeCreated: (assigned_to, created_at)
+  INCLUDE (is_closed, closed_at, status, category)
 """
 import logging
-from datetime import timedelta
-from typing import Optional, List, Dict, Any
-from django.db.models import Count, Avg, Min, F, Q, DurationField, ExpressionWrapper
-from django.db.models.functions import TruncDate, TruncWeek, TruncMonth
+import math
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Optional, List, Dict, Any, Callable
+from django.db.models import (
+    Count, Sum, Avg, Min, Max, F, Func, Q, Value, Case, When,
+    CharField, FloatField, IntegerField
+)
+from django.db.models.functions import Cast, TruncDate, TruncWeek, TruncMonth
 from django.utils import timezone
 from django.core.cache import cache
 
 from core.exceptions import ResourceNotFoundError, ForbiddenError
 from core.permissions import RoleConstants, has_role, has_any_role
-from accounts.models import User, Team, UserRole
-from tickets.models import Ticket, TicketStatus
+from accounts.models import User, UserRole
+from tickets.models import Category, Ticket, TicketStatus
 
 logger = logging.getLogger(__name__)
 
@@ -36,16 +45,327 @@ logger = logging.getLogger(__name__)
 # =============================================================================
 
 CACHE_TTL_SECONDS = 30  # 30 second TTL per requirements
+TEAM_MEMBERS_CACHE_TTL_SECONDS = 300  # Membership changes rarely; invalidated by signals
+CATEGORY_NAMES_CACHE_TTL_SECONDS = 3600  # Small dimension table; invalidated by signals
+TICKET_VERSION_CACHE_TTL_SECONDS = 5  # Max staleness of the team ticket version
+DAILY_SERIES_CACHE_TTL_SECONDS = 86400  # Month-versioned buckets; invalidated by Ticket signals
+EARLY_REFRESH_BETA = 1.0  # >1 refreshes earlier, <1 later (XFetch beta)
+COMPUTE_LOCK_TIMEOUT_SECONDS = 30  # Upper bound if the computing worker dies
+COMPUTE_LOCK_WAIT_SECONDS = 2.0  # Max time a cold-miss waiter polls before computing itself
+COMPUTE_LOCK_POLL_SECONDS = 0.05
 
 
-def _get_employee_cache_key(user_id) -> str:
-    """Generate cache key for employee analytics."""
-    return f"analytics:employee:{user_id}"
+_NOT_PREFETCHED = object()
 
 
-def _get_manager_cache_key(user_id) -> str:
-    """Generate cache key for manager analytics."""
-    return f"analytics:manager:{user_id}"
+def _cache_get_or_compute(
+    key: str,
+    ttl: int,
+    compute_fn: Callable[[], Dict[str, Any]],
+    beta: float = EARLY_REFRESH_BETA,
+    prefetched: Any = _NOT_PREFETCHED
+) -> Dict[str, Any]:
+    """
+    Cache-aside read with probabilistic early refresh (XFetch) and
+    single-flight recomputation.
+    
+    Entries are stored as {'v': result, 'delta': compute seconds,
+    'exp': expiry timestamp}. Each read recomputes early with a probability
+    that rises as expiry approaches and scales with how expensive the
+    computation was, so one request refreshes the entry before it expires
+    instead of every concurrent request recomputing at once afterwards.
+    
+    Recomputation is guarded by a cache.add() lock on "<key>:lock":
+    - Early refresh: if another worker holds the lock, serve the still
+      valid cached value
+    - Cold miss: wait up to COMPUTE_LOCK_WAIT_SECONDS for the lock holder
+      to populate the entry, then fall back to computing directly
+    
+    Args:
+        key: Cache key
+        ttl: Time to live in seconds
+        compute_fn: Zero-argument callable producing the value
+        beta: Early refresh aggressiveness
+        prefetched: Entry already read for key (None for a miss), e.g. by
+            one cache.get_many() over several keys; skips the cache.get()
+        
+    Returns:
+        Cached or freshly computed value
+    """
+    entry = cache.get(key) if prefetched is _NOT_PREFETCHED else prefetched
+    if entry is not None:
+        # -log(U) is Exp(1) distributed; 1 - random() keeps U in (0, 1]
+        early_by = entry['delta'] * beta * -math.log(1.0 - random.random())
+        if time.time() + early_by < entry['exp']:
+            logger.debug(f"Cache hit for {key}")
+            return entry['v']
+        logger.debug(f"Early refresh for {key}")
+    
+    lock_key = f"{key}:lock"
+    locked = cache.add(lock_key, 1, COMPUTE_LOCK_TIMEOUT_SECONDS)
+    
+    if not locked:
+        if entry is not None:
+            # Another worker is already refreshing
+            return entry['v']
+        
+        # Cold miss: wait for the lock holder instead of duplicating its work
+        deadline = time.monotonic() + COMPUTE_LOCK_WAIT_SECONDS
+        while time.monotonic() < deadline:
+            time.sleep(COMPUTE_LOCK_POLL_SECONDS)
+            entry = cache.get(key)
+            if entry is not None:
+                logger.debug(f"Cache filled by lock holder for {key}")
+                return entry['v']
+            if cache.get(lock_key) is None:
+                # Holder finished without caching (e.g. raised) - compute here
+                break
+        logger.debug(f"Lock wait expired for {key}, computing")
+    
+    try:
+        started = time.time()
+        value = compute_fn()
+        finished = time.time()
+        
+        cache.set(
+            key,
+            {'v': value, 'delta': finished - started, 'exp': finished + ttl},
+            ttl
+        )
+        logger.debug(f"Cached {key}")
+        return value
+    finally:
+        if locked:
+            cache.delete(lock_key)
+
+
+def _get_employee_cache_key(user_id, version) -> str:
+    """Generate cache key for employee analytics at an assignee version."""
+    return f"analytics:employee:{user_id}:{version}"
+
+
+def _get_assignee_version_key(user_id) -> str:
+    """Generate cache key for an assignee's analytics version counter."""
+    return f"analytics:assignee_version:{user_id}"
+
+
+def _get_assignee_version(user_id) -> int:
+    """
+    Current analytics version for tickets assigned to a user.
+    
+    Baked into the employee and employee detailed cache keys, so bumping
+    it invalidates every cached date range at once. A missing counter
+    starts at the current time in ns, never reusing an earlier version
+    after eviction.
+    """
+    key = _get_assignee_version_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        version = time.time_ns()
+        if not cache.add(key, version, None):
+            version = cache.get(key, version)
+    return version
+
+
+def _bump_version(key) -> None:
+    """Increment a version counter, restarting it from the clock if evicted."""
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def invalidate_assignee_analytics(user_id, created_at=None) -> None:
+    """
+    Invalidate cached employee analytics for an assignee.
+    
+    Called from analytics signal handlers when a Ticket assigned to the
+    user is saved or deleted (and for the previous assignee on reassign).
+    
+    Args:
+        user_id: Assignee whose analytics changed
+        created_at: Ticket created_at - also invalidates the daily series
+            bucket for that month (other months stay cached)
+    """
+    _bump_version(_get_assignee_version_key(user_id))
+    if created_at is not None:
+        local_created = timezone.localtime(created_at)
+        _bump_version(
+            _get_daily_series_version_key(user_id, local_created.year, local_created.month)
+        )
+
+
+def _get_daily_series_version_key(user_id, year, month) -> str:
+    """Generate cache key for an assignee's per-month daily series version."""
+    return f"analytics:employee_daily_version:{user_id}:{year:04d}{month:02d}"
+
+
+def _get_daily_series_cache_key(user_id, year, month, version) -> str:
+    """Generate cache key for an assignee's daily series month bucket."""
+    return f"analytics:employee_daily:{user_id}:{year:04d}{month:02d}:{version}"
+
+
+def _get_manager_cache_key(user_id, version) -> str:
+    """Generate cache key for manager analytics at a team ticket version."""
+    return f"analytics:manager:{user_id}:{version}"
+
+
+def _get_ticket_version_cache_key(manager_id) -> str:
+    """Generate cache key for a manager's team ticket version."""
+    return f"ticket_hwm:{manager_id}"
+
+
+CATEGORY_NAMES_CACHE_KEY = "analytics:category_names"
+
+
+def invalidate_cached_category_names() -> None:
+    """Drop the cached category id -> name map (Category save/delete)."""
+    cache.delete(CATEGORY_NAMES_CACHE_KEY)
+
+
+def _get_team_members_cache_key(manager_id) -> str:
+    """Generate cache key for a manager's team member IDs."""
+    return f"team_members:{manager_id}"
+
+
+def invalidate_cached_team_members(manager_id) -> None:
+    """
+    Drop a manager's cached team member IDs.
+    
+    Called from accounts signal handlers when a Team or UserRole changes.
+    """
+    cache.delete(_get_team_members_cache_key(manager_id))
+
+
+# =============================================================================
+# QUERY HELPERS
+# =============================================================================
+
+def _count_where(condition: Q) -> Sum:
+    """
+    Conditional count as SUM(CASE WHEN ... THEN 1 ELSE 0 END).
+    
+    Replaces Count('id', filter=...): the CASE sum reads only the columns in
+    the condition, so SQL Server can answer it from IX_Ticket_AssignedTo /
+    IX_Ticket_Analytics without a lookup on id per matching row.
+    
+    NOTE: Sum over an empty set is NULL - callers keep their `or 0` fallback.
+    """
+    return Sum(Case(When(condition, then=1), default=0, output_field=IntegerField()))
+
+
+class _ResolutionHours(Func):
+    """
+    Hours between created_at and closed_at, computed in the database.
+    
+    Replaces ExpressionWrapper(F('closed_at') - F('created_at'), DurationField()):
+    the average comes back as a float of hours rather than a timedelta
+    converted with .total_seconds() / 3600 in Python. Cast to float before
+    aggregation - AVG over an integer DATEDIFF truncates on SQL Server.
+    """
+    template = "EXTRACT(EPOCH FROM (%(closed_at)s - %(created_at)s)) / 3600.0"
+    output_field = FloatField()
+    
+    def __init__(self, **extra):
+        super().__init__(F('created_at'), F('closed_at'), **extra)
+    
+    def as_sql(self, compiler, connection, template=None, **extra_context):
+        created_sql, created_params = compiler.compile(self.source_expressions[0])
+        closed_sql, closed_params = compiler.compile(self.source_expressions[1])
+        template = template or self.template
+        params = (
+            created_params + closed_params
+            if template.index('%(created_at)s') < template.index('%(closed_at)s')
+            else closed_params + created_params
+        )
+        return template % {'created_at': created_sql, 'closed_at': closed_sql}, params
+    
+    def as_microsoft(self, compiler, connection, **extra_context):
+        # mssql-django vendor; DATEDIFF_BIG avoids int overflow on SECOND
+        return self.as_sql(
+            compiler, connection,
+            template="CAST(DATEDIFF_BIG(SECOND, %(created_at)s, %(closed_at)s) AS FLOAT) / 3600.0",
+        )
+    
+    def as_sqlite(self, compiler, connection, **extra_context):
+        return self.as_sql(
+            compiler, connection,
+            template="(julianday(%(closed_at)s) - julianday(%(created_at)s)) * 24.0",
+        )
+
+
+def _avg_resolution_hours(**kwargs) -> Avg:
+    """AVG of _ResolutionHours as a float of hours (NULL over an empty set)."""
+    return Avg(_ResolutionHours(), output_field=FloatField(), **kwargs)
+
+
+def _get_category_names(category_ids) -> Dict[Any, str]:
+    """
+    Category id -> name map from the cache.
+    
+    Reloads once if any requested id is missing (category created since
+    the map was cached).
+    """
+    names = cache.get_or_set(
+        CATEGORY_NAMES_CACHE_KEY,
+        lambda: dict(Category.objects.values_list('id', 'name')),
+        CATEGORY_NAMES_CACHE_TTL_SECONDS,
+    )
+    if any(category_id not in names for category_id in category_ids):
+        names = dict(Category.objects.values_list('id', 'name'))
+        cache.set(CATEGORY_NAMES_CACHE_KEY, names, CATEGORY_NAMES_CACHE_TTL_SECONDS)
+    return names
+
+
+def _get_top_categories(base_qs, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    Top categories by ticket count.
+    
+    Groups on Ticket.category_id only, so the aggregate stays on the Ticket
+    table; names come from the cached category map.
+    
+    Args:
+        base_qs: Ticket queryset to aggregate
+        limit: Number of categories to return
+        
+    Returns:
+        List of {'name', 'count'} dicts, highest count first
+    """
+    # Clear ordering to avoid SQL Server GROUP BY conflict; tuple rows,
+    # since each is immediately rebuilt into the response dict
+    rows = list(
+        base_qs
+        .order_by()
+        .values('category_id')
+        .annotate(count=Count('id'))
+        .order_by('-count')
+        .values_list('category_id', 'count')[:limit]
+    )
+    names = _get_category_names([category_id for category_id, _ in rows])
+    return [
+        {'name': names.get(category_id), 'count': count}
+        for category_id, count in rows
+    ]
+
+
+def _get_created_at_range(start_date, end_date) -> Dict[str, datetime]:
+    """
+    Half-open created_at bounds covering start_date..end_date inclusive.
+    
+    Equivalent to created_at__date__gte/lte in the current timezone, but
+    compares the raw column so SQL Server can seek on created_at indexes
+    instead of evaluating CAST(created_at AS date) for every row.
+    
+    Returns:
+        Filter kwargs: created_at__gte / created_at__lt
+    """
+    midnight = datetime.min.time()
+    return {
+        'created_at__gte': timezone.make_aware(datetime.combine(start_date, midnight)),
+        'created_at__lt': timezone.make_aware(
+            datetime.combine(end_date + timedelta(days=1), midnight)
+        ),
+    }
 
 
 # =============================================================================
@@ -85,13 +405,15 @@ class EmployeeAnalyticsService:
         Returns:
             Dict containing all analytics metrics
         """
-        # Check cache first
-        cache_key = _get_employee_cache_key(user.id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            logger.debug(f"Cache hit for employee analytics: {user.id}")
-            return cached_data
-        
+        return _cache_get_or_compute(
+            _get_employee_cache_key(user.id, _get_assignee_version(user.id)),
+            CACHE_TTL_SECONDS,
+            lambda: EmployeeAnalyticsService._compute_employee_analytics(user),
+        )
+    
+    @staticmethod
+    def _compute_employee_analytics(user: User) -> Dict[str, Any]:
+        """Compute employee analytics from the database (uncached)."""
         logger.debug(f"Computing employee analytics for user: {user.id}")
         
         now = timezone.now()
@@ -103,16 +425,19 @@ class EmployeeAnalyticsService:
         # Uses index: IX_Ticket_AssignedTo (assigned_to, is_closed, status)
         base_qs = Ticket.objects.filter(assigned_to=user)
         
-        # Count totals - single query with conditional aggregation
+        # Count totals and average resolution - single query with
+        # conditional aggregation
         # Query uses IX_Ticket_AssignedTo for filtering, then aggregates
         totals = base_qs.aggregate(
             total_assigned=Count('id'),
-            total_open=Count('id', filter=Q(is_closed=False)),
-            total_closed=Count('id', filter=Q(is_closed=True)),
+            total_open=_count_where(Q(is_closed=False)),
+            total_closed=_count_where(Q(is_closed=True)),
             # Uses IX_Ticket_Analytics (assigned_to, is_closed, closed_at)
-            closed_today=Count('id', filter=Q(is_closed=True, closed_at__gte=today_start)),
-            closed_last_7_days=Count('id', filter=Q(is_closed=True, closed_at__gte=last_7_days)),
-            closed_last_30_days=Count('id', filter=Q(is_closed=True, closed_at__gte=last_30_days)),
+            closed_today=_count_where(Q(is_closed=True, closed_at__gte=today_start)),
+            closed_last_7_days=_count_where(Q(is_closed=True, closed_at__gte=last_7_days)),
+            closed_last_30_days=_count_where(Q(is_closed=True, closed_at__gte=last_30_days)),
+            # Average resolution in hours, computed by the database
+            avg_resolution_hours=_avg_resolution_hours(filter=Q(is_closed=True)),
         )
         
         # Status breakdown - GROUP BY status
@@ -125,23 +450,9 @@ class EmployeeAnalyticsService:
         )
         by_status = {row['status']: row['count'] for row in by_status_qs}
         
-        # Average resolution time (hours) for closed tickets
-        # Uses ExpressionWrapper + DurationField for SQL Server compatibility
-        # Uses IX_Ticket_Analytics for closed_at filtering
-        duration_expr = ExpressionWrapper(
-            F('closed_at') - F('created_at'),
-            output_field=DurationField()
-        )
-        avg_resolution = base_qs.filter(is_closed=True).aggregate(
-            avg_hours=Avg(duration_expr)
-        )
-        
-        # Convert timedelta to hours
         avg_resolution_hours = None
-        if avg_resolution['avg_hours'] is not None:
-            avg_resolution_hours = round(
-                avg_resolution['avg_hours'].total_seconds() / 3600, 2
-            )
+        if totals['avg_resolution_hours'] is not None:
+            avg_resolution_hours = round(totals['avg_resolution_hours'], 2)
         
         # Oldest open ticket
         # Uses IX_Ticket_AssignedTo (assigned_to, is_closed -> filters to open)
@@ -166,10 +477,6 @@ class EmployeeAnalyticsService:
             'oldest_open_ticket': oldest_open,
         }
         
-        # Cache the result
-        cache.set(cache_key, result, CACHE_TTL_SECONDS)
-        logger.debug(f"Cached employee analytics for user: {user.id}")
-        
         return result
 
 
@@ -196,6 +503,9 @@ class ManagerAnalyticsService:
         
         Reuses logic from TicketService for consistency.
         
+        Cached for TEAM_MEMBERS_CACHE_TTL_SECONDS; Team/UserRole signals
+        invalidate the entry when membership or team managers change.
+        
         Uses indexes:
         - Team table access via manager FK
         - UserRole.IX_UserRole_Team (team, user)
@@ -206,11 +516,69 @@ class ManagerAnalyticsService:
         Returns:
             List of user IDs who are team members
         """
-        managed_teams = Team.objects.filter(manager=manager)
-        return list(
-            UserRole.objects.filter(team__in=managed_teams)
-            .values_list('user_id', flat=True)
-            .distinct()
+        def compute():
+            # Single JOIN UserRole -> Team on manager, no team__in subquery
+            return list(
+                UserRole.objects.filter(team__manager=manager)
+                .values_list('user_id', flat=True)
+                .distinct()
+            )
+        
+        return cache.get_or_set(
+            _get_team_members_cache_key(manager.id),
+            compute,
+            TEAM_MEMBERS_CACHE_TTL_SECONDS,
+        )
+    
+    @staticmethod
+    def is_team_member(manager: User, user_id) -> bool:
+        """
+        O(1) check whether user_id is in the manager's team(s).
+        
+        The id set is built once from get_team_member_ids() and memoized
+        on the manager instance, so repeated checks within a request
+        reuse it. Ids compare as strings - callers pass URL path values.
+        """
+        member_ids = getattr(manager, '_team_member_id_set', None)
+        if member_ids is None:
+            member_ids = frozenset(
+                str(member_id)
+                for member_id in ManagerAnalyticsService.get_team_member_ids(manager)
+            )
+            manager._team_member_id_set = member_ids
+        return str(user_id) in member_ids
+    
+    @staticmethod
+    def get_team_ticket_version(manager: User, team_member_ids: List) -> str:
+        """
+        Get a version string for the tickets assigned to a manager's team.
+        
+        Combines the ticket count with the max(updated_at) high-water mark:
+        every ticket write goes through save() and bumps updated_at, and a
+        ticket reassigned out of the team lowers the count. Cached for
+        TICKET_VERSION_CACHE_TTL_SECONDS so repeated dashboard loads cost
+        one cache read.
+        
+        Args:
+            manager: The manager user
+            team_member_ids: IDs from get_team_member_ids()
+            
+        Returns:
+            Version string usable in a cache key
+        """
+        def compute():
+            if not team_member_ids:
+                return "empty"
+            version = Ticket.objects.filter(
+                assigned_to_id__in=team_member_ids
+            ).aggregate(count=Count('id'), hwm=Max('updated_at'))
+            hwm = version['hwm'].isoformat() if version['hwm'] else "none"
+            return f"{version['count']}:{hwm}"
+        
+        return cache.get_or_set(
+            _get_ticket_version_cache_key(manager.id),
+            compute,
+            TICKET_VERSION_CACHE_TTL_SECONDS,
         )
     
     @staticmethod
@@ -219,6 +587,11 @@ class ManagerAnalyticsService:
         Get analytics for manager's team.
         
         Returns cached data if available, otherwise computes and caches.
+        The cache key includes the team ticket version, so ticket writes
+        are reflected as soon as the version is re-read. Entries still
+        expire after CACHE_TTL_SECONDS: age_days, the 7-day aging cutoff
+        and the 30-day volume trend are relative to now and change without
+        any ticket write.
         
         RBAC: Only shows tickets assigned to team members (not department-wide).
         
@@ -241,13 +614,18 @@ class ManagerAnalyticsService:
         Raises:
             ResourceNotFoundError: If user has no team members (returns 404)
         """
-        # Check cache first
-        cache_key = _get_manager_cache_key(user.id)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            logger.debug(f"Cache hit for manager analytics: {user.id}")
-            return cached_data
+        team_member_ids = ManagerAnalyticsService.get_team_member_ids(user)
+        version = ManagerAnalyticsService.get_team_ticket_version(user, team_member_ids)
         
+        return _cache_get_or_compute(
+            _get_manager_cache_key(user.id, version),
+            CACHE_TTL_SECONDS,
+            lambda: ManagerAnalyticsService._compute_manager_analytics(user),
+        )
+    
+    @staticmethod
+    def _compute_manager_analytics(user: User) -> Dict[str, Any]:
+        """Compute manager analytics from the database (uncached)."""
         logger.debug(f"Computing manager analytics for user: {user.id}")
         
         # Get team member IDs (RBAC enforcement)
@@ -277,70 +655,103 @@ class ManagerAnalyticsService:
         # Uses index: IX_Ticket_AssignedTo (assigned_to IN ...)
         base_qs = Ticket.objects.filter(assigned_to_id__in=team_member_ids)
         
-        # Team totals - single aggregation query
-        totals = base_qs.aggregate(
-            team_total_tickets=Count('id'),
-            team_open=Count('id', filter=Q(is_closed=False)),
-            team_closed=Count('id', filter=Q(is_closed=True)),
-        )
-        
         # Per-employee stats
-        # GROUP BY assigned_to with counts
-        per_employee_qs = (
+        # GROUP BY assigned_to_id only - no JOIN to User in the aggregating
+        # plan, so it stays on IX_Ticket_AssignedTo.
+        # Every team ticket lands in exactly one row, so team totals are
+        # summed from these rows instead of a separate aggregate query.
+        per_employee_rows = list(
             base_qs
-            .values('assigned_to_id', 'assigned_to__name', 'assigned_to__email')
+            .values('assigned_to_id')
             .annotate(
                 total=Count('id'),
-                open_count=Count('id', filter=Q(is_closed=False)),
-                closed_count=Count('id', filter=Q(is_closed=True)),
+                open_count=_count_where(Q(is_closed=False)),
+                closed_count=_count_where(Q(is_closed=True)),
             )
-            .order_by('assigned_to__name')
+            .order_by('assigned_to_id')
         )
         
-        per_employee_stats = [
-            {
-                'employee_id': str(row['assigned_to_id']),
-                'employee_name': row['assigned_to__name'],
-                'employee_email': row['assigned_to__email'],
-                'total': row['total'],
-                'open': row['open_count'],
-                'closed': row['closed_count'],
-            }
-            for row in per_employee_qs
-        ]
+        # Aging tickets (open > 7 days)
+        # Uses IX_Ticket_AssignedTo for assigned_to filter
+        aging_rows = list(
+            base_qs
+            .filter(is_closed=False, created_at__lt=seven_days_ago)
+            .order_by('created_at')
+            .values(
+                'id', 'ticket_number', 'title', 'status',
+                'created_at', 'assigned_to_id'
+            )[:20]  # Limit to 20 most aged tickets
+        )
+        
+        # Resolve names/emails for both result sets in one narrow PK lookup.
+        # The two queries are separate statements, so a ticket reassigned
+        # in between can leave an aging assignee with no per-employee row.
+        employees = {
+            row['id']: row
+            for row in User.objects.filter(
+                id__in={row['assigned_to_id'] for row in per_employee_rows}
+                | {row['assigned_to_id'] for row in aging_rows}
+            ).values('id', 'name', 'email')
+        }
+        
+        # casefold() matches the former ORDER BY name under the DB's
+        # case-insensitive collation
+        per_employee_stats = sorted(
+            (
+                {
+                    'employee_id': str(row['assigned_to_id']),
+                    'employee_name': employees[row['assigned_to_id']]['name'],
+                    'employee_email': employees[row['assigned_to_id']]['email'],
+                    'total': row['total'],
+                    'open': row['open_count'],
+                    'closed': row['closed_count'],
+                }
+                for row in per_employee_rows
+            ),
+            key=lambda stats: stats['employee_name'].casefold(),
+        )
         
-        # Status breakdown
+        team_total_tickets = sum(row['total'] for row in per_employee_rows)
+        team_open = sum(row['open_count'] for row in per_employee_rows)
+        team_closed = sum(row['closed_count'] for row in per_employee_rows)
+        
+        # Status and priority breakdowns - one round trip via UNION ALL
+        # Each branch is a cheap GROUP BY over the same team rows; a
+        # discriminator column splits them back apart. Priority is cast to
+        # a string so both branches share a column type.
         by_status_qs = (
             base_qs
-            .values('status')
+            .order_by()
+            .annotate(kind=Value('status'), bucket=F('status'))
+            .values('kind', 'bucket')
             .annotate(count=Count('id'))
-            .order_by('status')
         )
-        by_status = {row['status']: row['count'] for row in by_status_qs}
-        
-        # Priority breakdown
         # Filter out NULL priorities
         by_priority_qs = (
             base_qs
             .filter(priority__isnull=False)
-            .values('priority')
+            .order_by()
+            .annotate(
+                kind=Value('priority'),
+                bucket=Cast('priority', output_field=CharField(max_length=50))
+            )
+            .values('kind', 'bucket')
             .annotate(count=Count('id'))
-            .order_by('priority')
         )
-        by_priority = {f"P{row['priority']}": row['count'] for row in by_priority_qs}
-        
-        # Aging tickets (open > 7 days)
-        # Uses IX_Ticket_AssignedTo for assigned_to filter
-        aging_qs = (
-            base_qs
-            .filter(is_closed=False, created_at__lt=seven_days_ago)
-            .order_by('created_at')
-            .values(
-                'id', 'ticket_number', 'title', 'status',
-                'created_at', 'assigned_to__name'
-            )[:20]  # Limit to 20 most aged tickets
+        breakdown_qs = (
+            by_status_qs
+            .union(by_priority_qs, all=True)
+            .order_by('kind', 'bucket')
         )
         
+        by_status = {}
+        by_priority = {}
+        for row in breakdown_qs:
+            if row['kind'] == 'status':
+                by_status[row['bucket']] = row['count']
+            else:
+                by_priority[f"P{row['bucket']}"] = row['count']
+        
         aging_tickets = [
             {
                 'id': str(row['id']),
@@ -348,36 +759,30 @@ class ManagerAnalyticsService:
                 'title': row['title'],
                 'status': row['status'],
                 'created_at': row['created_at'].isoformat(),
-                'assigned_to_name': row['assigned_to__name'],
+                'assigned_to_name': employees[row['assigned_to_id']]['name'],
                 'age_days': (now - row['created_at']).days,
             }
-            for row in aging_qs
+            for row in aging_rows
         ]
         
         # Volume trend - tickets created per day over last 30 days
-        # Uses IX_Ticket_Pagination (-created_at, id) with date truncation
-        volume_qs = (
+        # Uses IX_Ticket_Pagination (-created_at, id) with date truncation.
+        # The day is cast to its ISO 'YYYY-MM-DD' string in SQL, so rows
+        # come back already in response shape.
+        volume_trend = list(
             base_qs
             .filter(created_at__gte=thirty_days_ago)
-            .annotate(date=TruncDate('created_at'))
+            .annotate(date=Cast(TruncDate('created_at'), output_field=CharField(max_length=10)))
             .values('date')
             .annotate(count=Count('id'))
             .order_by('date')
         )
         
-        volume_trend = [
-            {
-                'date': row['date'].isoformat(),
-                'count': row['count'],
-            }
-            for row in volume_qs
-        ]
-        
         # Build response
         result = {
-            'team_total_tickets': totals['team_total_tickets'] or 0,
-            'team_open': totals['team_open'] or 0,
-            'team_closed': totals['team_closed'] or 0,
+            'team_total_tickets': team_total_tickets,
+            'team_open': team_open,
+            'team_closed': team_closed,
             'per_employee_stats': per_employee_stats,
             'by_status': by_status,
             'by_priority': by_priority,
@@ -385,10 +790,6 @@ class ManagerAnalyticsService:
             'volume_trend': volume_trend,
         }
         
-        # Cache the result
-        cache.set(cache_key, result, CACHE_TTL_SECONDS)
-        logger.debug(f"Cached manager analytics for user: {user.id}")
-        
         return result
 
 
@@ -401,9 +802,9 @@ def _get_detailed_cache_key(user_id, start_date, end_date) -> str:
     return f"analytics:detailed:{user_id}:{start_date}:{end_date}"
 
 
-def _get_employee_detailed_cache_key(user_id, start_date, end_date) -> str:
-    """Generate cache key for employee detailed analytics."""
-    return f"analytics:employee_detailed:{user_id}:{start_date}:{end_date}"
+def _get_employee_detailed_cache_key(user_id, version, start_date, end_date) -> str:
+    """Generate cache key for employee detailed analytics at an assignee version."""
+    return f"analytics:employee_detailed:{user_id}:{version}:{start_date}:{end_date}"
 
 
 class DetailedAnalyticsService:
@@ -437,13 +838,22 @@ class DetailedAnalyticsService:
         Returns:
             Dict with summary, org breakdowns, charts data
         """
-        # Check cache first
-        cache_key = _get_detailed_cache_key(user.id, start_date, end_date)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            logger.debug(f"Cache hit for detailed analytics: {user.id}")
-            return cached_data
-        
+        return _cache_get_or_compute(
+            _get_detailed_cache_key(user.id, start_date, end_date),
+            CACHE_TTL_SECONDS,
+            lambda: DetailedAnalyticsService._compute_detailed_analytics(
+                user, start_date, end_date, group_by
+            ),
+        )
+    
+    @staticmethod
+    def _compute_detailed_analytics(
+        user: User,
+        start_date,
+        end_date,
+        group_by: str
+    ) -> Dict[str, Any]:
+        """Compute detailed analytics from the database (uncached)."""
         logger.debug(f"Computing detailed analytics for manager: {user.id}")
         
         # Validate date range
@@ -476,81 +886,77 @@ class DetailedAnalyticsService:
             }
         
         # Base queryset: Tickets assigned to team members within date range
+        # No select_related - every derived query is an aggregate, and each
+        # JOINs only the relations its own F() expressions reference
         base_qs = Ticket.objects.filter(
             assigned_to_id__in=team_member_ids,
-            created_at__date__gte=start_date,
-            created_at__date__lte=end_date
-        ).select_related(
-            'subcategory__department__company__business_group',
-            'category'
-        )
-        
-        # Summary totals
-        totals = base_qs.aggregate(
-            total=Count('id'),
-            open_count=Count('id', filter=Q(is_closed=False)),
-            closed_count=Count('id', filter=Q(is_closed=True)),
+            **_get_created_at_range(start_date, end_date)
         )
         
         # Average resolution time for closed tickets in range
-        duration_expr = ExpressionWrapper(
-            F('closed_at') - F('created_at'),
-            output_field=DurationField()
-        )
-        avg_res = base_qs.filter(is_closed=True).aggregate(avg_hours=Avg(duration_expr))
+        avg_res = base_qs.filter(is_closed=True).aggregate(avg_hours=_avg_resolution_hours())
         avg_resolution_hours = None
         if avg_res['avg_hours']:
-            avg_resolution_hours = round(avg_res['avg_hours'].total_seconds() / 3600, 2)
-        
-        # By Company (derived from ticket.subcategory.department.company)
-        by_company_qs = (
+            avg_resolution_hours = round(avg_res['avg_hours'], 2)
+        
+        # By Company and By Business Group - one GROUP BY over the
+        # subcategory -> department -> company -> business_group join.
+        # A company belongs to exactly one business group, so business group
+        # totals are rolled up from the company rows instead of re-running
+        # the same 4-table aggregation. The FK chain is non-nullable, so
+        # every ticket lands in exactly one company row and the summary
+        # totals are rolled up the same way.
+        by_org_qs = (
             base_qs
             .values(
                 company_id=F('subcategory__department__company__id'),
-                company_name=F('subcategory__department__company__name')
+                company_name=F('subcategory__department__company__name'),
+                bg_id=F('subcategory__department__company__business_group__id'),
+                bg_name=F('subcategory__department__company__business_group__name'),
             )
             .annotate(
                 total=Count('id'),
-                open_count=Count('id', filter=Q(is_closed=False)),
-                closed_count=Count('id', filter=Q(is_closed=True)),
+                open_count=_count_where(Q(is_closed=False)),
+                closed_count=_count_where(Q(is_closed=True)),
             )
             .order_by('company_name')
         )
-        by_company = [
-            {
+        
+        by_company = []
+        by_bg = {}
+        totals = {'total': 0, 'open': 0, 'closed': 0}
+        for row in by_org_qs:
+            totals['total'] += row['total']
+            totals['open'] += row['open_count']
+            totals['closed'] += row['closed_count']
+            
+            by_company.append({
                 'id': str(row['company_id']) if row['company_id'] else None,
                 'name': row['company_name'] or 'Unassigned',
                 'total': row['total'],
                 'open': row['open_count'],
                 'closed': row['closed_count'],
-            }
-            for row in by_company_qs
-        ]
-        
-        # By Business Group
-        by_bg_qs = (
-            base_qs
-            .values(
-                bg_id=F('subcategory__department__company__business_group__id'),
-                bg_name=F('subcategory__department__company__business_group__name')
-            )
-            .annotate(
-                total=Count('id'),
-                open_count=Count('id', filter=Q(is_closed=False)),
-                closed_count=Count('id', filter=Q(is_closed=True)),
-            )
-            .order_by('bg_name')
+            })
+            
+            bg = by_bg.get(row['bg_id'])
+            if bg is None:
+                bg = by_bg[row['bg_id']] = {
+                    'id': str(row['bg_id']) if row['bg_id'] else None,
+                    'name': row['bg_name'] or 'Unassigned',
+                    'total': 0,
+                    'open': 0,
+                    'closed': 0,
+                }
+            bg['total'] += row['total']
+            bg['open'] += row['open_count']
+            bg['closed'] += row['closed_count']
+        
+        # Same order as ORDER BY bg_name: NULL (Unassigned) first, then
+        # case-insensitive by name like the default SQL Server collation
+        by_business_group = sorted(
+            by_bg.values(),
+            key=lambda bg: (bg['id'] is not None, bg['name'].casefold()),
         )
-        by_business_group = [
-            {
-                'id': str(row['bg_id']) if row['bg_id'] else None,
-                'name': row['bg_name'] or 'Unassigned',
-                'total': row['total'],
-                'open': row['open_count'],
-                'closed': row['closed_count'],
-            }
-            for row in by_bg_qs
-        ]
         
         # By Status (clear ordering to avoid SQL Server GROUP BY conflict)
         by_status_qs = base_qs.order_by().values('status').annotate(count=Count('id'))
@@ -566,18 +972,8 @@ class DetailedAnalyticsService:
         )
         by_priority = {f"P{row['priority']}": row['count'] for row in by_priority_qs}
         
-        # By Category (clear ordering to avoid SQL Server GROUP BY conflict)
-        by_category_qs = (
-            base_qs
-            .order_by()
-            .values(category_name=F('category__name'))
-            .annotate(count=Count('id'))
-            .order_by('-count')[:10]
-        )
-        by_category = [
-            {'name': row['category_name'], 'count': row['count']}
-            for row in by_category_qs
-        ]
+        # By Category (top 10, grouped on category_id without a JOIN)
+        by_category = _get_top_categories(base_qs)
         
         # Volume trend (tickets created per day/week/month)
         
@@ -595,24 +991,23 @@ class DetailedAnalyticsService:
             .values('period')
             .annotate(
                 created=Count('id'),
-                closed=Count('id', filter=Q(is_closed=True))
+                closed=_count_where(Q(is_closed=True))
             )
             .order_by('period')
+            .values_list('period', 'created', 'closed')
         )
         volume_trend = [
             {
-                'date': row['period'].isoformat() if row['period'] else None,
-                'created': row['created'],
-                'closed': row['closed'],
+                'date': period.isoformat() if period else None,
+                'created': created,
+                'closed': closed,
             }
-            for row in volume_qs
+            for period, created, closed in volume_qs
         ]
         
         result = {
             'summary': {
-                'total': totals['total'] or 0,
-                'open': totals['open_count'] or 0,
-                'closed': totals['closed_count'] or 0,
+                **totals,
                 'avg_resolution_hours': avg_resolution_hours,
             },
             'by_company': by_company,
@@ -624,7 +1019,6 @@ class DetailedAnalyticsService:
             'resolution_trend': [],  # Simplified for now
         }
         
-        cache.set(cache_key, result, CACHE_TTL_SECONDS)
         return result
 
 
@@ -667,92 +1061,206 @@ class EmployeeDetailedAnalyticsService:
         Raises:
             ResourceNotFoundError: If target user not found or not accessible
         """
-        # Check cache first
-        cache_key = _get_employee_detailed_cache_key(target_user_id, start_date, end_date)
-        cached_data = cache.get(cache_key)
-        if cached_data is not None:
-            return cached_data
+        # RBAC runs before the cache read - the cache key is per target
+        # employee, so a hit must not bypass the access check
+        EmployeeDetailedAnalyticsService._check_access(requesting_user, target_user_id)
+        
+        version = _get_assignee_version(target_user_id)
+        return _cache_get_or_compute(
+            _get_employee_detailed_cache_key(target_user_id, version, start_date, end_date),
+            CACHE_TTL_SECONDS,
+            lambda: EmployeeDetailedAnalyticsService._compute_employee_detailed_analytics(
+                target_user_id, start_date, end_date
+            ),
+        )
+    
+    @staticmethod
+    def _check_access(requesting_user: User, target_user_id: str) -> None:
+        """
+        RBAC: employees see only themselves, managers only their team members.
         
-        # Get target user
-        try:
-            target_user = User.objects.get(id=target_user_id)
-        except User.DoesNotExist:
+        Raises:
+            ResourceNotFoundError: If the target is not accessible (SEC-06)
+        """
+        # Self access needs no queries; a manager must manage the employee's team
+        allowed = (
+            str(requesting_user.id) == str(target_user_id)
+            or (
+                has_any_role(requesting_user, RoleConstants.MANAGER_OR_ABOVE)
+                and ManagerAnalyticsService.is_team_member(requesting_user, target_user_id)
+            )
+        )
+        if not allowed:
             raise ResourceNotFoundError("Employee not found")
+    
+    @staticmethod
+    def _get_daily_series(target_user_id: str, start_date, end_date) -> List[tuple]:
+        """
+        Per-day ticket counts for an employee, served from month buckets.
         
-        # RBAC: Check access
-        is_self = str(requesting_user.id) == str(target_user_id)
-        is_manager = has_any_role(requesting_user, [RoleConstants.MANAGER, RoleConstants.ADMIN])
+        Each bucket holds one calendar month of
+        (day, status, category_id, count, closed_count, resolved_count,
+        resolution_hours) rows - resolved_count and resolution_hours cover
+        only closed tickets with a closed_at and is cached for DAILY_SERIES_CACHE_TTL_SECONDS under a
+        per-month version that Ticket signals bump. Any date range reuses
+        the buckets it overlaps, so adjacent and shifted ranges hit the
+        cache, and a ticket write recomputes only its creation month.
         
-        if not is_self and is_manager:
-            # Manager must be managing this employee's team
-            team_member_ids = ManagerAnalyticsService.get_team_member_ids(requesting_user)
-            if target_user.id not in team_member_ids:
-                raise ResourceNotFoundError("Employee not found")
-        elif not is_self:
-            raise ResourceNotFoundError("Employee not found")
+        Cost: two get_many calls, plus at most one GROUP BY over the span
+        of missing months (index-only on IX_Ticket_AssigneeCreated).
         
-        logger.debug(f"Computing detailed analytics for employee: {target_user_id}")
+        Returns:
+            Rows whose day falls in start_date..end_date inclusive
+        """
+        months = []
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            months.append((year, month))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        
+        # Month versions - a missing counter starts at the clock (see
+        # _get_assignee_version), so a write racing this read lands on a
+        # new version and the bucket set below is never served stale
+        version_keys = {
+            _get_daily_series_version_key(target_user_id, year, month): (year, month)
+            for year, month in months
+        }
+        versions = {version_keys[key]: value for key, value in cache.get_many(version_keys).items()}
+        for key, year_month in version_keys.items():
+            if year_month not in versions:
+                version = time.time_ns()
+                if not cache.add(key, version, None):
+                    version = cache.get(key, version)
+                versions[year_month] = version
+        
+        bucket_keys = {
+            _get_daily_series_cache_key(target_user_id, year, month, versions[(year, month)]): (year, month)
+            for year, month in months
+        }
+        buckets = {bucket_keys[key]: rows for key, rows in cache.get_many(bucket_keys).items()}
+        
+        missing = [year_month for year_month in months if year_month not in buckets]
+        if missing:
+            first_year, first_month = missing[0]
+            last_year, last_month = missing[-1]
+            next_month = (
+                datetime(last_year + 1, 1, 1) if last_month == 12
+                else datetime(last_year, last_month + 1, 1)
+            )
+            # Uses IX_Ticket_AssigneeCreated (assigned_to, created_at) -
+            # every column read is included, so the scan is index-only
+            rows_qs = (
+                Ticket.objects.filter(
+                    assigned_to_id=target_user_id,
+                    **_get_created_at_range(
+                        datetime(first_year, first_month, 1).date(),
+                        (next_month - timedelta(days=1)).date(),
+                    )
+                )
+                .order_by()
+                .annotate(day=TruncDate('created_at'))
+                .values('day', 'status', 'category_id')
+                .annotate(
+                    count=Count('id'),
+                    closed_count=_count_where(Q(is_closed=True)),
+                    resolved_count=_count_where(Q(is_closed=True, closed_at__isnull=False)),
+                    resolution_hours=Sum(_ResolutionHours(), filter=Q(is_closed=True)),
+                )
+                .values_list(
+                    'day', 'status', 'category_id', 'count', 'closed_count',
+                    'resolved_count', 'resolution_hours'
+                )
+            )
+            fetched = {year_month: [] for year_month in missing}
+            for row in rows_qs:
+                # Months between missing ones that were cached are discarded
+                month_rows = fetched.get((row[0].year, row[0].month))
+                if month_rows is not None:
+                    month_rows.append(row)
+            buckets.update(fetched)
+            cache.set_many(
+                {
+                    _get_daily_series_cache_key(target_user_id, year, month, versions[(year, month)]): rows
+                    for (year, month), rows in fetched.items()
+                },
+                DAILY_SERIES_CACHE_TTL_SECONDS,
+            )
         
-        # Base queryset
-        base_qs = Ticket.objects.filter(
-            assigned_to_id=target_user_id,
-            created_at__date__gte=start_date,
-            created_at__date__lte=end_date
-        ).select_related('category')
+        return [
+            row
+            for year_month in months
+            for row in buckets[year_month]
+            if start_date <= row[0] <= end_date
+        ]
+    
+    @staticmethod
+    def _compute_employee_detailed_analytics(
+        target_user_id: str,
+        start_date,
+        end_date
+    ) -> Dict[str, Any]:
+        """Compute employee detailed analytics from the cached daily series."""
+        # Get target user (only the columns used in the response)
+        try:
+            target_user = User.objects.only('id', 'name', 'email').get(id=target_user_id)
+        except User.DoesNotExist:
+            raise ResourceNotFoundError("Employee not found")
         
-        # Summary
-        totals = base_qs.aggregate(
-            total=Count('id'),
-            open_count=Count('id', filter=Q(is_closed=False)),
-            closed_count=Count('id', filter=Q(is_closed=True)),
-        )
+        logger.debug(f"Computing detailed analytics for employee: {target_user_id}")
         
-        # Avg resolution
-        duration_expr = ExpressionWrapper(
-            F('closed_at') - F('created_at'),
-            output_field=DurationField()
-        )
-        avg_res = base_qs.filter(is_closed=True).aggregate(avg_hours=Avg(duration_expr))
+        # Summary / By Week / By Status / By Category - all rolled up in
+        # Python from the day-grain series. Weeks start on Monday, matching
+        # TruncWeek, at midnight in the current timezone.
+        total = closed = resolved = 0
+        resolution_hours = 0.0
+        weeks = {}
+        by_status = {}
+        category_counts = {}
+        for day, status, category_id, count, closed_count, resolved_count, hours in (
+            EmployeeDetailedAnalyticsService._get_daily_series(
+                target_user_id, start_date, end_date
+            )
+        ):
+            total += count
+            closed += closed_count
+            resolved += resolved_count
+            if hours is not None:
+                resolution_hours += hours
+            week_start = day - timedelta(days=day.weekday())
+            week = weeks.get(week_start)
+            if week is None:
+                week = weeks[week_start] = [0, 0]
+            week[0] += count
+            week[1] += closed_count
+            by_status[status] = by_status.get(status, 0) + count
+            category_counts[category_id] = category_counts.get(category_id, 0) + count
+        
+        # Averaged over closed tickets with a closed_at only, as AVG() skips
+        # the NULL durations of the rest
         avg_resolution_hours = None
-        if avg_res['avg_hours']:
-            avg_resolution_hours = round(avg_res['avg_hours'].total_seconds() / 3600, 2)
+        if resolved:
+            avg_resolution_hours = round(resolution_hours / resolved, 2)
         
-        # By Week
-        by_week_qs = (
-            base_qs
-            .order_by()
-            .annotate(week_start=TruncWeek('created_at'))
-            .values('week_start')
-            .annotate(
-                assigned=Count('id'),
-                resolved=Count('id', filter=Q(is_closed=True))
-            )
-            .order_by('week_start')
-        )
+        midnight = datetime.min.time()
         by_week = [
             {
-                'week_start': row['week_start'].isoformat() if row['week_start'] else None,
-                'assigned': row['assigned'],
-                'resolved': row['resolved'],
+                'week_start': timezone.make_aware(datetime.combine(week_start, midnight)).isoformat(),
+                'assigned': assigned,
+                'resolved': resolved,
             }
-            for row in by_week_qs
+            for week_start, (assigned, resolved) in sorted(weeks.items(), key=lambda item: item[0])
         ]
         
-        # By Status (clear ordering to avoid SQL Server GROUP BY conflict)
-        by_status_qs = base_qs.order_by().values('status').annotate(count=Count('id'))
-        by_status = {row['status']: row['count'] for row in by_status_qs}
-        
-        # By Category (clear ordering to avoid SQL Server GROUP BY conflict)
-        by_category_qs = (
-            base_qs
-            .order_by()
-            .values(category_name=F('category__name'))
-            .annotate(count=Count('id'))
-            .order_by('-count')[:10]
+        # Top 10 categories by count, names from the cached category map
+        top_categories = sorted(
+            category_counts.items(), key=lambda item: item[1], reverse=True
+        )[:10]
+        category_names = _get_category_names(
+            [category_id for category_id, _ in top_categories]
         )
         by_category = [
-            {'name': row['category_name'], 'count': row['count']}
-            for row in by_category_qs
+            {'name': category_names.get(category_id), 'count': count}
+            for category_id, count in top_categories
         ]
         
         result = {
@@ -762,9 +1270,9 @@ class EmployeeDetailedAnalyticsService:
                 'email': target_user.email,
             },
             'summary': {
-                'total': totals['total'] or 0,
-                'open': totals['open_count'] or 0,
-                'closed': totals['closed_count'] or 0,
+                'total': total,
+                'open': total - closed,
+                'closed': closed,
                 'avg_resolution_hours': avg_resolution_hours,
             },
             'by_week': by_week,
@@ -772,6 +1280,54 @@ class EmployeeDetailedAnalyticsService:
             'by_category': by_category,
         }
         
-        cache.set(cache_key, result, CACHE_TTL_SECONDS)
         return result
 
+
+# =============================================================================
+# EMPLOYEE DASHBOARD BUNDLE
+# =============================================================================
+
+class EmployeeDashboardService:
+    """
+    Employee dashboard widgets (summary + detailed) in one call.
+    
+    Both cached entries are read with a single cache.get_many() (one
+    Redis MGET) instead of one round trip per endpoint; misses and
+    entries due for early refresh go through _cache_get_or_compute as
+    usual. Self-view only, so no RBAC beyond the view permission.
+    """
+    
+    @staticmethod
+    def get_employee_dashboard(user: User, start_date, end_date) -> Dict[str, Any]:
+        """
+        Get employee summary and detailed analytics together.
+        
+        Args:
+            user: The employee (request user)
+            start_date: Start date for the detailed analytics
+            end_date: End date for the detailed analytics
+            
+        Returns:
+            {'summary': employee analytics, 'detailed': employee detailed analytics}
+        """
+        version = _get_assignee_version(user.id)
+        summary_key = _get_employee_cache_key(user.id, version)
+        detailed_key = _get_employee_detailed_cache_key(user.id, version, start_date, end_date)
+        entries = cache.get_many([summary_key, detailed_key])
+        
+        return {
+            'summary': _cache_get_or_compute(
+                summary_key,
+                CACHE_TTL_SECONDS,
+                lambda: EmployeeAnalyticsService._compute_employee_analytics(user),
+                prefetched=entries.get(summary_key),
+            ),
+            'detailed': _cache_get_or_compute(
+                detailed_key,
+                CACHE_TTL_SECONDS,
+                lambda: EmployeeDetailedAnalyticsService._compute_employee_detailed_analytics(
+                    str(user.id), start_date, end_date
+                ),
+                prefetched=entries.get(detailed_key),
+            ),
+        }
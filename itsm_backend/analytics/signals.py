@@ -0,0 +1,42 @@
+"""
+Analytics Signal Handlers
+
+Keeps cached analytics lookup data consistent:
+- Category save/delete invalidates the cached category id -> name map
+- Ticket save/delete bumps the assignee's analytics version (and the
+  previous assignee's on reassign), invalidating employee analytics and
+  the daily series bucket for the ticket's creation month
+"""
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+from tickets.models import Category, Ticket
+from .services import invalidate_assignee_analytics, invalidate_cached_category_names
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_names_cache(sender, instance, **kwargs):
+    """Drop the cached category names after a category change"""
+    invalidate_cached_category_names()
+
+
+@receiver(pre_save, sender=Ticket)
+def invalidate_previous_assignee_analytics(sender, instance, **kwargs):
+    """Invalidate the old assignee's analytics when a ticket is reassigned"""
+    if instance._state.adding:
+        return
+    previous_assignee_id = (
+        Ticket.objects.filter(pk=instance.pk)
+        .values_list('assigned_to_id', flat=True)
+        .first()
+    )
+    if previous_assignee_id is not None and previous_assignee_id != instance.assigned_to_id:
+        invalidate_assignee_analytics(previous_assignee_id, instance.created_at)
+
+
+@receiver(post_save, sender=Ticket)
+@receiver(post_delete, sender=Ticket)
+def invalidate_assignee_analytics_cache(sender, instance, **kwargs):
+    """Invalidate the assignee's analytics after a ticket change"""
+    if instance.assigned_to_id is not None:
+        invalidate_assignee_analytics(instance.assigned_to_id, instance.created_at)
@@ -7,6 +7,7 @@ Wire analytics endpoints:
 - /api/analytics/manager/detailed/ - Detailed manager analytics
 - /api/analytics/employee/detailed/ - Employee self-view detailed
 - /api/analytics/employee/<id>/detailed/ - Manager view of team member
+- /api/analytics/employee/bundle/ - Employee summary + detailed (one cache read)
 """
 from django.urls import path
 from .views import (
@@ -15,6 +16,7 @@ from .views import (
     DetailedAnalyticsView,
     EmployeeDetailedAnalyticsView,
     EmployeePerformanceView,
+    EmployeeDashboardBundleView,
 )
 
 urlpatterns = [
@@ -26,5 +28,6 @@ urlpatterns = [
     path('analytics/manager/detailed/', DetailedAnalyticsView.as_view(), name='manager-detailed-analytics'),
     path('analytics/employee/detailed/', EmployeeDetailedAnalyticsView.as_view(), name='employee-detailed-analytics'),
     path('analytics/employee/<uuid:employee_id>/detailed/', EmployeePerformanceView.as_view(), name='employee-performance'),
+    path('analytics/employee/bundle/', EmployeeDashboardBundleView.as_view(), name='employee-dashboard-bundle'),
 ]
 
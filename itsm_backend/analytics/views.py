@@ -7,23 +7,82 @@ GET /api/analytics/manager/team-summary/ - Manager analytics
 GET /api/analytics/manager/detailed/ - Detailed manager analytics with date range
 GET /api/analytics/employee/detailed/ - Employee detailed self-view
 GET /api/analytics/employee/<id>/detailed/ - Manager view of employee (for team)
+GET /api/analytics/employee/bundle/ - Employee summary + detailed in one call
+
+All endpoints send an ETag over the JSON body and answer a matching
+If-None-Match with 304 Not Modified, so polling dashboards re-download
+only when their analytics change.
 """
-from datetime import datetime
+import hashlib
+from django.utils.cache import patch_cache_control, patch_vary_headers
+from django.utils.http import parse_etags
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework import status
 from drf_spectacular.utils import extend_schema, OpenApiResponse, OpenApiParameter
 
+from core.exceptions import ValidationError
 from core.permissions import IsEmployee, IsManager
+from core.renderers import ORJSONRenderer, render_json
+from .serializers import AnalyticsDateRangeSerializer
 from .services import (
     EmployeeAnalyticsService,
     ManagerAnalyticsService,
     DetailedAnalyticsService,
     EmployeeDetailedAnalyticsService,
+    EmployeeDashboardService,
 )
 
 
+def _get_date_range(request, check_order=True):
+    """
+    Parse the start_date / end_date query parameters.
+    
+    Args:
+        request: The API request
+        check_order: Reject start_date > end_date
+        
+    Returns:
+        (start_date, end_date) dates
+        
+    Raises:
+        ValidationError: Missing, malformed or reversed dates (400 with a
+            single message, no per-field details)
+    """
+    serializer = AnalyticsDateRangeSerializer(
+        data=request.query_params, context={'check_order': check_order}
+    )
+    if not serializer.is_valid():
+        raise ValidationError(next(iter(serializer.errors.values()))[0])
+    return serializer.validated_data['start_date'], serializer.validated_data['end_date']
+
+
+def _conditional_response(request, data) -> Response:
+    """
+    Response with an ETag, or 304 when If-None-Match already has it.
+    
+    The body is encoded once: the bytes hashed for the ETag are reused by
+    ORJSONRenderer. Cache-Control is private/no-cache - browsers keep the
+    copy but revalidate every poll, so cache invalidation is never masked
+    by a max-age. Vary: Authorization since the body is per user.
+    """
+    body = render_json(data)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    
+    if etag in parse_etags(request.META.get('HTTP_IF_NONE_MATCH', '')):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data)
+        response.rendered_json = body
+    
+    response['ETag'] = etag
+    patch_cache_control(response, private=True, no_cache=True)
+    patch_vary_headers(response, ['Authorization'])
+    return response
+
+
 class EmployeeAnalyticsView(APIView):
     """
     GET /api/analytics/employee/summary/
@@ -31,6 +90,7 @@ class EmployeeAnalyticsView(APIView):
     Returns analytics for employee's assigned tickets.
     """
     permission_classes = [IsAuthenticated, IsEmployee]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     
     @extend_schema(
         tags=['analytics'],
@@ -38,13 +98,14 @@ class EmployeeAnalyticsView(APIView):
         description='Returns analytics for tickets assigned to the current employee.',
         responses={
             200: OpenApiResponse(description='Employee analytics data'),
+            304: OpenApiResponse(description='Not modified (If-None-Match)'),
             401: OpenApiResponse(description='Not authenticated'),
             403: OpenApiResponse(description='Not an employee'),
         }
     )
     def get(self, request):
         data = EmployeeAnalyticsService.get_employee_analytics(request.user)
-        return Response(data)
+        return _conditional_response(request, data)
 
 
 class ManagerAnalyticsView(APIView):
@@ -54,6 +115,7 @@ class ManagerAnalyticsView(APIView):
     Returns analytics for manager's team.
     """
     permission_classes = [IsAuthenticated, IsManager]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     
     @extend_schema(
         tags=['analytics'],
@@ -61,13 +123,14 @@ class ManagerAnalyticsView(APIView):
         description='Returns analytics for tickets assigned to team members.',
         responses={
             200: OpenApiResponse(description='Manager analytics data'),
+            304: OpenApiResponse(description='Not modified (If-None-Match)'),
             401: OpenApiResponse(description='Not authenticated'),
             403: OpenApiResponse(description='Not a manager'),
         }
     )
     def get(self, request):
         data = ManagerAnalyticsService.get_manager_analytics(request.user)
-        return Response(data)
+        return _conditional_response(request, data)
 
 
 class DetailedAnalyticsView(APIView):
@@ -77,6 +140,7 @@ class DetailedAnalyticsView(APIView):
     Returns detailed analytics with date range and org breakdown.
     """
     permission_classes = [IsAuthenticated, IsManager]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     
     @extend_schema(
         tags=['analytics'],
@@ -89,6 +153,7 @@ class DetailedAnalyticsView(APIView):
         ],
         responses={
             200: OpenApiResponse(description='Detailed analytics data'),
+            304: OpenApiResponse(description='Not modified (If-None-Match)'),
             400: OpenApiResponse(description='Invalid date parameters'),
             401: OpenApiResponse(description='Not authenticated'),
             403: OpenApiResponse(description='Not a manager'),
@@ -96,35 +161,13 @@ class DetailedAnalyticsView(APIView):
     )
     def get(self, request):
         # Parse date parameters
-        start_date_str = request.query_params.get('start_date')
-        end_date_str = request.query_params.get('end_date')
+        start_date, end_date = _get_date_range(request)
         group_by = request.query_params.get('group_by', 'auto')
         
-        if not start_date_str or not end_date_str:
-            return Response(
-                {'error': {'code': 'VALIDATION_ERROR', 'message': 'start_date and end_date are required'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-        except ValueError:
-            return Response(
-                {'error': {'code': 'VALIDATION_ERROR', 'message': 'Invalid date format. Use YYYY-MM-DD'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        if start_date > end_date:
-            return Response(
-                {'error': {'code': 'VALIDATION_ERROR', 'message': 'start_date must be before end_date'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
         data = DetailedAnalyticsService.get_detailed_analytics(
             request.user, start_date, end_date, group_by
         )
-        return Response(data)
+        return _conditional_response(request, data)
 
 
 class EmployeeDetailedAnalyticsView(APIView):
@@ -134,6 +177,7 @@ class EmployeeDetailedAnalyticsView(APIView):
     Returns detailed analytics for the current employee (self-view).
     """
     permission_classes = [IsAuthenticated, IsEmployee]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     
     @extend_schema(
         tags=['analytics'],
@@ -145,34 +189,19 @@ class EmployeeDetailedAnalyticsView(APIView):
         ],
         responses={
             200: OpenApiResponse(description='Employee detailed analytics'),
+            304: OpenApiResponse(description='Not modified (If-None-Match)'),
             400: OpenApiResponse(description='Invalid date parameters'),
             401: OpenApiResponse(description='Not authenticated'),
             403: OpenApiResponse(description='Not an employee'),
         }
     )
     def get(self, request):
-        start_date_str = request.query_params.get('start_date')
-        end_date_str = request.query_params.get('end_date')
-        
-        if not start_date_str or not end_date_str:
-            return Response(
-                {'error': {'code': 'VALIDATION_ERROR', 'message': 'start_date and end_date are required'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-        except ValueError:
-            return Response(
-                {'error': {'code': 'VALIDATION_ERROR', 'message': 'Invalid date format. Use YYYY-MM-DD'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        start_date, end_date = _get_date_range(request, check_order=False)
         
         data = EmployeeDetailedAnalyticsService.get_employee_detailed_analytics(
             request.user, str(request.user.id), start_date, end_date
         )
-        return Response(data)
+        return _conditional_response(request, data)
 
 
 class EmployeePerformanceView(APIView):
@@ -183,6 +212,7 @@ class EmployeePerformanceView(APIView):
     Manager can view team members. Employee can view self only.
     """
     permission_classes = [IsAuthenticated, IsEmployee]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
     
     @extend_schema(
         tags=['analytics'],
@@ -194,32 +224,52 @@ class EmployeePerformanceView(APIView):
         ],
         responses={
             200: OpenApiResponse(description='Employee performance data'),
+            304: OpenApiResponse(description='Not modified (If-None-Match)'),
             400: OpenApiResponse(description='Invalid date parameters'),
             401: OpenApiResponse(description='Not authenticated'),
             404: OpenApiResponse(description='Employee not found or not accessible'),
         }
     )
     def get(self, request, employee_id):
-        start_date_str = request.query_params.get('start_date')
-        end_date_str = request.query_params.get('end_date')
-        
-        if not start_date_str or not end_date_str:
-            return Response(
-                {'error': {'code': 'VALIDATION_ERROR', 'message': 'start_date and end_date are required'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
-        
-        try:
-            start_date = datetime.strptime(start_date_str, '%Y-%m-%d').date()
-            end_date = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-        except ValueError:
-            return Response(
-                {'error': {'code': 'VALIDATION_ERROR', 'message': 'Invalid date format. Use YYYY-MM-DD'}},
-                status=status.HTTP_400_BAD_REQUEST
-            )
+        start_date, end_date = _get_date_range(request, check_order=False)
         
         data = EmployeeDetailedAnalyticsService.get_employee_detailed_analytics(
             request.user, str(employee_id), start_date, end_date
         )
-        return Response(data)
+        return _conditional_response(request, data)
 
+
+
+class EmployeeDashboardBundleView(APIView):
+    """
+    GET /api/analytics/employee/bundle/
+    
+    Returns the employee summary and detailed analytics together, read
+    from the cache in one round trip. The separate endpoints remain.
+    """
+    permission_classes = [IsAuthenticated, IsEmployee]
+    renderer_classes = [ORJSONRenderer, BrowsableAPIRenderer]
+    
+    @extend_schema(
+        tags=['analytics'],
+        summary='Get employee dashboard bundle',
+        description='Returns employee summary and detailed self-analytics (date range required) in a single response.',
+        parameters=[
+            OpenApiParameter(name='start_date', type=str, required=True, description='Start date (YYYY-MM-DD)'),
+            OpenApiParameter(name='end_date', type=str, required=True, description='End date (YYYY-MM-DD)'),
+        ],
+        responses={
+            200: OpenApiResponse(description='{"summary": ..., "detailed": ...}'),
+            304: OpenApiResponse(description='Not modified (If-None-Match)'),
+            400: OpenApiResponse(description='Invalid date parameters'),
+            401: OpenApiResponse(description='Not authenticated'),
+            403: OpenApiResponse(description='Not an employee'),
+        }
+    )
+    def get(self, request):
+        start_date, end_date = _get_date_range(request)
+        
+        data = EmployeeDashboardService.get_employee_dashboard(
+            request.user, start_date, end_date
+        )
+        return _conditional_response(request, data)
@@ -7,15 +7,132 @@ Features:
 - Non-blocking audit log creation
 - Automatic request context extraction
 - Cross-reference with application logs via request_id
+
+Entries are INSERTed synchronously by default. With AUDIT_LOG_ASYNC=True,
+AuditService.log() instead hands an unsaved AuditLog to a bounded
+in-process queue once the surrounding transaction commits, and a daemon
+thread drains the queue with bulk_create, taking the INSERT off the
+request path. Queued entries live only in process memory: a SIGKILL or
+OOM kill loses them, so async mode is opt-in.
 """
+import atexit
 import logging
-from typing import Optional, Dict, Any
+import os
+import queue
+import threading
+import time
+from typing import Optional, Dict, Any, List
+from django.conf import settings
+from django.db import close_old_connections, transaction
 from django.http import HttpRequest
 from core.logging import get_request_id, get_user_id, get_user_roles
 from core.models import AuditLog
 
 logger = logging.getLogger('core.audit')
 
+# Queue bound - beyond this, log() falls back to a synchronous INSERT
+AUDIT_QUEUE_MAXSIZE = 10000
+# Max rows per bulk_create
+AUDIT_BATCH_SIZE = 500
+# How long the worker waits for more entries before flushing a partial batch
+AUDIT_FLUSH_INTERVAL_SECONDS = 0.1
+
+
+class AuditLogWriter:
+    """
+    Bounded queue of unsaved AuditLog rows drained by a background thread.
+    
+    The worker is started lazily on first submit (and restarted after a
+    fork, since threads do not survive into pre-forked WSGI workers).
+    Entries still queued at interpreter exit are flushed by an atexit hook.
+    """
+    
+    def __init__(self, maxsize: int = AUDIT_QUEUE_MAXSIZE):
+        self._queue: queue.Queue = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._pid: Optional[int] = None
+    
+    def submit(self, entry: AuditLog) -> None:
+        """
+        Queue an entry for the next batch.
+        
+        On queue-full the entry is written synchronously so audit events
+        are never silently dropped.
+        """
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            logger.warning("Audit queue full - writing entry synchronously")
+            self._write([entry])
+    
+    def flush(self) -> None:
+        """Write every queued entry on the calling thread."""
+        while True:
+            batch = self._drain(block=False)
+            if not batch:
+                return
+            self._write(batch)
+    
+    def _ensure_worker(self) -> None:
+        pid = os.getpid()
+        if self._thread is not None and self._pid == pid and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid != pid:
+                # Forked child - the parent's queue and thread are not ours
+                self._queue = queue.Queue(maxsize=self._queue.maxsize)
+                self._thread = None
+            if self._thread is None or not self._thread.is_alive():
+                self._pid = pid
+                self._thread = threading.Thread(
+                    target=self._run, name='audit-log-writer', daemon=True
+                )
+                self._thread.start()
+    
+    def _run(self) -> None:
+        while True:
+            batch = self._drain(block=True)
+            if batch:
+                self._write(batch)
+    
+    def _drain(self, block: bool) -> List[AuditLog]:
+        """Collect up to AUDIT_BATCH_SIZE entries."""
+        batch = []
+        try:
+            if not block:
+                while len(batch) < AUDIT_BATCH_SIZE:
+                    batch.append(self._queue.get_nowait())
+                return batch
+            # Wait for the first entry, then at most one flush interval
+            # for the rest of the batch
+            batch.append(self._queue.get())
+            deadline = time.monotonic() + AUDIT_FLUSH_INTERVAL_SECONDS
+            while len(batch) < AUDIT_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                batch.append(self._queue.get(timeout=remaining))
+        except queue.Empty:
+            pass
+        return batch
+    
+    def _write(self, batch: List[AuditLog]) -> None:
+        try:
+            close_old_connections()
+            AuditLog.objects.bulk_create(batch, batch_size=AUDIT_BATCH_SIZE)
+        except Exception as e:
+            # Log error but don't propagate - audit failures shouldn't break operations
+            logger.error(
+                f"Audit log batch write failed: {len(batch)} entries - {str(e)}",
+                exc_info=True
+            )
+
+
+_writer = AuditLogWriter()
+atexit.register(_writer.flush)
+
 
 # Event type constants
 class AuditEventType:
@@ -77,11 +194,14 @@ class AuditService:
             request: HTTP request for extracting IP/user agent
         
         Returns:
-            Created AuditLog instance, or None if creation fails
+            AuditLog instance (saved, or queued for write when
+            AUDIT_LOG_ASYNC is True), or None if creation fails
         
         Note:
             This method is designed to be non-blocking. If audit log
-            creation fails, it logs an error but does not raise.
+            creation fails, it logs an error but does not raise. Async
+            entries are queued on transaction commit, so a rolled-back
+            operation leaves no audit row - as with the synchronous INSERT.
         """
         try:
             # Get request_id from thread-local or request
@@ -102,11 +222,7 @@ class AuditService:
                 # Get roles from thread-local or compute
                 roles = get_user_roles()
                 if not roles and hasattr(actor, 'user_roles'):
-                    from accounts.models import UserRole
-                    roles = list(
-                        UserRole.objects.filter(user=actor)
-                        .values_list('role__name', flat=True)
-                    )
+                    roles = AuditService._get_actor_roles(actor)
                 actor_roles = ','.join(str(r) for r in roles) if roles else None
             
             # Extract client information from request
@@ -117,8 +233,8 @@ class AuditService:
                 ip_address = AuditService._get_client_ip(request)
                 user_agent = request.headers.get('User-Agent', '')[:500]
             
-            # Create audit log entry
-            audit_log = AuditLog.objects.create(
+            # Build audit log entry (id is assigned client-side)
+            audit_log = AuditLog(
                 event_type=event_type,
                 entity_type=entity_type,
                 entity_id=entity_id,
@@ -131,17 +247,24 @@ class AuditService:
                 user_agent=user_agent
             )
             
-            logger.debug(
-                f"Audit logged: {event_type} on {entity_type}:{entity_id}",
-                extra={
-                    'extra_data': {
-                        'audit_id': str(audit_log.id),
-                        'event_type': event_type,
-                        'entity_type': entity_type,
-                        'entity_id': str(entity_id),
+            if getattr(settings, 'AUDIT_LOG_ASYNC', False):
+                transaction.on_commit(lambda: _writer.submit(audit_log))
+            else:
+                audit_log.save(force_insert=True)
+            
+            # Guarded - the message and extra dict are built on every call otherwise
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Audit logged: {event_type} on {entity_type}:{entity_id}",
+                    extra={
+                        'extra_data': {
+                            'audit_id': str(audit_log.id),
+                            'event_type': event_type,
+                            'entity_type': entity_type,
+                            'entity_id': str(entity_id),
+                        }
                     }
-                }
-            )
+                )
             
             return audit_log
             
@@ -153,17 +276,49 @@ class AuditService:
             )
             return None
     
+    @staticmethod
+    def _get_actor_roles(actor) -> List[str]:
+        """
+        Role names for an actor outside a request context (system paths).
+        
+        Memoized on the actor instance so a mutation that emits several
+        audit events (assign + status change + ...) looks roles up once;
+        the lookup itself goes through the shared roles cache, which
+        UserRole signals invalidate.
+        """
+        roles = getattr(actor, '_audit_roles', None)
+        if roles is None:
+            from accounts.services import AuthService
+            roles = AuthService.get_user_roles(actor)
+            actor._audit_roles = roles
+        return roles
+    
     @staticmethod
     def _get_client_ip(request: HttpRequest) -> Optional[str]:
-        """Extract client IP, handling proxies."""
+        """
+        Extract client IP, handling proxies.
+        
+        Memoized on the request - several log_* calls may fire per request.
+        partition() takes the first X-Forwarded-For hop without splitting
+        the whole proxy chain into a list.
+        """
+        try:
+            return request._audit_client_ip
+        except AttributeError:
+            pass
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
         if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
-        return request.META.get('REMOTE_ADDR')
+            ip_address = x_forwarded_for.partition(',')[0].strip()
+        else:
+            ip_address = request.META.get('REMOTE_ADDR')
+        request._audit_client_ip = ip_address
+        return ip_address
     
     # =========================================================================
     # CONVENIENCE METHODS
     # =========================================================================
+    # UUIDs go into payloads as-is: AuditLog.payload encodes them with
+    # DjangoJSONEncoder, so the stored JSON is unchanged.
     
     @staticmethod
     def log_ticket_create(ticket, actor, request=None):
@@ -176,8 +331,8 @@ class AuditService:
             payload={
                 'ticket_number': ticket.ticket_number,
                 'title': ticket.title,
-                'category': str(ticket.category_id),
-                'subcategory': str(ticket.subcategory_id),
+                'category': ticket.category_id,
+                'subcategory': ticket.subcategory_id,
                 'status': ticket.status,
             },
             request=request
@@ -193,7 +348,7 @@ class AuditService:
             actor=actor,
             payload={
                 'ticket_number': ticket.ticket_number,
-                'assigned_to_id': str(assigned_to.id),
+                'assigned_to_id': assigned_to.id,
                 'assigned_to_name': assigned_to.name,
             },
             request=request
@@ -209,9 +364,9 @@ class AuditService:
             actor=actor,
             payload={
                 'ticket_number': ticket.ticket_number,
-                'old_assignee_id': str(old_assignee.id) if old_assignee else None,
+                'old_assignee_id': old_assignee.id if old_assignee else None,
                 'old_assignee_name': old_assignee.name if old_assignee else None,
-                'new_assignee_id': str(new_assignee.id),
+                'new_assignee_id': new_assignee.id,
                 'new_assignee_name': new_assignee.name,
             },
             request=request
@@ -293,7 +448,7 @@ class AuditService:
             payload={
                 'sender_email': email.sender_email,
                 'subject': email.subject,
-                'ticket_id': str(ticket.id),
+                'ticket_id': ticket.id,
                 'ticket_number': ticket.ticket_number,
             },
             request=request
@@ -324,7 +479,7 @@ class AuditService:
             entity_id=attachment.id,
             actor=actor,
             payload={
-                'ticket_id': str(attachment.ticket_id),
+                'ticket_id': attachment.ticket_id,
                 'file_name': attachment.file_name,
                 'file_size': attachment.file_size,
                 'file_type': attachment.file_type,
@@ -341,7 +496,7 @@ class AuditService:
             entity_id=attachment.id,
             actor=actor,
             payload={
-                'ticket_id': str(attachment.ticket_id),
+                'ticket_id': attachment.ticket_id,
                 'file_name': attachment.file_name,
             },
             request=request
@@ -0,0 +1,35 @@
+"""
+Core Cache Helpers
+
+CompressedRedisSerializer: value serializer for Django's RedisCache.
+
+- Same pickle format as Django's RedisSerializer, so cached model
+  instances, UUIDs and datetimes round-trip unchanged
+- Payloads of COMPRESS_MIN_BYTES or more (analytics dashboards) are
+  zlib-compressed, cutting Redis memory and bytes on every cache hit
+- Plain ints stay uncompressed so incr()/decr() keep working
+"""
+import pickle
+import zlib
+from django.core.cache.backends.redis import RedisSerializer
+
+# Prefix marking a compressed payload. Pickles (protocol >= 2) always
+# start with b'\x80', so the two formats cannot be confused.
+COMPRESSED_PREFIX = b'Z'
+COMPRESS_MIN_BYTES = 1024
+COMPRESS_LEVEL = 1  # Fastest level; dashboard JSON-like data still shrinks 3-5x
+
+
+class CompressedRedisSerializer(RedisSerializer):
+    """Pickle serializer that zlib-compresses large values."""
+    
+    def dumps(self, obj):
+        data = super().dumps(obj)
+        if isinstance(data, bytes) and len(data) >= COMPRESS_MIN_BYTES:
+            return COMPRESSED_PREFIX + zlib.compress(data, COMPRESS_LEVEL)
+        return data
+    
+    def loads(self, data):
+        if data[:1] == COMPRESSED_PREFIX:
+            return pickle.loads(zlib.decompress(data[1:]))
+        return super().loads(data)
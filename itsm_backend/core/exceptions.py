@@ -10,11 +10,14 @@ Error response format:
   }
 }
 """
+import logging
+from functools import lru_cache
+
 from rest_framework.views import exception_handler
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.exceptions import (
-    ValidationError,
+    ValidationError as DRFValidationError,
     AuthenticationFailed,
     NotAuthenticated,
     PermissionDenied,
@@ -23,6 +26,10 @@ from rest_framework.exceptions import (
 from django.http import Http404
 from django.core.exceptions import ObjectDoesNotExist
 
+from core.renderers import render_json
+
+logger = logging.getLogger(__name__)
+
 
 # Error codes matching Phase 3 specification
 class ErrorCode:
@@ -100,7 +107,12 @@ class ValidationError(APIException):
 
 
 def format_error_response(code, message, details=None):
-    """Format error response according to Phase 3 spec"""
+    """
+    Format error response according to Phase 3 spec.
+    
+    Always a fresh dict - Response.data may be modified by the caller
+    after the handler returns, so payloads are never shared.
+    """
     return {
         'error': {
             'code': code,
@@ -110,60 +122,110 @@ def format_error_response(code, message, details=None):
     }
 
 
-def custom_exception_handler(exc, context):
+@lru_cache(maxsize=256)
+def _render_static_error(code, message):
     """
-    Custom exception handler that formats all errors according to Phase 3 spec.
+    Pre-encoded JSON body for a detail-less error.
     
-    SECURITY: Never expose internal details (stack traces, SQL, file paths)
+    Auth probes and 404s emit the same few (code, message) pairs over and
+    over; encode each body once. bytes are immutable, so the cached value
+    is safe to share across responses.
     """
-    # Handle our custom API exceptions
-    if isinstance(exc, APIException):
-        return Response(
-            format_error_response(exc.error_code, exc.message, exc.details),
-            status=exc.status_code
-        )
-    
-    # Handle DRF validation errors
-    if isinstance(exc, ValidationError):
-        details = []
-        if isinstance(exc.detail, dict):
-            for field, messages in exc.detail.items():
-                if isinstance(messages, list):
-                    for msg in messages:
-                        details.append({'field': field, 'message': str(msg)})
-                else:
-                    details.append({'field': field, 'message': str(messages)})
-        elif isinstance(exc.detail, list):
-            for msg in exc.detail:
-                details.append({'field': 'non_field_error', 'message': str(msg)})
-        else:
-            details.append({'field': 'non_field_error', 'message': str(exc.detail)})
-        
-        return Response(
-            format_error_response(ErrorCode.VALIDATION_ERROR, 'Validation failed', details),
-            status=status.HTTP_400_BAD_REQUEST
-        )
+    return render_json(format_error_response(code, message))
+
+
+def _error_response(code, message, details=None, status_code=status.HTTP_400_BAD_REQUEST):
+    """
+    Build an error Response.
     
-    # Handle authentication errors
-    if isinstance(exc, (AuthenticationFailed, NotAuthenticated)):
-        return Response(
-            format_error_response(ErrorCode.UNAUTHORIZED, 'Authentication required'),
-            status=status.HTTP_401_UNAUTHORIZED
-        )
+    Detail-less bodies are fully determined by (code, message), so their
+    encoded bytes are cached and attached as rendered_json for
+    ORJSONRenderer to reuse instead of encoding again. Code that edits
+    response.data afterwards must also drop rendered_json.
+    """
+    response = Response(format_error_response(code, message, details), status=status_code)
+    if not details:
+        response.rendered_json = _render_static_error(code, message)
+    return response
+
+
+def _handle_api_exception(exc, context):
+    """Our custom API exceptions"""
+    return _error_response(exc.error_code, exc.message, exc.details, exc.status_code)
+
+
+def _handle_drf_validation_error(exc, context):
+    """DRF validation errors (serializer.is_valid(raise_exception=True))"""
+    # str() normalizes ErrorDetail (carries a code) and lazy translation
+    # messages to plain strings
+    detail = exc.detail
+    if isinstance(detail, dict):
+        details = [
+            {'field': field, 'message': str(msg)}
+            for field, messages in detail.items()
+            for msg in (messages if isinstance(messages, list) else (messages,))
+        ]
+    elif isinstance(detail, list):
+        details = [{'field': 'non_field_error', 'message': str(msg)} for msg in detail]
+    else:
+        details = [{'field': 'non_field_error', 'message': str(detail)}]
     
-    # Handle permission errors
-    if isinstance(exc, PermissionDenied):
-        return Response(
-            format_error_response(ErrorCode.FORBIDDEN, 'Insufficient permissions'),
-            status=status.HTTP_403_FORBIDDEN
-        )
+    return _error_response(
+        ErrorCode.VALIDATION_ERROR, 'Validation failed', details,
+        status.HTTP_400_BAD_REQUEST
+    )
+
+
+def _handle_authentication_error(exc, context):
+    """Authentication errors"""
+    return _error_response(
+        ErrorCode.UNAUTHORIZED, 'Authentication required',
+        status_code=status.HTTP_401_UNAUTHORIZED
+    )
+
+
+def _handle_permission_error(exc, context):
+    """Permission errors"""
+    return _error_response(
+        ErrorCode.FORBIDDEN, 'Insufficient permissions',
+        status_code=status.HTTP_403_FORBIDDEN
+    )
+
+
+def _handle_not_found_error(exc, context):
+    """Not found errors"""
+    return _error_response(
+        ErrorCode.NOT_FOUND, 'Resource not found',
+        status_code=status.HTTP_404_NOT_FOUND
+    )
+
+
+# Exception class -> handler. custom_exception_handler walks the raised
+# type's MRO, so subclasses (e.g. ResourceNotFoundError, Model.DoesNotExist)
+# resolve to their family with one dict lookup per base class.
+# NOTE: the local ValidationError shadows DRF's - hence DRFValidationError.
+_EXCEPTION_HANDLERS = {
+    APIException: _handle_api_exception,
+    DRFValidationError: _handle_drf_validation_error,
+    AuthenticationFailed: _handle_authentication_error,
+    NotAuthenticated: _handle_authentication_error,
+    PermissionDenied: _handle_permission_error,
+    NotFound: _handle_not_found_error,
+    Http404: _handle_not_found_error,
+    ObjectDoesNotExist: _handle_not_found_error,
+}
+
+
+def custom_exception_handler(exc, context):
+    """
+    Custom exception handler that formats all errors according to Phase 3 spec.
     
-    # Handle not found errors
-    if isinstance(exc, (NotFound, Http404, ObjectDoesNotExist)):
-        return Response(
-            format_error_response(ErrorCode.NOT_FOUND, 'Resource not found'),
-            status=status.HTTP_404_NOT_FOUND
-        )
+    SECURITY: Never expose internal details (stack traces, SQL, file paths)
+    """
+    for exc_class in type(exc).__mro__:
+        handler = _EXCEPTION_HANDLERS.get(exc_class)
+        if handler is not None:
+            return handler(exc, context)
     
     # Use DRF's default handler for other exceptions
     response = exception_handler(exc, context)
@@ -174,18 +236,16 @@ def custom_exception_handler(exc, context):
         if hasattr(response, 'data') and isinstance(response.data, dict):
             error_message = response.data.get('detail', error_message)
         
-        return Response(
-            format_error_response(ErrorCode.INTERNAL_ERROR, str(error_message)),
-            status=response.status_code
+        return _error_response(
+            ErrorCode.INTERNAL_ERROR, str(error_message),
+            status_code=response.status_code
         )
     
     # Unhandled exception - log but don't expose details
     # In production, this should log to a proper logging service
-    import logging
-    logger = logging.getLogger(__name__)
     logger.exception('Unhandled exception: %s', str(exc))
     
-    return Response(
-        format_error_response(ErrorCode.INTERNAL_ERROR, 'An unexpected error occurred'),
-        status=status.HTTP_500_INTERNAL_SERVER_ERROR
+    return _error_response(
+        ErrorCode.INTERNAL_ERROR, 'An unexpected error occurred',
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
     )
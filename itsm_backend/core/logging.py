@@ -4,49 +4,84 @@ Core Logging Configuration - Phase 5B
 Provides:
 - JSON formatter for structured logging
 - Request context filter (request_id, user_id, roles)
-- Thread-local storage for request context
+- Context-local storage for request context (contextvars)
 
 All logs are JSON-formatted for machine parsing (ELK, Splunk, CloudWatch).
 """
-import json
 import logging
-import threading
 import uuid
-from datetime import datetime
-from typing import Optional, List
+from contextvars import ContextVar, Token
+from datetime import datetime, timezone
+from typing import Optional, List, Tuple
 
+import orjson
 
-# Thread-local storage for request context
-_request_context = threading.local()
+
+# Context-local storage for request context. ContextVar follows the
+# request across async views and sync_to_async hand-offs, where a
+# threading.local() would be lost or leak between requests; get() is a
+# C-level lookup on every log record.
+_request_id_var: ContextVar[Optional[str]] = ContextVar('request_id', default=None)
+_user_id_var: ContextVar[Optional[str]] = ContextVar('user_id', default=None)
+_roles_var: ContextVar[Optional[List[str]]] = ContextVar('roles', default=None)
+# roles pre-joined for log records ('-' when empty) - built once per
+# set_request_context() instead of once per record
+_roles_str_var: ContextVar[str] = ContextVar('roles_str', default='-')
 
 
 def get_request_id() -> Optional[str]:
-    """Get current request ID from thread-local storage."""
-    return getattr(_request_context, 'request_id', None)
+    """Get current request ID from the request context."""
+    return _request_id_var.get()
 
 
 def get_user_id() -> Optional[str]:
-    """Get current user ID from thread-local storage."""
-    return getattr(_request_context, 'user_id', None)
+    """Get current user ID from the request context."""
+    return _user_id_var.get()
 
 
 def get_user_roles() -> List[str]:
-    """Get current user roles from thread-local storage."""
-    return getattr(_request_context, 'roles', [])
+    """Get current user roles from the request context."""
+    return _roles_var.get() or []
 
 
-def set_request_context(request_id: str, user_id: Optional[str] = None, roles: Optional[List[str]] = None):
-    """Set request context in thread-local storage."""
-    _request_context.request_id = request_id
-    _request_context.user_id = user_id
-    _request_context.roles = roles or []
+def set_request_context(
+    request_id: str,
+    user_id: Optional[str] = None,
+    roles: Optional[List[str]] = None
+) -> Tuple[Token, ...]:
+    """
+    Set request context.
+    
+    Returns:
+        Tokens for clear_request_context() to restore the previous values
+    """
+    return (
+        _request_id_var.set(request_id),
+        _user_id_var.set(user_id),
+        _roles_var.set(roles or []),
+        _roles_str_var.set(','.join(map(str, roles)) if roles else '-'),
+    )
 
 
-def clear_request_context():
-    """Clear request context from thread-local storage."""
-    _request_context.request_id = None
-    _request_context.user_id = None
-    _request_context.roles = []
+def clear_request_context(tokens: Optional[Tuple[Token, ...]] = None):
+    """
+    Clear request context.
+    
+    Args:
+        tokens: From set_request_context() - restores the values that were
+            current before it; without tokens, resets to empty
+    """
+    if tokens is not None:
+        request_id_token, user_id_token, roles_token, roles_str_token = tokens
+        _roles_str_var.reset(roles_str_token)
+        _roles_var.reset(roles_token)
+        _user_id_var.reset(user_id_token)
+        _request_id_var.reset(request_id_token)
+        return
+    _request_id_var.set(None)
+    _user_id_var.set(None)
+    _roles_var.set(None)
+    _roles_str_var.set('-')
 
 
 def generate_request_id() -> str:
@@ -65,13 +100,33 @@ class RequestContextFilter(logging.Filter):
     """
     
     def filter(self, record):
+        # Console and file handlers both carry this filter - the first one
+        # to see the record fills the context in for both
+        if hasattr(record, 'request_id'):
+            return True
         record.request_id = get_request_id() or '-'
         record.user_id = get_user_id() or '-'
-        roles = get_user_roles()
-        record.roles = ','.join(str(r) for r in roles) if roles else '-'
+        record.roles = _roles_str_var.get()
         return True
 
 
+def _record_context(record) -> Tuple[str, str, str]:
+    """
+    (request_id, user_id, roles) as set by RequestContextFilter.
+    
+    Every configured handler carries the filter, so these are plain
+    attribute reads; records routed around it fall back to '-'.
+    """
+    try:
+        return record.request_id, record.user_id, record.roles
+    except AttributeError:
+        return (
+            getattr(record, 'request_id', '-'),
+            getattr(record, 'user_id', '-'),
+            getattr(record, 'roles', '-'),
+        )
+
+
 class JSONFormatter(logging.Formatter):
     """
     JSON log formatter for structured logging.
@@ -92,28 +147,49 @@ class JSONFormatter(logging.Formatter):
     """
     
     def format(self, record):
+        # Console (when DEBUG is off) and file handlers share this
+        # formatter; encode each record once and reuse the line
+        formatted = record.__dict__.get('_json_formatted')
+        if formatted is not None:
+            return formatted
+        
+        request_id, user_id, roles = _record_context(record)
+        
         log_data = {
-            'timestamp': datetime.utcnow().isoformat() + 'Z',
+            # Event time from the record; orjson renders it as ISO 8601 + 'Z'
+            'timestamp': datetime.fromtimestamp(record.created, tz=timezone.utc),
             'level': record.levelname,
             'logger': record.name,
             'message': record.getMessage(),
-            'request_id': getattr(record, 'request_id', '-'),
-            'user_id': getattr(record, 'user_id', '-'),
-            'roles': getattr(record, 'roles', '-'),
+            'request_id': request_id,
+            'user_id': user_id,
+            'roles': roles,
             'module': record.module,
             'function': record.funcName,
             'line': record.lineno,
         }
         
-        # Add exception info if present
+        # Add exception info if present (traceback text cached on the
+        # record, as logging.Formatter.format does)
         if record.exc_info:
-            log_data['exception'] = self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            log_data['exception'] = record.exc_text
         
         # Add extra fields if present
         if hasattr(record, 'extra_data'):
             log_data['extra'] = record.extra_data
         
-        return json.dumps(log_data, default=str)
+        # orjson encodes in C (datetime natively); default=str covers
+        # arbitrary values in extra_data and OPT_NON_STR_KEYS coerces
+        # non-str dict keys, as json.dumps(default=str) did
+        formatted = orjson.dumps(
+            log_data,
+            default=str,
+            option=orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+        record._json_formatted = formatted
+        return formatted
 
 
 class ConsoleFormatter(logging.Formatter):
@@ -124,8 +200,7 @@ class ConsoleFormatter(logging.Formatter):
     """
     
     def format(self, record):
-        request_id = getattr(record, 'request_id', '-')
-        user_id = getattr(record, 'user_id', '-')
+        request_id, user_id, _ = _record_context(record)
         
         # Truncate request_id for readability
         short_id = request_id[:8] if request_id != '-' else '-'
@@ -136,7 +211,9 @@ class ConsoleFormatter(logging.Formatter):
             base = f"[{short_id}] [{user_id[:8]}] {record.levelname:8} {record.module}:{record.lineno} - {record.getMessage()}"
         
         if record.exc_info:
-            base += '\n' + self.formatException(record.exc_info)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+            base += '\n' + record.exc_text
         
         return base
 
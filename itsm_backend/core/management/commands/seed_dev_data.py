@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 from django.utils import timezone
+from django.db import transaction
 from django.db.models import Max
 
 from accounts.models import (
@@ -13,6 +14,7 @@ from accounts.models import (
 )
 from accounts.services import AuthService
 
+from analytics.services import invalidate_assignee_analytics
 from tickets.models import (
     Category,
     SubCategory,
@@ -22,8 +24,20 @@ from tickets.models import (
 )
 
 from datetime import timedelta
+import os
 import uuid
-import re
+import zlib
+
+
+def _uuid4_stream(batch_size=64):
+    """
+    Yield random (version 4) UUIDs, reading entropy for a whole batch with
+    one os.urandom() call instead of one per uuid.uuid4().
+    """
+    while True:
+        raw = os.urandom(16 * batch_size)
+        for offset in range(0, len(raw), 16):
+            yield uuid.UUID(bytes=raw[offset:offset + 16], version=4)
 
 
 class Command(BaseCommand):
@@ -115,10 +129,15 @@ class Command(BaseCommand):
             "admin1@demo.local": "ADMIN",
         }
 
+        roles_by_name = {
+            r.name: r
+            for r in Role.objects.filter(name__in=set(role_map.values()))
+        }
+
         for email, role_name in role_map.items():
             UserRole.objects.get_or_create(
                 user=users[email],
-                role=Role.objects.get(name=role_name),
+                role=roles_by_name[role_name],
                 defaults={
                     "department": department if role_name != "ADMIN" else None,
                     "team": team if role_name in ("EMPLOYEE", "MANAGER") else None,
@@ -172,15 +191,17 @@ class Command(BaseCommand):
             .get("max_num")
         )
 
-        if latest_ticket:
-            match = re.search(r"(\d{5})$", latest_ticket)
-            ticket_seq = int(match.group(1)) + 1 if match else 1
-        else:
+        # Numbers are TKT-YYYYMMDD-XXXXX, so the sequence is the last 5 chars
+        try:
+            ticket_seq = int(latest_ticket[-5:]) + 1
+        except (TypeError, ValueError):
             ticket_seq = 1
 
+        ticket_prefix = f"{today_prefix}-"
+
         def generate_ticket_number():
             nonlocal ticket_seq
-            num = f"{today_prefix}-{ticket_seq:05d}"
+            num = f"{ticket_prefix}{ticket_seq:05d}"
             ticket_seq += 1
             return num
 
@@ -192,7 +213,15 @@ class Command(BaseCommand):
         now = timezone.now()
         creator = users["user1@demo.local"]
         assignee = users["employee1@demo.local"]
-        subcategories = list(SubCategory.objects.all())
+        # Ordered + crc32 below so every run maps a title to the same
+        # subcategory (str hash() is randomized per process)
+        subcategories = list(SubCategory.objects.order_by("name"))
+
+        # Rows are collected here and inserted with bulk_create below
+        # (one round-trip per table instead of one per row)
+        tickets_to_create = []
+        history_to_create = []
+        row_ids = _uuid4_stream()
 
         def create_ticket(
             title,
@@ -208,13 +237,15 @@ class Command(BaseCommand):
 
             created_at = now - timedelta(days=days_ago)
 
-            ticket = Ticket.objects.create(
-                id=uuid.uuid4(),
+            ticket = Ticket(
+                id=next(row_ids),
                 ticket_number=generate_ticket_number(),
                 title=title,
                 description=f"Auto-seeded ticket: {title}",
                 category=hardware if "Hardware" in title else software,
-                subcategory=subcategories[hash(title) % len(subcategories)],
+                subcategory=subcategories[
+                    zlib.crc32(title.encode("utf-8")) % len(subcategories)
+                ],
                 department=department,
                 created_by=creator,
                 assigned_to=assignee if assigned else None,
@@ -229,14 +260,17 @@ class Command(BaseCommand):
                 updated_at=created_at,
             )
 
-            TicketHistory.objects.create(
-                id=uuid.uuid4(),
-                ticket=ticket,
-                old_status="NEW",
-                new_status=status,
-                note="Initial ticket creation",
-                changed_by=creator,
-                changed_at=created_at,
+            tickets_to_create.append(ticket)
+            history_to_create.append(
+                TicketHistory(
+                    id=next(row_ids),
+                    ticket=ticket,
+                    old_status="NEW",
+                    new_status=status,
+                    note="Initial ticket creation",
+                    changed_by=creator,
+                    changed_at=created_at,
+                )
             )
 
         # ----------------------------------------------------
@@ -290,5 +324,15 @@ class Command(BaseCommand):
                 days_ago=30 - i,
             )
 
+        with transaction.atomic():
+            Ticket.objects.bulk_create(tickets_to_create, batch_size=500)
+            TicketHistory.objects.bulk_create(history_to_create, batch_size=500)
+
+        # bulk_create skips post_save, so drop the assignee's cached
+        # analytics here (the signal handler would normally do this)
+        for ticket in tickets_to_create:
+            if ticket.assigned_to_id:
+                invalidate_assignee_analytics(ticket.assigned_to_id, ticket.created_at)
+
         self.stdout.write(self.style.SUCCESS("Tickets seeded successfully"))
         self.stdout.write("=== ITSM DEV SEED COMPLETE ===")
@@ -10,43 +10,130 @@ In-memory metrics for monitoring:
 Thread-safe implementation using locks.
 Optional Prometheus-compatible text export.
 """
+import functools
+import re
 import threading
 import time
+from array import array
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 import logging
 
 logger = logging.getLogger('core.metrics')
 
 
+@functools.lru_cache(maxsize=4096)
+def _sorted_label_key(label_items: frozenset) -> tuple:
+    """Sorted label tuple for a label set, computed once per distinct set."""
+    return tuple(sorted(label_items))
+
+
+def _label_key(labels: dict) -> tuple:
+    """
+    Canonical storage key for a label dict.
+    
+    Label sets repeat on every request (method/path/status), so the sort
+    is memoized; unlabelled metrics skip the lookup entirely.
+    """
+    if not labels:
+        return ()
+    return _sorted_label_key(frozenset(labels.items()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _label_str(labels: tuple) -> str:
+    """Prometheus '{k="v",...}' string for a non-empty label key."""
+    return '{' + ','.join([f'{k}="{v}"' for k, v in labels]) + '}'
+
+
+# Series line prefixes - only the value changes between scrapes, so the
+# name + label text before it is built once per series
+
+@functools.lru_cache(maxsize=4096)
+def _counter_prefix(name: str, labels: tuple) -> str:
+    """'name{labels} ' for a counter series."""
+    label_str = _label_str(labels) if labels else ''
+    return f"{name}{label_str} "
+
+
+@functools.lru_cache(maxsize=4096)
+def _summary_prefixes(name: str, labels: tuple) -> tuple:
+    """
+    Line prefixes for a summary series.
+    
+    Returns:
+        (((percentile, 'name{labels,quantile="q"} '), ...),
+         'name_count{labels} ', 'name_sum{labels} ')
+    """
+    label_str = _label_str(labels) if labels else ''
+    # '{a="1",' or '{' - each quantile label is appended to it
+    quantile_open = f'{label_str[:-1]},' if label_str else '{'
+    quantile_prefixes = tuple(
+        (p, f"{name}{quantile_open}{p_label}}} ")
+        for p, p_label in _EXPORT_QUANTILES
+    )
+    return quantile_prefixes, f"{name}_count{label_str} ", f"{name}_sum{label_str} "
+
+
+# Number of lock shards per metric type (power of two - indexed by hash & mask)
+_LOCK_SHARDS = 16
+_LOCK_SHARD_MASK = _LOCK_SHARDS - 1
+
+# Exported summary quantiles: (percentile, preformatted label). Integer
+# percentiles, all < 100 - export_prometheus indexes without clamping
+_EXPORT_QUANTILES = tuple((p, f'quantile="{p/100}"') for p in (50, 95, 99))
+
+
+class _SampleRing:
+    """
+    Bounded histogram sample store.
+    
+    Samples are unboxed doubles in an array('d') (8 bytes each, not a
+    float object per sample). Once full, new samples overwrite the oldest
+    in place instead of re-slicing the list to keep the most recent N.
+    Percentiles and sums are order-independent, so slot order is not kept.
+    """
+    __slots__ = ('samples', 'head', 'max_samples')
+    
+    def __init__(self, max_samples: int):
+        self.samples = array('d')
+        self.head = 0
+        self.max_samples = max_samples
+    
+    def add(self, value: float):
+        if len(self.samples) < self.max_samples:
+            self.samples.append(value)
+        else:
+            self.samples[self.head] = value
+            self.head = (self.head + 1) % self.max_samples
+    
+    def __len__(self):
+        return len(self.samples)
+
+
 class MetricsRegistry:
     """
     Thread-safe in-memory metrics registry.
     
     Stores counters and histograms with labels.
     Can be exported in Prometheus text format.
-    """
-    
-    _instance = None
-    _lock = threading.Lock()
     
-    def __new__(cls):
-        if cls._instance is None:
-            with cls._lock:
-                if cls._instance is None:
-                    cls._instance = super().__new__(cls)
-                    cls._instance._initialize()
-        return cls._instance
+    Use the module-level `metrics` instance; it is created once at import
+    (imports are already serialized by the import lock).
+    """
     
-    def _initialize(self):
+    def __init__(self):
         """Initialize metrics storage."""
-        self._counters: Dict[str, Dict[tuple, int]] = defaultdict(lambda: defaultdict(int))
-        self._histograms: Dict[str, Dict[tuple, List[float]]] = defaultdict(lambda: defaultdict(list))
-        self._counter_lock = threading.Lock()
-        self._histogram_lock = threading.Lock()
-        
         # Max samples per histogram (for memory bounds)
         self._max_histogram_samples = 10000
+        
+        self._counters: Dict[str, Dict[tuple, int]] = defaultdict(lambda: defaultdict(int))
+        self._histograms: Dict[str, Dict[tuple, _SampleRing]] = defaultdict(
+            lambda: defaultdict(lambda: _SampleRing(self._max_histogram_samples))
+        )
+        # Locks sharded by metric name - unrelated metrics never contend
+        self._counter_locks = [threading.Lock() for _ in range(_LOCK_SHARDS)]
+        self._histogram_locks = [threading.Lock() for _ in range(_LOCK_SHARDS)]
     
     def increment_counter(self, name: str, value: int = 1, **labels):
         """
@@ -57,8 +144,8 @@ class MetricsRegistry:
             value: Amount to increment (default 1)
             **labels: Label key-value pairs
         """
-        label_key = tuple(sorted(labels.items()))
-        with self._counter_lock:
+        label_key = _label_key(labels)
+        with self._counter_locks[hash(name) & _LOCK_SHARD_MASK]:
             self._counters[name][label_key] += value
     
     def observe_histogram(self, name: str, value: float, **labels):
@@ -70,18 +157,32 @@ class MetricsRegistry:
             value: Observed value
             **labels: Label key-value pairs
         """
-        label_key = tuple(sorted(labels.items()))
-        with self._histogram_lock:
-            samples = self._histograms[name][label_key]
-            samples.append(value)
-            # Trim if too many samples (keep recent)
-            if len(samples) > self._max_histogram_samples:
-                self._histograms[name][label_key] = samples[-self._max_histogram_samples:]
+        label_key = _label_key(labels)
+        with self._histogram_locks[hash(name) & _LOCK_SHARD_MASK]:
+            # Ring overwrites the oldest sample once full (keep recent)
+            self._histograms[name][label_key].add(value)
+    
+    def record_request(self, request_key: tuple, error_key: Optional[tuple], latency_seconds: float):
+        """
+        Record one HTTP request: request counter, latency histogram and,
+        when error_key is given, the error counter.
+        
+        Keys are prebuilt label tuples (see _request_label_keys), so no
+        per-call label sorting happens here.
+        """
+        with self._counter_locks[_REQUESTS_SHARD]:
+            self._counters['http_requests_total'][request_key] += 1
+        with self._histogram_locks[_LATENCY_SHARD]:
+            self._histograms['http_request_latency_seconds'][request_key].add(latency_seconds)
+        if error_key is not None:
+            with self._counter_locks[_ERRORS_SHARD]:
+                self._counters['http_errors_total'][error_key] += 1
     
     def get_counter(self, name: str, **labels) -> int:
         """Get counter value."""
-        label_key = tuple(sorted(labels.items()))
-        return self._counters[name].get(label_key, 0)
+        label_key = _label_key(labels)
+        # .get() - reads must not create empty series in the defaultdicts
+        return self._counters.get(name, {}).get(label_key, 0)
     
     def get_histogram_percentile(self, name: str, percentile: float, **labels) -> Optional[float]:
         """
@@ -95,14 +196,16 @@ class MetricsRegistry:
         Returns:
             Percentile value, or None if no samples
         """
-        label_key = tuple(sorted(labels.items()))
-        samples = self._histograms[name].get(label_key, [])
+        label_key = _label_key(labels)
+        with self._histogram_locks[hash(name) & _LOCK_SHARD_MASK]:
+            ring = self._histograms.get(name, {}).get(label_key)
+            samples = array('d', ring.samples) if ring else None
         if not samples:
             return None
         
         sorted_samples = sorted(samples)
-        idx = int(len(sorted_samples) * percentile / 100)
-        idx = min(idx, len(sorted_samples) - 1)
+        count = len(sorted_samples)
+        idx = min(int(count * percentile / 100), count - 1)
         return sorted_samples[idx]
     
     def export_prometheus(self) -> str:
@@ -112,65 +215,123 @@ class MetricsRegistry:
         Returns:
             Prometheus-compatible metrics text
         """
+        counters, histograms = self._snapshot()
         lines = []
         
         # Export counters
-        for name, label_values in self._counters.items():
+        for name, label_values in counters.items():
             lines.append(f"# TYPE {name} counter")
             for labels, value in label_values.items():
-                label_str = self._format_labels(labels)
-                lines.append(f"{name}{label_str} {value}")
+                lines.append(f"{_counter_prefix(name, labels)}{value}")
         
         # Export histograms (as summary with percentiles)
-        for name, label_values in self._histograms.items():
+        for name, label_values in histograms.items():
             lines.append(f"# TYPE {name} summary")
             for labels, samples in label_values.items():
                 if not samples:
                     continue
                 
-                label_str = self._format_labels(labels)
+                quantile_prefixes, count_prefix, sum_prefix = _summary_prefixes(name, labels)
                 
-                # Calculate percentiles
+                # Calculate percentiles - one sort, then index per quantile
                 sorted_samples = sorted(samples)
-                for p in [50, 95, 99]:
-                    idx = int(len(sorted_samples) * p / 100)
-                    idx = min(idx, len(sorted_samples) - 1)
-                    p_label = f'quantile="{p/100}"'
-                    if label_str:
-                        full_labels = f'{label_str[:-1]},{p_label}}}'
-                    else:
-                        full_labels = f'{{{p_label}}}'
-                    lines.append(f"{name}{full_labels} {sorted_samples[idx]:.6f}")
+                count = len(sorted_samples)
+                # p < 100 for every export quantile, so count * p // 100
+                # is always a valid index - no clamp needed
+                for p, quantile_prefix in quantile_prefixes:
+                    lines.append(f"{quantile_prefix}{sorted_samples[count * p // 100]:.6f}")
                 
                 # Count and sum
-                lines.append(f"{name}_count{label_str} {len(samples)}")
-                lines.append(f"{name}_sum{label_str} {sum(samples):.6f}")
+                lines.append(f"{count_prefix}{count}")
+                lines.append(f"{sum_prefix}{sum(samples):.6f}")
         
         return '\n'.join(lines)
     
-    def _format_labels(self, labels: tuple) -> str:
-        """Format labels for Prometheus output."""
-        if not labels:
-            return ''
-        parts = [f'{k}="{v}"' for k, v in labels]
-        return '{' + ','.join(parts) + '}'
+    def _snapshot(self):
+        """
+        Copy counters and histogram samples, each metric under its lock.
+        
+        Formatting then runs on the copies with no lock held, so a scrape
+        neither blocks writers for its duration nor iterates dicts they
+        are mutating.
+        """
+        counters = {}
+        for name, label_values in list(self._counters.items()):
+            with self._counter_locks[hash(name) & _LOCK_SHARD_MASK]:
+                counters[name] = dict(label_values)
+        
+        histograms = {}
+        for name, label_values in list(self._histograms.items()):
+            with self._histogram_locks[hash(name) & _LOCK_SHARD_MASK]:
+                histograms[name] = {
+                    labels: array('d', ring.samples)
+                    for labels, ring in label_values.items()
+                }
+        return counters, histograms
     
     def reset(self):
         """Reset all metrics (for testing)."""
-        with self._counter_lock:
+        for lock in self._counter_locks:
+            lock.acquire()
+        try:
             self._counters.clear()
-        with self._histogram_lock:
+        finally:
+            for lock in self._counter_locks:
+                lock.release()
+        for lock in self._histogram_locks:
+            lock.acquire()
+        try:
             self._histograms.clear()
+        finally:
+            for lock in self._histogram_locks:
+                lock.release()
 
 
 # Global registry instance
 metrics = MetricsRegistry()
 
+# Lock shards of the per-request metrics, resolved once for record_request()
+_REQUESTS_SHARD = hash('http_requests_total') & _LOCK_SHARD_MASK
+_ERRORS_SHARD = hash('http_errors_total') & _LOCK_SHARD_MASK
+_LATENCY_SHARD = hash('http_request_latency_seconds') & _LOCK_SHARD_MASK
+
 
 # ============================================================================
 # CONVENIENCE FUNCTIONS
 # ============================================================================
 
+@functools.lru_cache(maxsize=4096)
+def _request_label_keys(method: str, path: str, status: int) -> tuple:
+    """
+    (request_key, error_key) label tuples for an HTTP request.
+    
+    Built directly in sorted label order - the same tuples _label_key()
+    produces for the individual helpers below - and memoized per raw
+    (method, path, status), so normalization runs once per distinct route.
+    """
+    norm_path = _normalize_path(path)
+    request_key = (('method', method), ('path', norm_path), ('status', str(status)))
+    error_key = None
+    if status >= 400:
+        error_class = 'server' if status >= 500 else 'client'
+        error_key = (('error_class', error_class), ('method', method), ('path', norm_path))
+    return request_key, error_key
+
+
+def record_request(method: str, path: str, status: int, latency_seconds: float):
+    """
+    Record an HTTP request's count, latency and (4xx/5xx) error count.
+    
+    Equivalent to increment_request_counter + observe_request_latency +
+    increment_error_counter, with the labels built once instead of three
+    times.
+    
+    Not sampled - every request is recorded and counters stay exact integers.
+    """
+    request_key, error_key = _request_label_keys(method, path, status)
+    metrics.record_request(request_key, error_key, latency_seconds)
+
+
 def increment_request_counter(method: str, path: str, status: int):
     """Increment HTTP request counter."""
     metrics.increment_counter(
@@ -226,24 +387,28 @@ def observe_db_query_duration(operation: str, duration_seconds: float):
     )
 
 
+# Compiled once - _normalize_path runs up to three times per request
+_UUID_RE = re.compile(
+    r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
+    re.IGNORECASE
+)
+_NUM_ID_RE = re.compile(r'/\d+(/|$)')
+
+
+@functools.lru_cache(maxsize=2048)
 def _normalize_path(path: str) -> str:
     """
     Normalize path for metrics labels.
     
     Replaces UUIDs and numeric IDs with placeholders to reduce label cardinality.
+    Memoized per raw path: list/collection routes repeat on every request;
+    per-object paths (one UUID each) just cycle through the bounded LRU.
     """
-    import re
-    
     # Replace UUIDs
-    path = re.sub(
-        r'[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
-        '{id}',
-        path,
-        flags=re.IGNORECASE
-    )
+    path = _UUID_RE.sub('{id}', path)
     
     # Replace numeric IDs
-    path = re.sub(r'/\d+(/|$)', r'/{id}\1', path)
+    path = _NUM_ID_RE.sub(r'/{id}\1', path)
     
     return path
 
@@ -5,11 +5,7 @@ Records HTTP request latency and counters for monitoring.
 """
 import time
 from django.http import HttpRequest, HttpResponse
-from core.metrics import (
-    increment_request_counter,
-    increment_error_counter,
-    observe_request_latency,
-)
+from core.metrics import record_request
 
 
 class MetricsMiddleware:
@@ -21,15 +17,19 @@ class MetricsMiddleware:
     - Error count by method/path/error_class
     - Request latency by method/path/status
     
-    Should be placed after RequestLoggingMiddleware.
+    Should be placed after RequestLoggingMiddleware: latency is measured
+    from the start time it stores on request._start_ts (falls back to its
+    own clock read when that middleware is not installed).
     """
     
     def __init__(self, get_response):
         self.get_response = get_response
     
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        # Record start time
-        start_time = time.perf_counter()
+        # Reuse RequestLoggingMiddleware's start time if it ran first
+        start_time = getattr(request, '_start_ts', None)
+        if start_time is None:
+            start_time = time.perf_counter()
         
         # Process request
         response = self.get_response(request)
@@ -37,20 +37,8 @@ class MetricsMiddleware:
         # Calculate latency
         latency_seconds = time.perf_counter() - start_time
         
-        # Record metrics
-        method = request.method
-        path = request.path
-        status = response.status_code
-        
-        # Increment request counter
-        increment_request_counter(method, path, status)
-        
-        # Record latency
-        observe_request_latency(method, path, status, latency_seconds)
-        
-        # Increment error counter if applicable
-        if status >= 400:
-            error_class = 'server' if status >= 500 else 'client'
-            increment_error_counter(method, path, error_class)
+        # Record request count, latency and error count (4xx/5xx) in one
+        # call - labels are built once for all three
+        record_request(request.method, request.path, response.status_code, latency_seconds)
         
         return response
@@ -24,6 +24,10 @@ from core.permissions import get_user_roles
 
 logger = logging.getLogger('core.request')
 
+# Error class indexed by status_code // 100 (HttpResponse limits status
+# codes to 100-599): 1xx-3xx none, 4xx client, 5xx server
+_ERROR_CLASS_BY_HUNDRED = ('none', 'none', 'none', 'none', 'client', 'server')
+
 
 class RequestLoggingMiddleware:
     """
@@ -37,6 +41,9 @@ class RequestLoggingMiddleware:
     - Logs request on entry, response on exit
     - Measures and logs latency
     - Classifies errors (4xx client, 5xx server)
+    
+    Stores its start time on request._start_ts, which MetricsMiddleware
+    (placed later in MIDDLEWARE) reuses instead of reading the clock again.
     """
     
     def __init__(self, get_response):
@@ -50,10 +57,11 @@ class RequestLoggingMiddleware:
         request.request_id = request_id
         
         # Set initial context (user_id/roles set after auth in process_view)
-        set_request_context(request_id, None, None)
+        context_tokens = set_request_context(request_id, None, None)
         
-        # Record start time
+        # Record start time (shared with MetricsMiddleware via the request)
         start_time = time.perf_counter()
+        request._start_ts = start_time
         
         # Log request entry
         self._log_request(request)
@@ -80,8 +88,8 @@ class RequestLoggingMiddleware:
             raise
             
         finally:
-            # Clear thread-local context
-            clear_request_context()
+            # Clear request context (restores the values from before the request)
+            clear_request_context(context_tokens)
     
     def process_view(self, request, view_func, view_args, view_kwargs):
         """
@@ -101,6 +109,11 @@ class RequestLoggingMiddleware:
     
     def _log_request(self, request: HttpRequest):
         """Log incoming request."""
+        # INFO is usually off in production - skip building the record
+        # (extras dict, header lookups) when it would be dropped anyway
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         # Build log message
         path = request.path
         method = request.method
@@ -110,7 +123,7 @@ class RequestLoggingMiddleware:
         client_ip = self._get_client_ip(request)
         
         logger.info(
-            f"Request started: {method} {path}",
+            "Request started: %s %s", method, path,
             extra={
                 'extra_data': {
                     'event': 'request_start',
@@ -126,7 +139,16 @@ class RequestLoggingMiddleware:
     def _log_response(self, request: HttpRequest, response: HttpResponse, latency_ms: float):
         """Log completed response."""
         status_code = response.status_code
-        error_class = self._get_error_class(status_code)
+        
+        # Log level based on status code
+        if status_code >= 500:
+            level, outcome = logging.ERROR, 'Request failed'
+        elif status_code >= 400:
+            level, outcome = logging.WARNING, 'Request client error'
+        else:
+            level, outcome = logging.INFO, 'Request completed'
+        if not logger.isEnabledFor(level):
+            return
         
         log_data = {
             'extra_data': {
@@ -135,26 +157,16 @@ class RequestLoggingMiddleware:
                 'path': request.path,
                 'status_code': status_code,
                 'latency_ms': round(latency_ms, 2),
-                'error_class': error_class,
+                'error_class': self._get_error_class(status_code),
             }
         }
         
-        # Log level based on status code
-        if status_code >= 500:
-            logger.error(
-                f"Request failed: {request.method} {request.path} -> {status_code} ({latency_ms:.2f}ms)",
-                extra=log_data
-            )
-        elif status_code >= 400:
-            logger.warning(
-                f"Request client error: {request.method} {request.path} -> {status_code} ({latency_ms:.2f}ms)",
-                extra=log_data
-            )
-        else:
-            logger.info(
-                f"Request completed: {request.method} {request.path} -> {status_code} ({latency_ms:.2f}ms)",
-                extra=log_data
-            )
+        logger.log(
+            level,
+            "%s: %s %s -> %s (%.2fms)",
+            outcome, request.method, request.path, status_code, latency_ms,
+            extra=log_data
+        )
     
     def _log_exception(self, request: HttpRequest, exc: Exception, latency_ms: float):
         """Log unhandled exception."""
@@ -176,13 +188,9 @@ class RequestLoggingMiddleware:
         """Extract client IP, handling proxies."""
         x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
         if x_forwarded_for:
-            return x_forwarded_for.split(',')[0].strip()
+            return x_forwarded_for.partition(',')[0].strip()
         return request.META.get('REMOTE_ADDR', '-')
     
     def _get_error_class(self, status_code: int) -> str:
         """Classify error by status code."""
-        if status_code >= 500:
-            return 'server'
-        elif status_code >= 400:
-            return 'client'
-        return 'none'
+        return _ERROR_CLASS_BY_HUNDRED[status_code // 100]
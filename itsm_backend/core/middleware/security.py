@@ -6,13 +6,41 @@ Provides:
 - Request body size enforcement
 - Request sanitization
 """
+import json
 import logging
 from django.conf import settings
-from django.http import HttpRequest, HttpResponse, JsonResponse
+from django.http import HttpRequest, HttpResponse
 
 logger = logging.getLogger('core.security')
 
 
+# Headers added to every response unless the view already set them
+_STATIC_SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'DENY'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Referrer-Policy', 'strict-origin-when-cross-origin'),
+)
+
+# Swagger UI needs relaxed CSP (dev-only tooling)
+_SWAGGER_UI_PATH_PREFIX = '/api/schema/swagger-ui'
+_CSP_SWAGGER_UI = (
+    "default-src 'self'; "
+    "script-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
+    "style-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
+    "img-src 'self' https://cdn.jsdelivr.net data:; "
+    "font-src 'self' https://cdn.jsdelivr.net; "
+    "connect-src 'self'; "
+    "frame-ancestors 'none'"
+)
+
+# Strict CSP for all APIs and application routes (no inline scripts needed)
+_CSP_STRICT = (
+    "default-src 'none'; "
+    "frame-ancestors 'none'"
+)
+
+
 class SecurityHeadersMiddleware:
     """
     Middleware to add security headers to all responses.
@@ -22,7 +50,7 @@ class SecurityHeadersMiddleware:
     - X-Frame-Options: DENY
     - X-XSS-Protection: 1; mode=block
     - Referrer-Policy: strict-origin-when-cross-origin
-    - Content-Security-Policy: default-src 'self' (API only)
+    - Content-Security-Policy: default-src 'none' (relaxed for Swagger UI)
     
     Note: HSTS is handled by Django's SecurityMiddleware when SECURE_SSL_REDIRECT is True.
     """
@@ -34,39 +62,15 @@ class SecurityHeadersMiddleware:
         response = self.get_response(request)
         
         # Add security headers (only if not already set)
-        if 'X-Content-Type-Options' not in response:
-            response['X-Content-Type-Options'] = 'nosniff'
-        
-        if 'X-Frame-Options' not in response:
-            response['X-Frame-Options'] = 'DENY'
-        
-        if 'X-XSS-Protection' not in response:
-            response['X-XSS-Protection'] = '1; mode=block'
+        for header, value in _STATIC_SECURITY_HEADERS:
+            response.setdefault(header, value)
         
-        if 'Referrer-Policy' not in response:
-            response['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-        
-        # Content Security Policy for API (no inline scripts needed)
         # Content Security Policy
         if 'Content-Security-Policy' not in response:
-            # Swagger UI needs relaxed CSP (dev-only tooling)
-            if request.path.startswith('/api/schema/swagger-ui'):
-                response['Content-Security-Policy'] = (
-                    "default-src 'self'; "
-            "script-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
-            "style-src 'self' https://cdn.jsdelivr.net 'unsafe-inline'; "
-            "img-src 'self' https://cdn.jsdelivr.net data:; "
-            "font-src 'self' https://cdn.jsdelivr.net; "
-            "connect-src 'self'; "
-            "frame-ancestors 'none'"
-                )
+            if request.path.startswith(_SWAGGER_UI_PATH_PREFIX):
+                response['Content-Security-Policy'] = _CSP_SWAGGER_UI
             else:
-                # Strict CSP for all APIs and application routes
-                response['Content-Security-Policy'] = (
-                    "default-src 'none'; "
-                    "frame-ancestors 'none'"
-                )
-
+                response['Content-Security-Policy'] = _CSP_STRICT
         
         # Remove server header if present
         if 'Server' in response:
@@ -89,36 +93,38 @@ class RequestSizeLimitMiddleware:
     def __init__(self, get_response):
         self.get_response = get_response
         self.max_body_size = getattr(settings, 'DATA_UPLOAD_MAX_MEMORY_SIZE', 10 * 1024 * 1024)
+        # The 413 body only depends on the limit - encode it once
+        self.oversize_body = json.dumps({
+            'error': {
+                'code': 'PAYLOAD_TOO_LARGE',
+                'message': f'Request body exceeds maximum size ({self.max_body_size // (1024*1024)}MB)',
+                'details': []
+            }
+        }).encode()
     
     def __call__(self, request: HttpRequest) -> HttpResponse:
-        # Check Content-Length header
+        # Check Content-Length header. Only ASCII digits reach int() -
+        # str.isdigit() also accepts e.g. '²', which int() rejects; any
+        # other value is ignored, as before
         content_length = request.META.get('CONTENT_LENGTH')
         
-        if content_length:
-            try:
-                content_length = int(content_length)
-                if content_length > self.max_body_size:
-                    logger.warning(
-                        f"Request body too large: {content_length} bytes (max {self.max_body_size})",
-                        extra={
-                            'extra_data': {
-                                'event': 'request_too_large',
-                                'content_length': content_length,
-                                'max_size': self.max_body_size,
-                            }
+        if content_length and content_length.isascii() and content_length.isdecimal():
+            content_length = int(content_length)
+            if content_length > self.max_body_size:
+                logger.warning(
+                    f"Request body too large: {content_length} bytes (max {self.max_body_size})",
+                    extra={
+                        'extra_data': {
+                            'event': 'request_too_large',
+                            'content_length': content_length,
+                            'max_size': self.max_body_size,
                         }
-                    )
-                    return JsonResponse(
-                        {
-                            'error': {
-                                'code': 'PAYLOAD_TOO_LARGE',
-                                'message': f'Request body exceeds maximum size ({self.max_body_size // (1024*1024)}MB)',
-                                'details': []
-                            }
-                        },
-                        status=413
-                    )
-            except (ValueError, TypeError):
-                pass
+                    }
+                )
+                return HttpResponse(
+                    self.oversize_body,
+                    status=413,
+                    content_type='application/json'
+                )
         
         return self.get_response(request)
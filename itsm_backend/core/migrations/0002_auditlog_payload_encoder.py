@@ -0,0 +1,33 @@
+# Audit payload encoder
+# Lets AuditService payloads carry UUIDs without per-call str() conversion
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Encode AuditLog.payload with DjangoJSONEncoder.
+    
+    State-only change: the column type is unchanged and UUIDs are stored
+    as the same strings str() produced, so existing rows are unaffected.
+    
+    Before: Every log_* call builds str(uuid) for each id in the payload
+    After: UUIDs are passed through and encoded once at INSERT
+    """
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='auditlog',
+            name='payload',
+            field=models.JSONField(
+                default=dict,
+                encoder=django.core.serializers.json.DjangoJSONEncoder,
+                help_text='Event-specific data',
+            ),
+        ),
+    ]
@@ -3,6 +3,7 @@ Core Models - Phase 5B
 
 Audit logging model for immutable event tracking.
 """
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
 from accounts.models import BaseModel
@@ -73,6 +74,7 @@ class AuditLog(BaseModel):
     # Event payload
     payload = models.JSONField(
         default=dict,
+        encoder=DjangoJSONEncoder,  # UUID/datetime values without str() at call sites
         help_text='Event-specific data'
     )
     
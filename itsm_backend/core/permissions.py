@@ -14,6 +14,10 @@ class RoleConstants:
     EMPLOYEE = 2
     MANAGER = 3
     ADMIN = 4
+    
+    # Role groups for has_any_role() - built once, checked as sets
+    EMPLOYEE_OR_ABOVE = frozenset({EMPLOYEE, MANAGER, ADMIN})
+    MANAGER_OR_ABOVE = frozenset({MANAGER, ADMIN})
 
 
 from django.contrib.auth import get_user_model
@@ -21,6 +25,14 @@ from django.contrib.auth import get_user_model
 User = get_user_model()
 
 def get_user_roles(user):
+    """
+    Role IDs for a user.
+    
+    Memoized on the user instance: every permission class (and the
+    request logging middleware) asks again within the same request, and
+    request.user is a fresh instance per request. Callers must not
+    mutate the returned list.
+    """
     # Hard safety checks
     if (
         not user
@@ -29,14 +41,21 @@ def get_user_roles(user):
     ):
         return []
 
+    try:
+        return user._role_ids
+    except AttributeError:
+        pass
+
     from accounts.models import UserRole
 
-    return list(
+    role_ids = list(
         UserRole.objects
         .filter(user_id=user.id)   # IMPORTANT: use user_id
         .values_list('role_id', flat=True)
         .distinct()
     )
+    user._role_ids = role_ids
+    return role_ids
 
 
 
@@ -46,9 +65,66 @@ def has_role(user, role_id):
 
 
 def has_any_role(user, role_ids):
-    """Check if user has any of the specified roles"""
-    user_roles = get_user_roles(user)
-    return any(role_id in user_roles for role_id in role_ids)
+    """
+    Check if user has any of the specified roles.
+    
+    role_ids is ideally a frozenset (RoleConstants.*_OR_ABOVE), which is
+    used as-is; other iterables are converted.
+    """
+    return not frozenset(role_ids).isdisjoint(get_user_roles(user))
+
+
+def _get_perm_cache(request, user):
+    """
+    Per-request dict for object-permission lookups.
+    
+    List endpoints run has_object_permission once per row; the user's
+    departments / team members are fetched on the first check and reused
+    for the rest of the request (the dict dies with the request).
+    """
+    try:
+        perm_cache = request._perm_cache
+    except AttributeError:
+        perm_cache = request._perm_cache = {}
+    if perm_cache.get('user_id') != user.id:
+        perm_cache.clear()
+        perm_cache['user_id'] = user.id
+    return perm_cache
+
+
+def _get_user_department_ids(request, user):
+    """Department IDs from the user's role assignments (request-cached)."""
+    perm_cache = _get_perm_cache(request, user)
+    try:
+        return perm_cache['department_ids']
+    except KeyError:
+        pass
+    from accounts.models import UserRole
+    department_ids = frozenset(
+        UserRole.objects.filter(user=user, department__isnull=False)
+        .values_list('department_id', flat=True)
+    )
+    perm_cache['department_ids'] = department_ids
+    return department_ids
+
+
+def _get_managed_member_ids(request, user):
+    """
+    User IDs in the teams the user manages (request-cached).
+    
+    Membership comes from ManagerAnalyticsService.get_team_member_ids, so
+    permissions and manager analytics share one definition (and its
+    signal-invalidated cache entry); only the frozenset is kept here.
+    """
+    perm_cache = _get_perm_cache(request, user)
+    try:
+        return perm_cache['managed_member_ids']
+    except KeyError:
+        pass
+    from analytics.services import ManagerAnalyticsService
+    member_ids = frozenset(ManagerAnalyticsService.get_team_member_ids(user))
+    perm_cache['managed_member_ids'] = member_ids
+    return member_ids
 
 
 class IsAuthenticated(BasePermission):
@@ -66,11 +142,7 @@ class IsEmployee(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return has_any_role(request.user, [
-            RoleConstants.EMPLOYEE,
-            RoleConstants.MANAGER,
-            RoleConstants.ADMIN
-        ])
+        return has_any_role(request.user, RoleConstants.EMPLOYEE_OR_ABOVE)
 
 
 class IsManager(BasePermission):
@@ -80,10 +152,7 @@ class IsManager(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return has_any_role(request.user, [
-            RoleConstants.MANAGER,
-            RoleConstants.ADMIN
-        ])
+        return has_any_role(request.user, RoleConstants.MANAGER_OR_ABOVE)
 
 
 class IsAdmin(BasePermission):
@@ -128,25 +197,12 @@ class CanViewTicket(BasePermission):
             if obj.assigned_to_id == user.id:
                 return True
             # Check department access
-            from accounts.models import UserRole
-            user_dept_ids = list(
-                UserRole.objects.filter(user=user, department__isnull=False)
-                .values_list('department_id', flat=True)
-            )
-            if obj.department_id in user_dept_ids:
+            if obj.department_id in _get_user_department_ids(request, user):
                 return True
         
         # Manager can view team tickets
         if has_role(user, RoleConstants.MANAGER):
-            from accounts.models import Team
-            managed_teams = Team.objects.filter(manager=user)
-            from accounts.models import UserRole
-            team_member_ids = list(
-                UserRole.objects.filter(team__in=managed_teams)
-                .values_list('user_id', flat=True)
-                .distinct()
-            )
-            if obj.assigned_to_id in team_member_ids:
+            if obj.assigned_to_id in _get_managed_member_ids(request, user):
                 return True
         
         return False
@@ -179,15 +235,7 @@ class CanModifyTicket(BasePermission):
         
         # Manager can modify team tickets
         if has_role(user, RoleConstants.MANAGER):
-            from accounts.models import Team
-            managed_teams = Team.objects.filter(manager=user)
-            from accounts.models import UserRole
-            team_member_ids = list(
-                UserRole.objects.filter(team__in=managed_teams)
-                .values_list('user_id', flat=True)
-                .distinct()
-            )
-            if obj.assigned_to_id in team_member_ids:
+            if obj.assigned_to_id in _get_managed_member_ids(request, user):
                 return True
         
         return False
@@ -68,7 +68,7 @@ def get_ratelimit_key_ip(group, request):
     """
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
     if x_forwarded_for:
-        return x_forwarded_for.split(',')[0].strip()
+        return x_forwarded_for.partition(',')[0].strip()
     return request.META.get('REMOTE_ADDR', 'unknown')
 
 
@@ -0,0 +1,51 @@
+"""
+Core Renderers
+
+ORJSONRenderer: drop-in replacement for DRF's JSONRenderer on read-heavy
+endpoints (analytics dashboards).
+
+- Encoding runs in C and emits bytes directly, skipping the stdlib json
+  encoder and its per-object default() calls
+- UUID, datetime and date are serialized natively; UTC datetimes end in
+  'Z' like DRF's encoder (OPT_UTC_Z)
+- Bodies already encoded by the view (render_json(), e.g. to derive an
+  ETag) are reused via response.rendered_json instead of encoded twice
+"""
+import orjson
+from django.utils.functional import Promise
+from rest_framework.renderers import BaseRenderer
+
+
+def _default(obj):
+    """Fallback for types orjson does not handle natively."""
+    if isinstance(obj, Promise):
+        # Lazy translation strings (e.g. in error responses)
+        return str(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def render_json(data) -> bytes:
+    """Encode data exactly as ORJSONRenderer does."""
+    return orjson.dumps(data, default=_default, option=orjson.OPT_UTC_Z)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """
+    Render response data to JSON with orjson.
+    
+    Output matches JSONRenderer for the payloads it is used on, except
+    that datetimes keep full microsecond precision instead of being
+    truncated to milliseconds.
+    """
+    media_type = 'application/json'
+    format = 'json'
+    charset = None  # orjson always emits UTF-8 bytes
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        response = renderer_context.get('response') if renderer_context else None
+        rendered = getattr(response, 'rendered_json', None)
+        if rendered is not None:
+            return rendered
+        return render_json(data)
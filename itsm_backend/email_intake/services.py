@@ -86,7 +86,7 @@ class EmailIntakeService:
             message_id: Optional email message ID for idempotency
         """
         # Check role - only EMPLOYEE/MANAGER/ADMIN can ingest
-        if not has_any_role(user, [RoleConstants.EMPLOYEE, RoleConstants.MANAGER, RoleConstants.ADMIN]):
+        if not has_any_role(user, RoleConstants.EMPLOYEE_OR_ABOVE):
             raise ForbiddenError('Insufficient permissions to ingest emails')
         
         # Check for existing email by message_id FIRST (idempotency - avoid IntegrityError)
@@ -209,7 +209,7 @@ class EmailIntakeService:
         Returns queryset for pagination.
         """
         # Check role
-        if not has_any_role(user, [RoleConstants.EMPLOYEE, RoleConstants.MANAGER, RoleConstants.ADMIN]):
+        if not has_any_role(user, RoleConstants.EMPLOYEE_OR_ABOVE):
             raise ForbiddenError('Insufficient permissions')
         
         return EmailIngest.objects.filter(
@@ -221,7 +221,7 @@ class EmailIntakeService:
     def get_email_by_id(email_id, user: User) -> EmailIngest:
         """Get email by ID with permission check"""
         # Check role
-        if not has_any_role(user, [RoleConstants.EMPLOYEE, RoleConstants.MANAGER, RoleConstants.ADMIN]):
+        if not has_any_role(user, RoleConstants.EMPLOYEE_OR_ABOVE):
             raise ResourceNotFoundError('Email not found')
         
         try:
@@ -105,6 +105,29 @@ DATABASES = {
     }
 }
 
+# Cache
+# Default: per-process local memory cache (development)
+# Production: Set REDIS_URL=redis://host:6379/0 to share the cache across workers
+# Requires: pip install redis
+_redis_url = os.environ.get('REDIS_URL')
+if _redis_url:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': _redis_url,
+            'OPTIONS': {
+                # Pickle + zlib for values >= 1KB (analytics payloads)
+                'serializer': 'core.cache.CompressedRedisSerializer',
+            },
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
 # Custom User Model
 AUTH_USER_MODEL = 'accounts.User'
 
@@ -132,6 +155,10 @@ CORS_ALLOW_CREDENTIALS = True
 #     'FRONTEND_URL': os.environ.get('FRONTEND_URL', 'http://localhost:5173'),
 # }
 
+# BCrypt cost factor for newly hashed passwords (2^rounds iterations)
+# Existing hashes are re-hashed to this cost on the next successful login
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', '12'))
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -263,3 +290,8 @@ LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
 # Import logging configuration from core module
 from core.logging import get_logging_config
 LOGGING = get_logging_config(debug=DEBUG, log_level=LOG_LEVEL)
+
+# Audit log entries are INSERTed on the request path by default. Set
+# AUDIT_LOG_ASYNC=True to batch them through a background thread
+# (core.audit); entries still queued are lost if the process is killed
+AUDIT_LOG_ASYNC = os.environ.get('AUDIT_LOG_ASYNC', 'False').lower() == 'true'
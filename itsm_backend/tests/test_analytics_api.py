@@ -0,0 +1,357 @@
+"""
+Analytics API Tests
+
+Tests for:
+- Conditional GET (ETag / If-None-Match -> 304) on analytics endpoints
+- GET /api/analytics/employee/bundle/ - Employee summary + detailed
+- Employee detailed analytics roll-up from the daily series
+- 400 responses for date range parameters on every date range endpoint
+"""
+import uuid
+from datetime import date, timedelta
+from unittest import mock
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework import status
+from accounts.models import User, Role, UserRole, Department, Company, BusinessGroup
+from analytics.services import EmployeeAnalyticsService, EmployeeDetailedAnalyticsService
+from tickets.models import Ticket, Category, SubCategory
+
+
+class AnalyticsAPITestCase(TestCase):
+    """Base test case with common setup"""
+
+    PASSWORD = 'TestPass123!'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for all tests"""
+        # Create roles
+        Role.objects.create(id=1, name='USER')
+        Role.objects.create(id=2, name='EMPLOYEE')
+        Role.objects.create(id=3, name='MANAGER')
+        Role.objects.create(id=4, name='ADMIN')
+
+        # Create organization hierarchy
+        cls.business_group = BusinessGroup.objects.create(
+            id=uuid.uuid4(),
+            name='Test Business Group'
+        )
+        cls.company = Company.objects.create(
+            id=uuid.uuid4(),
+            name='Test Company',
+            business_group=cls.business_group
+        )
+        cls.department = Department.objects.create(
+            id=uuid.uuid4(),
+            name='IT Department',
+            company=cls.company
+        )
+
+        # Create category and subcategory
+        cls.category = Category.objects.create(
+            id=uuid.uuid4(),
+            name='Hardware',
+            is_active=True
+        )
+        cls.subcategory = SubCategory.objects.create(
+            id=uuid.uuid4(),
+            name='Laptop Issues',
+            category=cls.category,
+            department=cls.department,
+            is_active=True
+        )
+
+        cls.employee = cls.create_user('analyticsemployee@test.com', [Role.EMPLOYEE])
+        cls.requester = cls.create_user('analyticsuser@test.com', [Role.USER])
+        cls.create_ticket(cls.requester, cls.employee)
+
+    @classmethod
+    def create_user(cls, email, roles):
+        """Helper to create a user with roles"""
+        alias = email.split('@')[0]
+        user = User.objects.create_user(email, f'Test {alias}', alias, cls.PASSWORD)
+        for role_id in roles:
+            UserRole.objects.create(
+                id=uuid.uuid4(),
+                user=user,
+                role=Role.objects.get(id=role_id),
+                department=cls.department
+            )
+        return user
+
+    @classmethod
+    def create_ticket(cls, created_by, assigned_to):
+        """Helper to create a ticket assigned to an employee"""
+        return Ticket.objects.create(
+            id=uuid.uuid4(),
+            ticket_number=f'TKT-TEST-{uuid.uuid4().hex[:8]}',
+            title='Laptop not working',
+            description='Screen is broken',
+            category=cls.category,
+            subcategory=cls.subcategory,
+            department=cls.department,
+            created_by=created_by,
+            assigned_to=assigned_to,
+            status='ASSIGNED',
+        )
+
+    def setUp(self):
+        # Analytics and auth lookups are cached - start every test cold
+        cache.clear()
+        self.client = APIClient()
+
+    def login_user(self, email):
+        """Helper to login and set the bearer token"""
+        response = self.client.post('/api/auth/login/', {
+            'email': email,
+            'password': self.PASSWORD
+        })
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data.get('access_token')}")
+
+
+class AnalyticsConditionalGetTests(AnalyticsAPITestCase):
+    """Tests for ETag / If-None-Match handling"""
+
+    URL = '/api/analytics/employee/summary/'
+
+    def setUp(self):
+        super().setUp()
+        self.login_user('analyticsemployee@test.com')
+
+    def test_response_has_etag_and_cache_headers(self):
+        """Test 200 carries ETag, private/no-cache and Vary: Authorization"""
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('"'))
+        cache_control = {d.strip() for d in response['Cache-Control'].split(',')}
+        self.assertEqual(cache_control, {'private', 'no-cache'})
+        self.assertIn('Authorization', [v.strip() for v in response['Vary'].split(',')])
+
+    def test_matching_if_none_match_returns_304(self):
+        """Test re-sending the returned ETag yields 304 with an empty body"""
+        first = self.client.get(self.URL)
+        etag = first['ETag']
+
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+        cache_control = {d.strip() for d in response['Cache-Control'].split(',')}
+        self.assertEqual(cache_control, {'private', 'no-cache'})
+        self.assertIn('Authorization', [v.strip() for v in response['Vary'].split(',')])
+
+    def test_stale_if_none_match_returns_full_body(self):
+        """Test a non-matching ETag gets the full 200 response"""
+        first = self.client.get(self.URL)
+
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH='"stale"')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.content, first.content)
+
+    def test_etag_changes_when_analytics_change(self):
+        """Test a new assigned ticket invalidates the cached ETag"""
+        etag = self.client.get(self.URL)['ETag']
+        self.create_ticket(self.requester, self.employee)
+
+        response = self.client.get(self.URL, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class EmployeeDashboardBundleAPITests(AnalyticsAPITestCase):
+    """Tests for GET /api/analytics/employee/bundle/"""
+
+    URL = '/api/analytics/employee/bundle/'
+
+    def setUp(self):
+        super().setUp()
+        # Keep the range short - each month in it is a separate cache entry
+        today = timezone.localdate()
+        self.params = {
+            'start_date': (today - timedelta(days=30)).isoformat(),
+            'end_date': (today + timedelta(days=1)).isoformat(),
+        }
+
+    def test_bundle_matches_separate_endpoints(self):
+        """Test bundle returns the summary and detailed payloads together"""
+        self.login_user('analyticsemployee@test.com')
+        summary = self.client.get('/api/analytics/employee/summary/').json()
+        detailed = self.client.get('/api/analytics/employee/detailed/', self.params).json()
+
+        response = self.client.get(self.URL, self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {'summary': summary, 'detailed': detailed})
+
+    def test_bundle_requires_authentication(self):
+        """Test unauthenticated request is rejected"""
+        response = self.client.get(self.URL, self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+    def test_bundle_forbidden_for_user_role(self):
+        """Test USER role cannot access employee analytics"""
+        self.login_user('analyticsuser@test.com')
+
+        response = self.client.get(self.URL, self.params)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(response.json()['error']['code'], 'FORBIDDEN')
+
+    def test_bundle_rejects_start_after_end(self):
+        """Test start_date after end_date returns 400"""
+        self.login_user('analyticsemployee@test.com')
+
+        response = self.client.get(self.URL, {'start_date': '2024-02-01', 'end_date': '2024-01-01'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = response.json()['error']
+        self.assertEqual(error['code'], 'VALIDATION_ERROR')
+        self.assertEqual(error['message'], 'start_date must be before end_date')
+
+    def test_bundle_requires_dates(self):
+        """Test missing date parameters return 400"""
+        self.login_user('analyticsemployee@test.com')
+
+        response = self.client.get(self.URL)
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.json()['error']['message'], 'start_date and end_date are required')
+
+    def test_bundle_served_from_cache_until_ticket_change(self):
+        """Test repeat requests hit the cache and a ticket change recomputes"""
+        self.login_user('analyticsemployee@test.com')
+
+        with mock.patch.object(
+            EmployeeAnalyticsService, '_compute_employee_analytics',
+            wraps=EmployeeAnalyticsService._compute_employee_analytics
+        ) as compute_summary, mock.patch.object(
+            EmployeeDetailedAnalyticsService, '_compute_employee_detailed_analytics',
+            wraps=EmployeeDetailedAnalyticsService._compute_employee_detailed_analytics
+        ) as compute_detailed:
+            first = self.client.get(self.URL, self.params)
+            second = self.client.get(self.URL, self.params)
+
+            # Miss then hit
+            self.assertEqual(compute_summary.call_count, 1)
+            self.assertEqual(compute_detailed.call_count, 1)
+            self.assertEqual(second.json(), first.json())
+
+            # Assigning a ticket invalidates the employee's analytics
+            self.create_ticket(self.requester, self.employee)
+            third = self.client.get(self.URL, self.params)
+
+            self.assertEqual(compute_summary.call_count, 2)
+            self.assertEqual(compute_detailed.call_count, 2)
+            self.assertNotEqual(third.json(), first.json())
+
+
+class EmployeeDetailedRollupTests(AnalyticsAPITestCase):
+    """Tests for rolling detailed analytics up from the daily series"""
+
+    DAY = date(2024, 1, 3)
+
+    def compute(self, rows):
+        """Run the roll-up over the given daily series rows"""
+        with mock.patch.object(
+            EmployeeDetailedAnalyticsService, '_get_daily_series', return_value=rows
+        ):
+            return EmployeeDetailedAnalyticsService._compute_employee_detailed_analytics(
+                str(self.employee.id), self.DAY, self.DAY
+            )
+
+    def test_avg_resolution_ignores_closed_without_closed_at(self):
+        """Test closed tickets lacking closed_at do not dilute the average"""
+        # (day, status, category_id, count, closed_count, resolved_count, resolution_hours)
+        result = self.compute([
+            (self.DAY, 'CLOSED', self.category.id, 3, 3, 2, 10.0),
+            (self.DAY, 'ASSIGNED', self.category.id, 1, 0, 0, None),
+        ])
+
+        self.assertEqual(result['summary'], {
+            'total': 4,
+            'open': 1,
+            'closed': 3,
+            'avg_resolution_hours': 5.0,
+        })
+
+    def test_zero_avg_resolution_is_reported(self):
+        """Test a real 0.0 average is not turned into None"""
+        result = self.compute([(self.DAY, 'CLOSED', self.category.id, 1, 1, 1, 0.0)])
+
+        self.assertEqual(result['summary']['avg_resolution_hours'], 0.0)
+
+    def test_no_resolved_tickets_has_no_average(self):
+        """Test the average is None when nothing was resolved"""
+        result = self.compute([(self.DAY, 'ASSIGNED', self.category.id, 2, 0, 0, None)])
+
+        self.assertIsNone(result['summary']['avg_resolution_hours'])
+
+
+class AnalyticsDateRangeValidationTests(AnalyticsAPITestCase):
+    """Tests for start_date / end_date validation on the date range endpoints"""
+
+    REVERSED = {'start_date': '2024-02-01', 'end_date': '2024-01-01'}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.manager = cls.create_user('analyticsmanager@test.com', [Role.MANAGER])
+
+    def endpoints(self):
+        """(url, login email) for every date range endpoint"""
+        return [
+            ('/api/analytics/manager/detailed/', 'analyticsmanager@test.com'),
+            ('/api/analytics/employee/detailed/', 'analyticsemployee@test.com'),
+            (f'/api/analytics/employee/{self.employee.id}/detailed/', 'analyticsemployee@test.com'),
+            ('/api/analytics/employee/bundle/', 'analyticsemployee@test.com'),
+        ]
+
+    def assert_validation_error(self, response, message):
+        """Assert the single-message VALIDATION_ERROR body"""
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        error = response.json()['error']
+        self.assertEqual(error['code'], 'VALIDATION_ERROR')
+        self.assertEqual(error['message'], message)
+        self.assertEqual(error['details'], [])
+
+    def test_missing_dates_rejected(self):
+        """Test a missing or blank date returns 400 on every endpoint"""
+        for url, email in self.endpoints():
+            with self.subTest(url=url):
+                self.login_user(email)
+                for params in ({}, {'start_date': '2024-01-01'}, {'start_date': '', 'end_date': '2024-01-31'}):
+                    response = self.client.get(url, params)
+                    self.assert_validation_error(response, 'start_date and end_date are required')
+
+    def test_invalid_date_format_rejected(self):
+        """Test a malformed date returns 400 on every endpoint"""
+        for url, email in self.endpoints():
+            with self.subTest(url=url):
+                self.login_user(email)
+                response = self.client.get(url, {'start_date': '01/02/2024', 'end_date': '2024-01-31'})
+                self.assert_validation_error(response, 'Invalid date format. Use YYYY-MM-DD')
+
+    def test_reversed_range_rejected_on_manager_and_bundle(self):
+        """Test start_date after end_date returns 400 where it always did"""
+        for url, email in (self.endpoints()[0], self.endpoints()[3]):
+            with self.subTest(url=url):
+                self.login_user(email)
+                response = self.client.get(url, self.REVERSED)
+                self.assert_validation_error(response, 'start_date must be before end_date')
+
+    def test_reversed_range_accepted_on_employee_detailed(self):
+        """Test employee detailed endpoints keep accepting start_date after end_date"""
+        self.login_user('analyticsemployee@test.com')
+        for url, _ in self.endpoints()[1:3]:
+            with self.subTest(url=url):
+                response = self.client.get(url, self.REVERSED)
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.json()['summary']['total'], 0)
@@ -0,0 +1,154 @@
+"""
+Audit Log Tests
+
+Tests for:
+- AuditService.log() - synchronous default and async on_commit hand-off
+- AuditLogWriter - enqueue, flush, overflow and background worker
+"""
+import time
+import uuid
+from unittest import mock
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from core import audit
+from core.audit import AuditLogWriter, AuditService
+from core.models import AuditLog
+
+
+def make_entry():
+    """Helper to build an unsaved audit log entry"""
+    return AuditLog(
+        event_type='ticket_create',
+        entity_type='Ticket',
+        entity_id=uuid.uuid4(),
+        request_id='-',
+    )
+
+
+def make_writer(maxsize=audit.AUDIT_QUEUE_MAXSIZE):
+    """Helper to build a writer whose queue is only drained by flush()"""
+    writer = AuditLogWriter(maxsize=maxsize)
+    writer._ensure_worker = lambda: None
+    return writer
+
+
+class AuditServiceLogTests(TestCase):
+    """Tests for AuditService.log() write modes"""
+
+    def test_log_writes_synchronously_by_default(self):
+        """Test the entry is INSERTed before log() returns"""
+        entry = AuditService.log('ticket_create', 'Ticket', uuid.uuid4())
+
+        self.assertTrue(AuditLog.objects.filter(id=entry.id).exists())
+
+    @override_settings(AUDIT_LOG_ASYNC=True)
+    def test_async_log_enqueues_on_commit(self):
+        """Test async entries reach the writer only once the transaction commits"""
+        writer = make_writer()
+
+        with mock.patch.object(audit, '_writer', writer):
+            with self.captureOnCommitCallbacks() as callbacks:
+                entry = AuditService.log('ticket_create', 'Ticket', uuid.uuid4())
+                self.assertEqual(writer._queue.qsize(), 0)
+
+            self.assertEqual(len(callbacks), 1)
+            callbacks[0]()
+
+        self.assertEqual(writer._queue.qsize(), 1)
+        self.assertFalse(AuditLog.objects.filter(id=entry.id).exists())
+
+        writer.flush()
+
+        self.assertTrue(AuditLog.objects.filter(id=entry.id).exists())
+
+    @override_settings(AUDIT_LOG_ASYNC=True)
+    def test_async_log_dropped_on_rollback(self):
+        """Test a rolled-back transaction never hands its entry to the writer"""
+        writer = make_writer()
+
+        with mock.patch.object(audit, '_writer', writer):
+            with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                try:
+                    with transaction.atomic():
+                        AuditService.log('ticket_create', 'Ticket', uuid.uuid4())
+                        raise ValueError('rollback')
+                except ValueError:
+                    pass
+
+        self.assertEqual(callbacks, [])
+        self.assertEqual(writer._queue.qsize(), 0)
+
+
+class AuditLogWriterTests(TestCase):
+    """Tests for the AuditLogWriter queue"""
+
+    def test_submit_enqueues_without_writing(self):
+        """Test submit() only queues the entry"""
+        writer = make_writer()
+
+        writer.submit(make_entry())
+
+        self.assertEqual(writer._queue.qsize(), 1)
+        self.assertEqual(AuditLog.objects.count(), 0)
+
+    def test_flush_writes_all_queued_entries_in_batches(self):
+        """Test flush() drains the queue in AUDIT_BATCH_SIZE chunks"""
+        writer = make_writer()
+        for _ in range(5):
+            writer.submit(make_entry())
+
+        with mock.patch.object(audit, 'AUDIT_BATCH_SIZE', 2), \
+                mock.patch.object(writer, '_write', wraps=writer._write) as write:
+            writer.flush()
+
+        self.assertEqual([len(call.args[0]) for call in write.call_args_list], [2, 2, 1])
+        self.assertEqual(writer._queue.qsize(), 0)
+        self.assertEqual(AuditLog.objects.count(), 5)
+
+    def test_full_queue_writes_synchronously(self):
+        """Test an entry that does not fit the queue is written, not dropped"""
+        writer = make_writer(maxsize=1)
+        queued, overflow = make_entry(), make_entry()
+
+        writer.submit(queued)
+        with self.assertLogs('core.audit', level='WARNING'):
+            writer.submit(overflow)
+
+        self.assertEqual(list(AuditLog.objects.values_list('id', flat=True)), [overflow.id])
+        self.assertEqual(writer._queue.qsize(), 1)
+
+        writer.flush()
+
+        self.assertEqual(AuditLog.objects.count(), 2)
+
+    def test_write_failure_is_logged_not_raised(self):
+        """Test a failed batch INSERT does not propagate"""
+        writer = make_writer()
+        writer.submit(make_entry())
+
+        with mock.patch.object(AuditLog.objects, 'bulk_create', side_effect=RuntimeError('db down')), \
+                self.assertLogs('core.audit', level='ERROR'):
+            writer.flush()
+
+        self.assertEqual(writer._queue.qsize(), 0)
+
+
+class AuditLogWriterWorkerTests(TransactionTestCase):
+    """Tests for the background worker thread"""
+
+    def test_worker_drains_queue(self):
+        """Test the worker thread writes submitted entries"""
+        writer = AuditLogWriter()
+        entries = [make_entry() for _ in range(3)]
+
+        for entry in entries:
+            writer.submit(entry)
+
+        deadline = time.monotonic() + 5
+        while AuditLog.objects.count() < len(entries) and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+        self.assertEqual(
+            set(AuditLog.objects.values_list('id', flat=True)),
+            {entry.id for entry in entries}
+        )
@@ -6,13 +6,19 @@ Tests for:
 - POST /api/auth/refresh/
 - POST /api/auth/logout/
 - GET /api/auth/me/
+- UserProfileSerializer role and org hierarchy fields
 """
 import uuid
 import bcrypt
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from rest_framework import status
-from accounts.models import User, Role, UserRole
+from accounts.authentication import USER_CACHE_FIELDS, _get_user_cache_key
+from accounts.models import User, Role, UserRole, BusinessGroup, Company, Department, Team
+from accounts.serializers import UserProfileSerializer
 
 
 class AuthenticationAPITests(TestCase):
@@ -29,6 +35,8 @@ class AuthenticationAPITests(TestCase):
     
     def setUp(self):
         """Set up test client and test user for each test"""
+        # Users, roles and profiles are cached - start every test cold
+        cache.clear()
         self.client = APIClient()
         
         # Create test user with hashed password
@@ -43,7 +51,7 @@ class AuthenticationAPITests(TestCase):
             alias='testuser',
             name='Test User',
             email='test@example.com',
-            password_hash=password_hash,
+            password=password_hash,
             is_active=True
         )
         
@@ -229,3 +237,193 @@ class BCryptPasswordTests(TestCase):
         # Both should verify correctly
         self.assertTrue(AuthService.verify_password(password, hash1))
         self.assertTrue(AuthService.verify_password(password, hash2))
+
+
+class JWTUserCacheTests(TestCase):
+    """Test cached JWT user resolution in CustomJWTAuthentication"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for all tests"""
+        Role.objects.create(id=1, name='USER')
+        cls.test_user = User.objects.create_user(
+            'cached@example.com', 'Cached User', 'cacheduser', 'TestPassword123!'
+        )
+        UserRole.objects.create(
+            id=uuid.uuid4(),
+            user=cls.test_user,
+            role=Role.objects.get(id=Role.USER)
+        )
+    
+    def setUp(self):
+        """Log in with a cold cache"""
+        cache.clear()
+        self.client = APIClient()
+        response = self.client.post('/api/auth/login/', {
+            'email': 'cached@example.com',
+            'password': 'TestPassword123!'
+        })
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {response.data['access_token']}")
+        self.cache_key = _get_user_cache_key(self.test_user.id)
+    
+    def user_queries(self, queries):
+        """SELECTs against the User table"""
+        return [q for q in queries if q['sql'].startswith('SELECT') and 'FROM "User"' in q['sql']]
+    
+    def test_cache_miss_loads_user_once(self):
+        """Test a miss caches the user and /me reads no deferred fields"""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/auth/me/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(self.user_queries(queries)), 1)
+        self.assertEqual(response.data['alias'], 'cacheduser')
+        self.assertIsNotNone(response.data['last_login'])
+        
+        cached = cache.get(self.cache_key)
+        self.assertEqual(cached.id, self.test_user.id)
+        self.assertEqual(cached.get_deferred_fields() & set(USER_CACHE_FIELDS), set())
+        self.assertIn('password', cached.get_deferred_fields())
+    
+    def test_cache_hit_skips_user_query(self):
+        """Test a repeat request resolves the user from the cache"""
+        self.client.get('/api/auth/me/')
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/api/auth/me/')
+        
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self.user_queries(queries), [])
+    
+    def test_deactivated_user_rejected_despite_cache(self):
+        """Test saving is_active=False invalidates the cached user"""
+        self.assertEqual(self.client.get('/api/auth/me/').status_code, status.HTTP_200_OK)
+        self.assertIsNotNone(cache.get(self.cache_key))
+        
+        self.test_user.is_active = False
+        self.test_user.save()
+        
+        self.assertIsNone(cache.get(self.cache_key))
+        response = self.client.get('/api/auth/me/')
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+
+
+class UserProfileSerializerTests(TestCase):
+    """Test role and org hierarchy fields of UserProfileSerializer"""
+    
+    @classmethod
+    def setUpTestData(cls):
+        """Create an org hierarchy and users scoped to it"""
+        Role.objects.create(id=1, name='USER')
+        Role.objects.create(id=2, name='EMPLOYEE')
+        cls.group = BusinessGroup.objects.create(name='Group A')
+        cls.company = Company.objects.create(business_group=cls.group, name='Company A')
+        cls.department = Department.objects.create(company=cls.company, name='Support')
+        cls.team = Team.objects.create(department=cls.department, name='Service Desk')
+        
+        other_group = BusinessGroup.objects.create(name='Group B')
+        other_company = Company.objects.create(business_group=other_group, name='Company B')
+        cls.other_department = Department.objects.create(company=other_company, name='Finance')
+        
+        cls.team_user = User.objects.create_user(
+            'team@example.com', 'Team User', 'teamuser', 'TestPassword123!'
+        )
+        UserRole.objects.create(user=cls.team_user, role_id=2, team=cls.team)
+        UserRole.objects.create(user=cls.team_user, role_id=1)
+        
+        cls.dept_user = User.objects.create_user(
+            'dept@example.com', 'Dept User', 'deptuser', 'TestPassword123!'
+        )
+        UserRole.objects.create(
+            user=cls.dept_user, role_id=2,
+            department=cls.other_department, team=cls.team
+        )
+        
+        cls.no_role_user = User.objects.create_user(
+            'norole@example.com', 'No Role User', 'noroleuser', 'TestPassword123!'
+        )
+    
+    def ref(self, obj):
+        """Expected {id, name} ref for an org object"""
+        return {'id': str(obj.id), 'name': obj.name}
+    
+    def role_row(self, **values):
+        """UserRole values() row with every org column empty unless given"""
+        row = dict.fromkeys(UserProfileSerializer.USER_ROLE_VALUES)
+        row.update(user_id=self.team_user.id, role__id=2, role__name='EMPLOYEE')
+        row.update(values)
+        return row
+    
+    def test_load_user_roles_single_query(self):
+        """Test all role and org fields are served by one UserRole query"""
+        with self.assertNumQueries(1):
+            data = UserProfileSerializer(self.team_user).data
+        
+        self.assertEqual(data['roles'], ['USER', 'EMPLOYEE'])
+    
+    def test_load_user_roles_batches_list(self):
+        """Test many=True loads the roles of every user in one query"""
+        users = [self.team_user, self.dept_user, self.no_role_user]
+        
+        with self.assertNumQueries(1):
+            data = UserProfileSerializer(users, many=True).data
+        
+        self.assertEqual([item['roles'] for item in data], [['USER', 'EMPLOYEE'], ['EMPLOYEE'], []])
+    
+    def test_load_user_roles_memoized_per_context(self):
+        """Test the rows are reused from the serializer context"""
+        context = {}
+        UserProfileSerializer(self.team_user, context=context).data
+        
+        with self.assertNumQueries(0):
+            UserProfileSerializer(self.team_user, context=context).data
+        
+        self.assertIn(self.team_user.id, context['_user_roles_cache'])
+    
+    def test_org_hierarchy_from_team(self):
+        """Test department, company and business group inherited through the team"""
+        data = UserProfileSerializer(self.team_user).data
+        
+        self.assertEqual(data['team'], self.ref(self.team))
+        self.assertEqual(data['department'], self.ref(self.department))
+        self.assertEqual(data['company'], self.ref(self.company))
+        self.assertEqual(data['business_group'], self.ref(self.group))
+    
+    def test_direct_department_preferred_over_team(self):
+        """Test a directly assigned department wins over the team's"""
+        data = UserProfileSerializer(self.dept_user).data
+        
+        self.assertEqual(data['team'], self.ref(self.team))
+        self.assertEqual(data['department'], self.ref(self.other_department))
+        self.assertEqual(data['company']['name'], 'Company B')
+        self.assertEqual(data['business_group']['name'], 'Group B')
+    
+    def test_business_group_falls_back_to_team_path(self):
+        """Test a department without a business group falls back to the team's"""
+        row = self.role_row(
+            team__id=self.team.id, team__name=self.team.name,
+            department__id=self.other_department.id,
+            department__name=self.other_department.name,
+            team__department__id=self.department.id,
+            team__department__name=self.department.name,
+            team__department__company__id=self.company.id,
+            team__department__company__name=self.company.name,
+            team__department__company__business_group__id=self.group.id,
+            team__department__company__business_group__name=self.group.name,
+        )
+        context = {'_user_roles_cache': {self.team_user.id: [row]}}
+        
+        with self.assertNumQueries(0):
+            data = UserProfileSerializer(self.team_user, context=context).data
+        
+        self.assertEqual(data['department'], self.ref(self.other_department))
+        self.assertEqual(data['company'], self.ref(self.company))
+        self.assertEqual(data['business_group'], self.ref(self.group))
+    
+    def test_no_roles_returns_empty_hierarchy(self):
+        """Test a user without role assignments has no org refs"""
+        data = UserProfileSerializer(self.no_role_user).data
+        
+        self.assertEqual(data['roles'], [])
+        for field in ('team', 'department', 'company', 'business_group'):
+            self.assertIsNone(data[field])
@@ -0,0 +1,291 @@
+"""
+Cache Invalidation Signal Tests
+
+Tests for:
+- accounts.signals - cached JWT user, role names, /me profile and
+  manager team member IDs on User / UserRole / Team save and delete
+- analytics.signals - cached category names on Category save and delete,
+  assignee analytics versions on Ticket save, reassign and delete
+"""
+import uuid
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from accounts.authentication import _get_user_cache_key
+from accounts.models import User, Role, UserRole, Department, Company, BusinessGroup, Team
+from accounts.services import AuthService, _get_profile_cache_key
+from analytics.services import (
+    ManagerAnalyticsService,
+    _get_assignee_version,
+    _get_assignee_version_key,
+    _get_category_names,
+    _get_daily_series_version_key,
+    _get_team_members_cache_key,
+    CATEGORY_NAMES_CACHE_KEY,
+)
+from tickets.models import Ticket, Category, SubCategory
+
+
+class SignalTestCase(TestCase):
+    """Base test case with an org hierarchy and a cold cache"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create test data once for all tests"""
+        Role.objects.create(id=1, name='USER')
+        Role.objects.create(id=2, name='EMPLOYEE')
+        Role.objects.create(id=3, name='MANAGER')
+
+        business_group = BusinessGroup.objects.create(id=uuid.uuid4(), name='Test Business Group')
+        company = Company.objects.create(id=uuid.uuid4(), name='Test Company', business_group=business_group)
+        cls.department = Department.objects.create(id=uuid.uuid4(), name='IT Department', company=company)
+
+        cls.manager = cls.create_user('manager@test.com', Role.MANAGER)
+        cls.other_manager = cls.create_user('othermanager@test.com', Role.MANAGER)
+        cls.employee = cls.create_user('employee@test.com', Role.EMPLOYEE)
+        cls.team = Team.objects.create(id=uuid.uuid4(), name='Service Desk', department=cls.department, manager=cls.manager)
+        cls.other_team = Team.objects.create(id=uuid.uuid4(), name='Field Support', department=cls.department, manager=cls.other_manager)
+
+    @classmethod
+    def create_user(cls, email, role_id):
+        """Helper to create a user with one role"""
+        alias = email.split('@')[0]
+        user = User.objects.create_user(email, f'Test {alias}', alias, 'TestPass123!')
+        UserRole.objects.create(id=uuid.uuid4(), user=user, role_id=role_id)
+        return user
+
+    def setUp(self):
+        # Every test primes the cache itself
+        cache.clear()
+
+
+class UserSignalTests(SignalTestCase):
+    """Test User save/delete invalidation"""
+
+    def test_user_save_refreshes_profile(self):
+        """Test a renamed user is served fresh from /me"""
+        self.assertEqual(AuthService.get_user_profile(self.employee)['name'], 'Test employee')
+
+        self.employee.name = 'Renamed Employee'
+        self.employee.save()
+
+        self.assertEqual(AuthService.get_user_profile(self.employee)['name'], 'Renamed Employee')
+
+    def test_user_save_drops_cached_jwt_user(self):
+        """Test saving a user drops its cached JWT resolution"""
+        cache.set(_get_user_cache_key(self.employee.id), self.employee)
+
+        self.employee.save()
+
+        self.assertIsNone(cache.get(_get_user_cache_key(self.employee.id)))
+
+    def test_user_delete_drops_cached_entries(self):
+        """Test deleting a user drops its cached user and profile"""
+        user = self.create_user('deleted@test.com', Role.USER)
+        user_id = user.id
+        cache.set(_get_user_cache_key(user_id), user)
+        AuthService.get_user_profile(user)
+
+        user.delete()
+
+        self.assertIsNone(cache.get(_get_user_cache_key(user_id)))
+        self.assertIsNone(cache.get(_get_profile_cache_key(user_id)))
+
+
+class UserRoleSignalTests(SignalTestCase):
+    """Test UserRole save/delete invalidation"""
+
+    def test_role_added_refreshes_roles_and_profile(self):
+        """Test a new assignment shows up in cached roles and profile"""
+        self.assertEqual(AuthService.get_user_roles(self.employee), ['EMPLOYEE'])
+        self.assertEqual(AuthService.get_user_profile(self.employee)['roles'], ['EMPLOYEE'])
+
+        UserRole.objects.create(id=uuid.uuid4(), user=self.employee, role_id=Role.USER)
+
+        self.assertEqual(sorted(AuthService.get_user_roles(self.employee)), ['EMPLOYEE', 'USER'])
+        self.assertEqual(AuthService.get_user_profile(self.employee)['roles'], ['USER', 'EMPLOYEE'])
+
+    def test_role_deleted_refreshes_roles(self):
+        """Test a removed assignment drops out of cached roles"""
+        user_role = UserRole.objects.create(id=uuid.uuid4(), user=self.employee, role_id=Role.USER)
+        self.assertEqual(sorted(AuthService.get_user_roles(self.employee)), ['EMPLOYEE', 'USER'])
+
+        user_role.delete()
+
+        self.assertEqual(AuthService.get_user_roles(self.employee), ['EMPLOYEE'])
+
+    def test_team_assignment_refreshes_profile(self):
+        """Test moving a role into a team shows up in the cached profile"""
+        self.assertIsNone(AuthService.get_user_profile(self.employee)['team'])
+
+        user_role = UserRole.objects.get(user=self.employee)
+        user_role.team = self.team
+        user_role.save()
+
+        profile = AuthService.get_user_profile(self.employee)
+        self.assertEqual(profile['team'], {'id': str(self.team.id), 'name': 'Service Desk'})
+        self.assertEqual(profile['department']['id'], str(self.department.id))
+
+
+class TeamMemberSignalTests(SignalTestCase):
+    """Test Team/UserRole invalidation of cached team member IDs"""
+
+    def test_member_added_refreshes_team(self):
+        """Test a new team membership shows up for the manager"""
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.manager), [])
+
+        UserRole.objects.create(id=uuid.uuid4(), user=self.employee, role_id=Role.USER, team=self.team)
+
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.manager), [self.employee.id])
+
+    def test_member_removed_refreshes_team(self):
+        """Test a deleted team membership drops out for the manager"""
+        user_role = UserRole.objects.create(id=uuid.uuid4(), user=self.employee, role_id=Role.USER, team=self.team)
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.manager), [self.employee.id])
+
+        user_role.delete()
+
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.manager), [])
+
+    def test_member_moved_refreshes_both_teams(self):
+        """Test moving a UserRole between teams refreshes the old and new manager"""
+        user_role = UserRole.objects.create(id=uuid.uuid4(), user=self.employee, role_id=Role.USER, team=self.team)
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.manager), [self.employee.id])
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.other_manager), [])
+
+        user_role.team = self.other_team
+        user_role.save()
+
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.manager), [])
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.other_manager), [self.employee.id])
+
+    def test_manager_change_refreshes_both_managers(self):
+        """Test reassigning a team's manager refreshes the old and new manager"""
+        UserRole.objects.create(id=uuid.uuid4(), user=self.employee, role_id=Role.USER, team=self.team)
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.manager), [self.employee.id])
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.other_manager), [])
+
+        self.team.manager = self.other_manager
+        self.team.save()
+
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.manager), [])
+        self.assertEqual(ManagerAnalyticsService.get_team_member_ids(self.other_manager), [self.employee.id])
+
+    def test_team_delete_refreshes_manager(self):
+        """Test deleting a team drops the manager's cached member IDs"""
+        team = Team.objects.create(id=uuid.uuid4(), name='Temporary', department=self.department, manager=self.manager)
+        ManagerAnalyticsService.get_team_member_ids(self.manager)
+        self.assertIsNotNone(cache.get(_get_team_members_cache_key(self.manager.id)))
+
+        team.delete()
+
+        self.assertIsNone(cache.get(_get_team_members_cache_key(self.manager.id)))
+
+
+class CategorySignalTests(SignalTestCase):
+    """Test Category save/delete invalidation of cached category names"""
+
+    def test_category_rename_refreshes_names(self):
+        """Test a renamed category is served fresh from the name map"""
+        category = Category.objects.create(id=uuid.uuid4(), name='Hardware', is_active=True)
+        self.assertEqual(_get_category_names([category.id])[category.id], 'Hardware')
+
+        category.name = 'Devices'
+        category.save()
+
+        self.assertEqual(_get_category_names([category.id])[category.id], 'Devices')
+
+    def test_category_delete_drops_names(self):
+        """Test deleting a category drops the cached name map"""
+        category = Category.objects.create(id=uuid.uuid4(), name='Hardware', is_active=True)
+        _get_category_names([category.id])
+        self.assertIsNotNone(cache.get(CATEGORY_NAMES_CACHE_KEY))
+
+        category.delete()
+
+        self.assertIsNone(cache.get(CATEGORY_NAMES_CACHE_KEY))
+        self.assertNotIn(category.id, _get_category_names([]))
+
+
+class TicketSignalTests(SignalTestCase):
+    """Test Ticket save/delete bumps of assignee analytics versions"""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Create ticket lookup data once for all tests"""
+        super().setUpTestData()
+        cls.category = Category.objects.create(id=uuid.uuid4(), name='Hardware', is_active=True)
+        cls.subcategory = SubCategory.objects.create(
+            id=uuid.uuid4(),
+            name='Laptop Issues',
+            category=cls.category,
+            department=cls.department,
+            is_active=True
+        )
+        cls.other_employee = cls.create_user('otheremployee@test.com', Role.EMPLOYEE)
+
+    def create_ticket(self, assigned_to):
+        """Helper to create a ticket assigned to an employee"""
+        return Ticket.objects.create(
+            id=uuid.uuid4(),
+            ticket_number=f'TKT-TEST-{uuid.uuid4().hex[:8]}',
+            title='Laptop not working',
+            description='Screen is broken',
+            category=self.category,
+            subcategory=self.subcategory,
+            department=self.department,
+            created_by=self.manager,
+            assigned_to=assigned_to,
+            status='ASSIGNED',
+        )
+
+    def daily_version(self, user, ticket):
+        """Cached daily series version for the ticket's creation month"""
+        created = timezone.localtime(ticket.created_at)
+        return cache.get(_get_daily_series_version_key(user.id, created.year, created.month))
+
+    def test_ticket_create_bumps_assignee_version(self):
+        """Test creating an assigned ticket bumps the assignee's version"""
+        version = _get_assignee_version(self.employee.id)
+
+        self.create_ticket(self.employee)
+
+        self.assertEqual(_get_assignee_version(self.employee.id), version + 1)
+
+    def test_ticket_save_bumps_daily_series_month(self):
+        """Test saving a ticket bumps the daily series version for its month"""
+        ticket = self.create_ticket(self.employee)
+        month_version = self.daily_version(self.employee, ticket)
+        self.assertIsNotNone(month_version)
+
+        ticket.status = 'IN_PROGRESS'
+        ticket.save()
+
+        self.assertEqual(self.daily_version(self.employee, ticket), month_version + 1)
+
+    def test_ticket_reassign_bumps_both_assignees(self):
+        """Test reassigning a ticket bumps the old and new assignee's version"""
+        ticket = self.create_ticket(self.employee)
+        old_version = _get_assignee_version(self.employee.id)
+        new_version = _get_assignee_version(self.other_employee.id)
+
+        ticket.assigned_to = self.other_employee
+        ticket.save()
+
+        self.assertEqual(_get_assignee_version(self.employee.id), old_version + 1)
+        self.assertEqual(_get_assignee_version(self.other_employee.id), new_version + 1)
+
+    def test_ticket_delete_bumps_assignee_version(self):
+        """Test deleting a ticket bumps the assignee's version"""
+        ticket = self.create_ticket(self.employee)
+        version = _get_assignee_version(self.employee.id)
+
+        ticket.delete()
+
+        self.assertEqual(_get_assignee_version(self.employee.id), version + 1)
+
+    def test_unassigned_ticket_bumps_nothing(self):
+        """Test an unassigned ticket leaves assignee versions alone"""
+        self.create_ticket(None)
+
+        self.assertIsNone(cache.get(_get_assignee_version_key(self.employee.id)))
@@ -0,0 +1,156 @@
+"""
+Exception Handler Tests
+
+Tests for:
+- custom_exception_handler - MRO dispatch to the handler table
+- Error envelope {"error": {"code", "message", "details"}}
+- Detail-less errors: pre-encoded bodies shared, payload dicts not
+"""
+import orjson
+from django.core.exceptions import ObjectDoesNotExist
+from django.http import Http404
+from django.test import SimpleTestCase
+from rest_framework import status
+from rest_framework.exceptions import (
+    ValidationError as DRFValidationError,
+    AuthenticationFailed,
+    NotAuthenticated,
+    PermissionDenied,
+    Throttled,
+)
+from accounts.models import User
+from core.exceptions import (
+    ErrorCode,
+    ForbiddenError,
+    ResourceNotFoundError,
+    ValidationError,
+    VersionConflictError,
+    custom_exception_handler,
+    format_error_response,
+)
+from core.renderers import render_json
+
+
+class ExceptionDispatchTests(SimpleTestCase):
+    """Test exceptions resolve to the right handler"""
+
+    def handle(self, exc):
+        """Run the handler with an empty view context"""
+        return custom_exception_handler(exc, {})
+
+    def test_api_exception_subclasses(self):
+        """Test APIException subclasses keep their status, code and message"""
+        cases = [
+            (ResourceNotFoundError(), status.HTTP_404_NOT_FOUND, ErrorCode.NOT_FOUND, 'Resource not found'),
+            (ForbiddenError('Nope'), status.HTTP_403_FORBIDDEN, ErrorCode.FORBIDDEN, 'Nope'),
+            (VersionConflictError(), status.HTTP_409_CONFLICT, ErrorCode.VERSION_CONFLICT, VersionConflictError.default_message),
+        ]
+        for exc, status_code, code, message in cases:
+            with self.subTest(exc=type(exc).__name__):
+                response = self.handle(exc)
+
+                self.assertEqual(response.status_code, status_code)
+                self.assertEqual(response.data['error']['code'], code)
+                self.assertEqual(response.data['error']['message'], message)
+
+    def test_api_exception_details(self):
+        """Test details passed to an APIException reach the envelope"""
+        details = [{'field': 'title', 'message': 'Required'}]
+
+        response = self.handle(ValidationError('Validation failed', details))
+
+        self.assertEqual(response.data['error']['details'], details)
+        self.assertFalse(hasattr(response, 'rendered_json'))
+
+    def test_not_found_family(self):
+        """Test Http404 and Model.DoesNotExist subclasses map to 404"""
+        for exc in (Http404(), ObjectDoesNotExist(), User.DoesNotExist()):
+            with self.subTest(exc=type(exc).__name__):
+                response = self.handle(exc)
+
+                self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+                self.assertEqual(response.data['error']['code'], ErrorCode.NOT_FOUND)
+
+    def test_drf_auth_and_permission_errors(self):
+        """Test DRF auth errors map to 401 and permission errors to 403"""
+        cases = [
+            (NotAuthenticated(), status.HTTP_401_UNAUTHORIZED, ErrorCode.UNAUTHORIZED),
+            (AuthenticationFailed(), status.HTTP_401_UNAUTHORIZED, ErrorCode.UNAUTHORIZED),
+            (PermissionDenied(), status.HTTP_403_FORBIDDEN, ErrorCode.FORBIDDEN),
+        ]
+        for exc, status_code, code in cases:
+            with self.subTest(exc=type(exc).__name__):
+                response = self.handle(exc)
+
+                self.assertEqual(response.status_code, status_code)
+                self.assertEqual(response.data['error']['code'], code)
+
+    def test_drf_validation_error_details(self):
+        """Test field and non-field validation messages become details"""
+        response = self.handle(DRFValidationError({'title': ['Required'], 'priority': 'Invalid'}))
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data['error']['details'], [
+            {'field': 'title', 'message': 'Required'},
+            {'field': 'priority', 'message': 'Invalid'},
+        ])
+
+        response = self.handle(DRFValidationError(['Bad range']))
+
+        self.assertEqual(response.data['error']['details'], [
+            {'field': 'non_field_error', 'message': 'Bad range'},
+        ])
+
+    def test_unmapped_drf_exception_uses_default_handler(self):
+        """Test DRF exceptions outside the table keep their status code"""
+        response = self.handle(Throttled())
+
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+        self.assertEqual(response.data['error']['code'], ErrorCode.INTERNAL_ERROR)
+
+    def test_unhandled_exception_hides_details(self):
+        """Test unknown exceptions return a generic 500 and are logged"""
+        with self.assertLogs('core.exceptions', level='ERROR'):
+            response = self.handle(RuntimeError('SELECT * FROM secret'))
+
+        self.assertEqual(response.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR)
+        self.assertEqual(response.data['error']['message'], 'An unexpected error occurred')
+
+
+class StaticErrorPayloadTests(SimpleTestCase):
+    """Test detail-less error payloads are never shared between responses"""
+
+    def test_format_error_response_returns_fresh_dicts(self):
+        """Test repeated calls return independent payloads"""
+        first = format_error_response(ErrorCode.NOT_FOUND, 'Resource not found')
+        second = format_error_response(ErrorCode.NOT_FOUND, 'Resource not found')
+
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertIsNot(first['error'], second['error'])
+        self.assertIsNot(first['error']['details'], second['error']['details'])
+
+    def test_mutating_response_data_does_not_leak(self):
+        """Test edits to one response's data do not reach the next"""
+        first = custom_exception_handler(NotAuthenticated(), {})
+        first.data['error']['message'] = 'Changed'
+        first.data['error']['details'].append({'field': 'token', 'message': 'Expired'})
+
+        second = custom_exception_handler(NotAuthenticated(), {})
+
+        self.assertEqual(second.data, {
+            'error': {
+                'code': ErrorCode.UNAUTHORIZED,
+                'message': 'Authentication required',
+                'details': [],
+            }
+        })
+
+    def test_rendered_body_matches_payload(self):
+        """Test the cached pre-encoded body encodes the response data"""
+        first = custom_exception_handler(Http404(), {})
+        second = custom_exception_handler(Http404(), {})
+
+        self.assertIs(first.rendered_json, second.rendered_json)
+        self.assertEqual(first.rendered_json, render_json(first.data))
+        self.assertEqual(orjson.loads(first.rendered_json)['error']['code'], ErrorCode.NOT_FOUND)
@@ -0,0 +1,180 @@
+"""
+Logging Tests
+
+Tests for:
+- Request context (ContextVar) - set, restore, clear and isolation
+- RequestContextFilter - injecting context into log records
+- JSONFormatter - output fields and the per-record encoded line cache
+"""
+import logging
+import sys
+import threading
+import uuid
+import orjson
+from django.test import SimpleTestCase
+from core.logging import (
+    JSONFormatter,
+    RequestContextFilter,
+    clear_request_context,
+    get_request_id,
+    get_user_id,
+    get_user_roles,
+    set_request_context,
+)
+
+
+def make_record(msg='Ticket created', args=(), exc_info=None):
+    """Helper to build a log record"""
+    return logging.LogRecord(
+        'tickets.services', logging.INFO, __file__, 42, msg, args, exc_info, func='create_ticket'
+    )
+
+
+class RequestContextTests(SimpleTestCase):
+    """Test ContextVar-backed request context"""
+
+    def tearDown(self):
+        clear_request_context()
+
+    def test_set_and_get(self):
+        """Test the getters return the values that were set"""
+        set_request_context('req-1', 'user-1', ['EMPLOYEE', 'MANAGER'])
+
+        self.assertEqual(get_request_id(), 'req-1')
+        self.assertEqual(get_user_id(), 'user-1')
+        self.assertEqual(get_user_roles(), ['EMPLOYEE', 'MANAGER'])
+
+    def test_clear_with_tokens_restores_previous(self):
+        """Test tokens restore the outer context after a nested one"""
+        outer = set_request_context('outer', 'user-1', ['USER'])
+        inner = set_request_context('inner', 'user-2', ['ADMIN'])
+        self.assertEqual(get_request_id(), 'inner')
+
+        clear_request_context(inner)
+
+        self.assertEqual(get_request_id(), 'outer')
+        self.assertEqual(get_user_id(), 'user-1')
+        self.assertEqual(get_user_roles(), ['USER'])
+
+        clear_request_context(outer)
+
+        self.assertIsNone(get_request_id())
+        self.assertEqual(get_user_roles(), [])
+
+    def test_clear_without_tokens_resets(self):
+        """Test clearing without tokens empties the context"""
+        set_request_context('req-1', 'user-1', ['USER'])
+
+        clear_request_context()
+
+        self.assertIsNone(get_request_id())
+        self.assertIsNone(get_user_id())
+        self.assertEqual(get_user_roles(), [])
+
+    def test_context_not_shared_between_threads(self):
+        """Test a context set in one thread is invisible to another"""
+        set_request_context('main', 'user-1', ['USER'])
+        seen = {}
+
+        def worker():
+            seen['before'] = get_request_id()
+            set_request_context('worker')
+            seen['after'] = get_request_id()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        self.assertEqual(seen, {'before': None, 'after': 'worker'})
+        self.assertEqual(get_request_id(), 'main')
+
+
+class RequestContextFilterTests(SimpleTestCase):
+    """Test RequestContextFilter record injection"""
+
+    def tearDown(self):
+        clear_request_context()
+
+    def test_injects_context(self):
+        """Test records carry the current request context"""
+        set_request_context('req-1', 'user-1', ['EMPLOYEE', 'MANAGER'])
+        record = make_record()
+
+        self.assertTrue(RequestContextFilter().filter(record))
+
+        self.assertEqual(record.request_id, 'req-1')
+        self.assertEqual(record.user_id, 'user-1')
+        self.assertEqual(record.roles, 'EMPLOYEE,MANAGER')
+
+    def test_defaults_outside_request(self):
+        """Test records outside a request get '-' placeholders"""
+        record = make_record()
+
+        RequestContextFilter().filter(record)
+
+        self.assertEqual((record.request_id, record.user_id, record.roles), ('-', '-', '-'))
+
+    def test_first_filter_wins(self):
+        """Test a second handler's filter keeps the values already set"""
+        set_request_context('req-1')
+        record = make_record()
+        RequestContextFilter().filter(record)
+
+        set_request_context('req-2')
+        RequestContextFilter().filter(record)
+
+        self.assertEqual(record.request_id, 'req-1')
+
+
+class JSONFormatterTests(SimpleTestCase):
+    """Test JSONFormatter output and caching"""
+
+    def tearDown(self):
+        clear_request_context()
+
+    def format(self, record):
+        """Filter then format a record, as a configured handler does"""
+        RequestContextFilter().filter(record)
+        return JSONFormatter().format(record)
+
+    def test_output_fields(self):
+        """Test the line is JSON with message, context and location"""
+        set_request_context('req-1', 'user-1', ['EMPLOYEE'])
+
+        data = orjson.loads(self.format(make_record('Ticket %s created', ('TKT-1',))))
+
+        self.assertEqual(data['message'], 'Ticket TKT-1 created')
+        self.assertEqual(data['level'], 'INFO')
+        self.assertEqual(data['logger'], 'tickets.services')
+        self.assertEqual(data['request_id'], 'req-1')
+        self.assertEqual(data['user_id'], 'user-1')
+        self.assertEqual(data['roles'], 'EMPLOYEE')
+        self.assertEqual(data['function'], 'create_ticket')
+        self.assertEqual(data['line'], 42)
+        self.assertTrue(data['timestamp'].endswith('Z'))
+
+    def test_extra_data_and_exception(self):
+        """Test non-JSON extra values are stringified and tracebacks included"""
+        ticket_id = uuid.uuid4()
+        try:
+            raise ValueError('boom')
+        except ValueError:
+            record = make_record(exc_info=sys.exc_info())
+        record.extra_data = {'ticket_id': ticket_id, 1: object}
+
+        data = orjson.loads(self.format(record))
+
+        self.assertEqual(data['extra']['ticket_id'], str(ticket_id))
+        self.assertIn('1', data['extra'])
+        self.assertIn('ValueError: boom', data['exception'])
+
+    def test_record_encoded_once(self):
+        """Test each record is encoded once and the line reused by every handler"""
+        record = make_record()
+        first = self.format(record)
+
+        record.msg = 'Changed after formatting'
+        second = JSONFormatter().format(record)
+
+        self.assertIs(second, first)
+        self.assertIs(record._json_formatted, first)
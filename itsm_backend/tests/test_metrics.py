@@ -0,0 +1,155 @@
+"""
+Metrics Tests
+
+Tests for:
+- MetricsRegistry counters and histograms (labels, percentiles, reset)
+- _SampleRing - bounded sample store overwriting the oldest samples
+- Sharded locks - exact counts under concurrent writers
+- record_request() and Prometheus text export
+"""
+import threading
+from django.test import SimpleTestCase
+from core import metrics as metrics_module
+from core.metrics import MetricsRegistry, _SampleRing, record_request
+
+
+class SampleRingTests(SimpleTestCase):
+    """Test the bounded histogram sample store"""
+
+    def test_appends_until_full(self):
+        """Test samples are appended while below capacity"""
+        ring = _SampleRing(3)
+        ring.add(1.0)
+        ring.add(2.0)
+
+        self.assertEqual(len(ring), 2)
+        self.assertEqual(list(ring.samples), [1.0, 2.0])
+
+    def test_overwrites_oldest_when_full(self):
+        """Test a full ring keeps only the most recent samples"""
+        ring = _SampleRing(3)
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+            ring.add(value)
+
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(sorted(ring.samples), [3.0, 4.0, 5.0])
+
+    def test_registry_histogram_bounded(self):
+        """Test histograms never hold more than the sample cap"""
+        registry = MetricsRegistry()
+        registry._max_histogram_samples = 10
+        for value in range(25):
+            registry.observe_histogram('latency', float(value))
+
+        ring = registry._histograms['latency'][()]
+        self.assertEqual(len(ring), 10)
+        self.assertEqual(sorted(ring.samples), [float(v) for v in range(15, 25)])
+
+
+class MetricsRegistryTests(SimpleTestCase):
+    """Test counters, percentiles, export and reset"""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_counter_labels_order_independent(self):
+        """Test label order does not split a counter series"""
+        self.registry.increment_counter('requests', method='GET', path='/a')
+        self.registry.increment_counter('requests', path='/a', method='GET')
+        self.registry.increment_counter('requests', 2, method='POST', path='/a')
+
+        self.assertEqual(self.registry.get_counter('requests', method='GET', path='/a'), 2)
+        self.assertEqual(self.registry.get_counter('requests', method='POST', path='/a'), 2)
+        self.assertEqual(self.registry.get_counter('requests', method='PUT', path='/a'), 0)
+
+    def test_histogram_percentile(self):
+        """Test percentiles index the sorted samples"""
+        for value in range(1, 101):
+            self.registry.observe_histogram('latency', float(value), path='/a')
+
+        self.assertEqual(self.registry.get_histogram_percentile('latency', 50, path='/a'), 51.0)
+        self.assertEqual(self.registry.get_histogram_percentile('latency', 95, path='/a'), 96.0)
+        self.assertEqual(self.registry.get_histogram_percentile('latency', 100, path='/a'), 100.0)
+        self.assertIsNone(self.registry.get_histogram_percentile('latency', 95, path='/b'))
+
+    def test_export_prometheus(self):
+        """Test counters and summaries are exported in text format"""
+        self.registry.increment_counter('requests', method='GET')
+        self.registry.increment_counter('plain')
+        for value in (0.1, 0.2, 0.3, 0.4):
+            self.registry.observe_histogram('latency', value, method='GET')
+
+        lines = self.registry.export_prometheus().split('\n')
+
+        self.assertIn('# TYPE requests counter', lines)
+        self.assertIn('requests{method="GET"} 1', lines)
+        self.assertIn('plain 1', lines)
+        self.assertIn('# TYPE latency summary', lines)
+        self.assertIn('latency{method="GET",quantile="0.5"} 0.300000', lines)
+        self.assertIn('latency{method="GET",quantile="0.99"} 0.400000', lines)
+        self.assertIn('latency_count{method="GET"} 4', lines)
+        self.assertIn('latency_sum{method="GET"} 1.000000', lines)
+
+    def test_reset(self):
+        """Test reset drops every counter and histogram"""
+        self.registry.increment_counter('requests')
+        self.registry.observe_histogram('latency', 0.1)
+
+        self.registry.reset()
+
+        self.assertEqual(self.registry.get_counter('requests'), 0)
+        self.assertIsNone(self.registry.get_histogram_percentile('latency', 50))
+        self.assertEqual(self.registry.export_prometheus(), '')
+
+    def test_concurrent_writers_exact_counts(self):
+        """Test sharded locks keep counts exact across threads and metrics"""
+        names = [f'metric_{i}' for i in range(8)]
+        per_thread = 500
+
+        def worker(name):
+            for _ in range(per_thread):
+                self.registry.increment_counter(name, path='/a')
+                self.registry.increment_counter('shared', path='/a')
+                self.registry.observe_histogram(name, 0.1)
+
+        threads = [threading.Thread(target=worker, args=(name,)) for name in names * 2]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for name in names:
+            self.assertEqual(self.registry.get_counter(name, path='/a'), 2 * per_thread)
+            self.assertEqual(len(self.registry._histograms[name][()]), 2 * per_thread)
+        self.assertEqual(self.registry.get_counter('shared', path='/a'), len(threads) * per_thread)
+
+
+class RecordRequestTests(SimpleTestCase):
+    """Test record_request() against the global registry"""
+
+    def setUp(self):
+        metrics_module.metrics.reset()
+
+    def tearDown(self):
+        metrics_module.metrics.reset()
+
+    def test_records_count_latency_and_errors(self):
+        """Test requests, latency and 4xx/5xx errors are recorded with normalized paths"""
+        registry = metrics_module.metrics
+        record_request('GET', '/api/tickets/550e8400-e29b-41d4-a716-446655440000/', 200, 0.05)
+        record_request('GET', '/api/tickets/123e4567-e89b-12d3-a456-426614174000/', 404, 0.01)
+        record_request('POST', '/api/tickets/42', 500, 0.2)
+
+        self.assertEqual(registry.get_counter('http_requests_total', method='GET', path='/api/tickets/{id}/', status='200'), 1)
+        self.assertEqual(registry.get_counter('http_errors_total', method='GET', path='/api/tickets/{id}/', error_class='client'), 1)
+        self.assertEqual(registry.get_counter('http_errors_total', method='POST', path='/api/tickets/{id}', error_class='server'), 1)
+        self.assertEqual(registry.get_histogram_percentile('http_request_latency_seconds', 50, method='POST', path='/api/tickets/{id}', status='500'), 0.2)
+
+    def test_counters_stay_integers(self):
+        """Test every request adds exactly 1 to an integer counter"""
+        for _ in range(3):
+            record_request('GET', '/api/auth/me/', 200, 0.01)
+
+        value = metrics_module.metrics.get_counter('http_requests_total', method='GET', path='/api/auth/me/', status='200')
+        self.assertEqual(value, 3)
+        self.assertIsInstance(value, int)
@@ -10,7 +10,9 @@ Tests for:
 """
 import uuid
 import bcrypt
+from django.core.cache import cache
 from django.test import TestCase
+from django.utils import timezone
 from rest_framework.test import APIClient
 from rest_framework import status
 from accounts.models import User, Role, UserRole, Department, Company, BusinessGroup, Team
@@ -67,6 +69,10 @@ class TicketAPITestCase(TestCase):
             is_active=True
         )
     
+    def setUp(self):
+        # Users, roles, profiles and category maps are cached - start every test cold
+        cache.clear()
+    
     def create_user(self, email, roles=None, department=None):
         """Helper to create a user with roles"""
         password_hash = bcrypt.hashpw(
@@ -79,7 +85,7 @@ class TicketAPITestCase(TestCase):
             alias=email.split('@')[0],
             name=f'Test {email.split("@")[0]}',
             email=email,
-            password_hash=password_hash,
+            password=password_hash,
             is_active=True
         )
         
@@ -107,6 +113,7 @@ class TicketCreateAPITests(TicketAPITestCase):
     """Tests for POST /api/tickets/"""
     
     def setUp(self):
+        super().setUp()
         self.client = APIClient()
         self.user = self.create_user('ticketcreator@test.com', [Role.USER])
         self.token = self.login_user('ticketcreator@test.com')
@@ -166,6 +173,7 @@ class TicketListAPITests(TicketAPITestCase):
     """Tests for GET /api/tickets/"""
     
     def setUp(self):
+        super().setUp()
         self.client = APIClient()
         self.user = self.create_user('listuser@test.com', [Role.USER])
         self.other_user = self.create_user('otheruser@test.com', [Role.USER])
@@ -234,6 +242,7 @@ class TicketDetailAPITests(TicketAPITestCase):
     """Tests for GET /api/tickets/{id}/"""
     
     def setUp(self):
+        super().setUp()
         self.client = APIClient()
         self.user = self.create_user('detailuser@test.com', [Role.USER])
         self.other_user = self.create_user('otherdetail@test.com', [Role.USER])
@@ -311,6 +320,7 @@ class EmployeeQueueAPITests(TicketAPITestCase):
     """Tests for GET /api/employee/queue/"""
     
     def setUp(self):
+        super().setUp()
         self.client = APIClient()
         
         # Create employee with department access
@@ -376,6 +386,7 @@ class ImmutableTicketTests(TicketAPITestCase):
     """Tests for closed ticket immutability"""
     
     def setUp(self):
+        super().setUp()
         self.client = APIClient()
         self.employee = self.create_user(
             'immutable@test.com',
@@ -398,7 +409,8 @@ class ImmutableTicketTests(TicketAPITestCase):
             assigned_to=self.employee,
             status='Closed',
             is_closed=True,
-            closure_code=self.closure_code
+            closure_code=self.closure_code,
+            closed_at=timezone.now()
         )
     
     def test_closed_ticket_returns_is_closed_true(self):
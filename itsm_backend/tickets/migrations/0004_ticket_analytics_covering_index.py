@@ -0,0 +1,36 @@
+# Covering analytics index
+# Adds created_at as an included column on IX_Ticket_Analytics
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """
+    Cover the employee analytics totals aggregate with IX_Ticket_Analytics.
+    
+    The totals aggregate reads is_closed, closed_at (closed today / 7 / 30
+    day buckets) and created_at (average resolution) for one assignee.
+    Including created_at lets SQL Server answer it from the index alone.
+    
+    Before: Seek on IX_Ticket_Analytics + key lookup per row for created_at
+    After: Index-only range scan on IX_Ticket_Analytics
+    """
+
+    dependencies = [
+        ('tickets', '0003_ticketsequence'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='ticket',
+            name='IX_Ticket_Analytics',
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(
+                fields=['assigned_to', 'is_closed', 'closed_at'],
+                name='IX_Ticket_Analytics',
+                include=['created_at'],
+            ),
+        ),
+    ]
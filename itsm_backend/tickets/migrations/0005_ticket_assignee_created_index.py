@@ -0,0 +1,72 @@
+# Covering index for per-employee date-range analytics
+# Built ONLINE where the SQL Server edition supports it
+
+from django.db import migrations, models
+
+
+INDEX = models.Index(
+    fields=['assigned_to', 'created_at'],
+    name='IX_Ticket_AssigneeCreated',
+    include=['is_closed', 'closed_at', 'status', 'category'],
+)
+
+# EngineEdition 3 = Enterprise/Developer, 5 = Azure SQL Database,
+# 8 = Azure SQL Managed Instance
+CREATE_ONLINE_SQL = """
+    DECLARE @online NVARCHAR(20) = CASE
+        WHEN CAST(SERVERPROPERTY('EngineEdition') AS INT) IN (3, 5, 8)
+        THEN N' WITH (ONLINE = ON)' ELSE N'' END;
+    EXEC(N'CREATE INDEX IX_Ticket_AssigneeCreated
+        ON [Ticket] (assigned_to_id, created_at)
+        INCLUDE (is_closed, closed_at, status, category_id)' + @online);
+"""
+
+
+def create_index(apps, schema_editor):
+    """Create the index, ONLINE on SQL Server editions that support it."""
+    if schema_editor.connection.vendor == 'microsoft':
+        schema_editor.execute(CREATE_ONLINE_SQL)
+    else:
+        schema_editor.add_index(apps.get_model('tickets', 'Ticket'), INDEX)
+
+
+def drop_index(apps, schema_editor):
+    """Drop the index."""
+    schema_editor.remove_index(apps.get_model('tickets', 'Ticket'), INDEX)
+
+
+class Migration(migrations.Migration):
+    """
+    Cover EmployeeDetailedAnalyticsService with IX_Ticket_AssigneeCreated.
+    
+    Every query there filters assigned_to_id = X AND created_at in range,
+    then reads is_closed, closed_at (summary, avg resolution), status and
+    category_id (weekly / status / category breakdown). Keying on
+    (assigned_to_id, created_at) and including the rest makes them
+    index-only range scans.
+    
+    On SQL Server the index is created WITH (ONLINE = ON) on editions that
+    support it (Enterprise/Developer, Azure SQL) so Ticket writes are not
+    blocked during the build; other editions fall back to an offline build.
+    Django's AddIndex cannot emit ONLINE, so the state and database
+    operations are split; other backends get a regular CREATE INDEX.
+    
+    Before: Seek on IX_Ticket_AssignedTo + key lookup per row for
+            created_at / closed_at / category_id
+    After: Index-only range scan on IX_Ticket_AssigneeCreated
+    """
+
+    dependencies = [
+        ('tickets', '0004_ticket_analytics_covering_index'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name='ticket', index=INDEX),
+            ],
+            database_operations=[
+                migrations.RunPython(create_index, drop_index),
+            ],
+        ),
+    ]
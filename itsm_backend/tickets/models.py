@@ -202,8 +202,19 @@ class Ticket(TimestampedModel):
             models.Index(fields=['assigned_to', 'is_closed', 'status'], name='IX_Ticket_AssignedTo'),
             models.Index(fields=['department', 'status', 'is_closed'], name='IX_Ticket_Department'),
             models.Index(fields=['created_by', '-created_at'], name='IX_Ticket_CreatedBy'),
-            models.Index(fields=['assigned_to', 'is_closed', 'closed_at'], name='IX_Ticket_Analytics'),
+            models.Index(
+                fields=['assigned_to', 'is_closed', 'closed_at'],
+                name='IX_Ticket_Analytics',
+                include=['created_at'],
+            ),
             models.Index(fields=['status', 'created_at'], name='IX_Ticket_Status'),
+            # Covers the per-employee date-range analytics (employee detailed,
+            # detailed team breakdowns); created ONLINE in migration 0005
+            models.Index(
+                fields=['assigned_to', 'created_at'],
+                name='IX_Ticket_AssigneeCreated',
+                include=['is_closed', 'closed_at', 'status', 'category'],
+            ),
         ]
         constraints = [
             models.CheckConstraint(
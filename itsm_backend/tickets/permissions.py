@@ -30,11 +30,7 @@ class CanAccessEmployeeQueue(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return has_any_role(request.user, [
-            RoleConstants.EMPLOYEE,
-            RoleConstants.MANAGER,
-            RoleConstants.ADMIN
-        ])
+        return has_any_role(request.user, RoleConstants.EMPLOYEE_OR_ABOVE)
 
 
 class CanAccessManagerEndpoints(BasePermission):
@@ -47,10 +43,7 @@ class CanAccessManagerEndpoints(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return has_any_role(request.user, [
-            RoleConstants.MANAGER,
-            RoleConstants.ADMIN
-        ])
+        return has_any_role(request.user, RoleConstants.MANAGER_OR_ABOVE)
 
 
 class CanAssignTicket(BasePermission):
@@ -66,11 +59,7 @@ class CanAssignTicket(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return has_any_role(request.user, [
-            RoleConstants.EMPLOYEE,
-            RoleConstants.MANAGER,
-            RoleConstants.ADMIN
-        ])
+        return has_any_role(request.user, RoleConstants.EMPLOYEE_OR_ABOVE)
 
 
 class CanModifyTicketStatus(BasePermission):
@@ -86,11 +75,7 @@ class CanModifyTicketStatus(BasePermission):
     def has_permission(self, request, view):
         if not request.user or not request.user.is_authenticated:
             return False
-        return has_any_role(request.user, [
-            RoleConstants.EMPLOYEE,
-            RoleConstants.MANAGER,
-            RoleConstants.ADMIN
-        ])
+        return has_any_role(request.user, RoleConstants.EMPLOYEE_OR_ABOVE)
 
 
 class CanSetPriority(BasePermission):
@@ -107,8 +92,4 @@ class CanSetPriority(BasePermission):
         user_roles = get_user_roles(request.user)
         if user_roles == [RoleConstants.USER]:
             return False
-        return has_any_role(request.user, [
-            RoleConstants.EMPLOYEE,
-            RoleConstants.MANAGER,
-            RoleConstants.ADMIN
-        ])
+        return has_any_role(request.user, RoleConstants.EMPLOYEE_OR_ABOVE)
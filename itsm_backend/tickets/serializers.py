@@ -238,11 +238,7 @@ class TicketDetailSerializer(serializers.ModelSerializer):
         """Only show priority to EMPLOYEE/MANAGER/ADMIN roles"""
         request = self.context.get('request')
         if request and request.user:
-            if has_any_role(request.user, [
-                RoleConstants.EMPLOYEE,
-                RoleConstants.MANAGER,
-                RoleConstants.ADMIN
-            ]):
+            if has_any_role(request.user, RoleConstants.EMPLOYEE_OR_ABOVE):
                 return obj.priority
         return None
 
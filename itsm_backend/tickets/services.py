@@ -478,7 +478,7 @@ class TicketService:
         Phase 3 RBAC: Manager/Admin only.
         Note is mandatory for reassignment history.
         """
-        if not has_any_role(user, [RoleConstants.MANAGER, RoleConstants.ADMIN]):
+        if not has_any_role(user, RoleConstants.MANAGER_OR_ABOVE):
             raise ForbiddenError('Only managers can reassign tickets')
         
         # Validate note (DATA-04)